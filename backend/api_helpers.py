@@ -0,0 +1,199 @@
+# backend/api_helpers.py
+# Request parsing / validation aur response helpers jo app.py (Flask views) aur asgi.py (async views)
+# dono use karte hain, taaki dono modes mein validation, error messages aur headers bilkul ek jaise rahein.
+# Routes khud har file mein explicit hain; yahan sirf request -> args aur (data, error) -> response.
+
+import hashlib
+import os
+from datetime import date
+from urllib.parse import urlencode
+
+from flask import jsonify, request
+
+try:
+    from .db.queries import decode_search_cursor, ANIMAL_SEARCH_SORTS
+except ImportError:
+    # This fallback helps if running from inside the 'backend' folder
+    from db.queries import decode_search_cursor, ANIMAL_SEARCH_SORTS
+
+
+# --- Helper for checking query results ---
+def handle_query_result(data, error, success_code=200):
+    """Generates a standard API response from query results."""
+    if error:
+        # Check for user-defined errors (e.g., "Shelter is full")
+        if "45000" in str(error): # MySQL user-defined error
+            # Error message ko clean kar rahe hain
+            user_error = str(error).split(":")[-1].strip().replace("'", "")
+            return jsonify({"error": user_error}), 400
+
+        # ?fields= mein galat column naam
+        if str(error).startswith("Unknown field"):
+            return jsonify({"error": str(error)}), 400
+
+        # Check for "Not Found" errors from our query functions
+        if "No record found" in str(error):
+            return jsonify({"error": str(error)}), 404
+
+        # Baki sab errors 500 hain
+        return jsonify({"error": f"Internal Server Error: {error}"}), 500
+
+    # Agar data list hai aur khaali hai
+    if isinstance(data, list) and not data:
+        return jsonify([]), 200 # Empty list is valid JSON, not an error
+
+    # Agar data None hai (jo nahi hona chahiye agar error None hai, but just in case)
+    if data is None:
+        return jsonify({"error": "No data found"}), 404
+
+    # On success
+    return jsonify(data), success_code
+
+
+# --- Pagination helpers ---
+DEFAULT_PAGE_SIZE = int(os.environ.get('API_DEFAULT_PAGE_SIZE', 100))
+MAX_PAGE_SIZE = int(os.environ.get('API_MAX_PAGE_SIZE', 1000))
+
+def parse_page_args():
+    """
+    Reads ?limit= and ?after= from the query string.
+    Returns: ((limit, after), None) on success, (None, error_response) on bad input
+    """
+    try:
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+        after = request.args.get('after')
+        after = int(after) if after not in (None, '') else None
+    except ValueError:
+        return None, (jsonify({"error": "'limit' and 'after' must be integers"}), 400)
+
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        return None, (jsonify({"error": f"'limit' must be between 1 and {MAX_PAGE_SIZE}"}), 400)
+    return (limit, after), None
+
+def parse_fields_arg():
+    """
+    Reads ?fields=name,species,... (column projection). Returns a tuple, or None for all columns.
+    Names are checked against the table schema in the DB layer.
+    """
+    fields = request.args.get('fields', '')
+    names = [name.strip() for name in fields.split(',') if name.strip()]
+    return tuple(dict.fromkeys(names)) or None
+
+def page_response(page, limit):
+    """
+    JSON list response for one page, with the next-page headers.
+    Agla page ka cursor 'X-Next-Cursor' header (aur 'Link' header) mein jaata hai,
+    taaki purane clients jo list expect karte hain woh na tootein.
+    """
+    response = jsonify(page["data"])
+    if page["next_cursor"] is not None:
+        response.headers['X-Next-Cursor'] = str(page["next_cursor"])
+        # flat=False: repeated params (?species=Dog&species=Cat) next link mein bhi rahein
+        args = request.args.to_dict(flat=False)
+        args.update({'limit': [limit], 'after': [page["next_cursor"]]})
+        next_url = request.base_url + '?' + urlencode(args, doseq=True)
+        response.headers['Link'] = f'<{next_url}>; rel="next"'
+    return response, 200
+
+# --- Animal search args ---
+MAX_SEARCH_LIST_VALUES = int(os.environ.get('MAX_SEARCH_LIST_VALUES', 100))
+MAX_SEARCH_TEXT_LENGTH = 100
+
+def list_arg(name):
+    """?species=Dog&species=Cat ya ?species=Dog,Cat -> ['Dog', 'Cat'] (duplicates hata ke)."""
+    values = [value.strip() for raw in request.args.getlist(name) for value in raw.split(',') if value.strip()]
+    return list(dict.fromkeys(values))
+
+def parse_animal_search_args():
+    """
+    Reads the /api/animals/search filters, ?sort= and ?limit= / ?after= (an opaque cursor).
+    Returns: ((filters, sort, limit, after), None) on success, (None, error_response) on bad input
+    """
+    def bad_request(message):
+        return None, (jsonify({"error": message}), 400)
+
+    filters = {name: list_arg(name) for name in ("species", "breed", "status", "gender")}
+    try:
+        filters["shelter_id"] = [int(value) for value in list_arg('shelter_id')]
+        for name in ("min_age", "max_age"):
+            value = request.args.get(name, '')
+            filters[name] = int(value) if value else None
+    except ValueError:
+        return bad_request("'shelter_id', 'min_age' and 'max_age' must be integers")
+    try:
+        for name in ("dob_from", "dob_to"):
+            value = request.args.get(name, '')
+            filters[name] = date.fromisoformat(value) if value else None
+    except ValueError:
+        return bad_request("'dob_from' and 'dob_to' must be dates (YYYY-MM-DD)")
+
+    if any(len(values) > MAX_SEARCH_LIST_VALUES for values in filters.values() if isinstance(values, list)):
+        return bad_request(f"At most {MAX_SEARCH_LIST_VALUES} values per filter")
+    filters["q"] = request.args.get('q', '').strip() or None
+    if filters["q"] and len(filters["q"]) > MAX_SEARCH_TEXT_LENGTH:
+        return bad_request(f"'q' must be at most {MAX_SEARCH_TEXT_LENGTH} characters")
+
+    sort_arg = request.args.get('sort', 'animal_id')
+    sort = (sort_arg.lstrip('-'), sort_arg.startswith('-'))
+    if sort[0] not in ANIMAL_SEARCH_SORTS:
+        return bad_request(f"'sort' must be one of: {', '.join(ANIMAL_SEARCH_SORTS)} (prefix '-' for descending)")
+
+    try:
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        return bad_request("'limit' must be an integer")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        return bad_request(f"'limit' must be between 1 and {MAX_PAGE_SIZE}")
+
+    after = None
+    if request.args.get('after'):
+        after, error = decode_search_cursor(request.args['after'], sort)
+        if error:
+            return bad_request(error)
+    return (filters, sort, limit, after), None
+
+# --- Report args ---
+TOP_ADOPTERS_DEFAULT_LIMIT = int(os.environ.get('TOP_ADOPTERS_DEFAULT_LIMIT', 10))
+TOP_ADOPTERS_MIN_ADOPTIONS = int(os.environ.get('TOP_ADOPTERS_MIN_ADOPTIONS', 1))
+
+def parse_top_adopters_args():
+    """
+    Reads ?limit= and ?min_adoptions= for the top-adopters report.
+    Returns: ((limit, min_adoptions), None) on success, (None, error_response) on bad input
+    """
+    try:
+        limit = int(request.args.get('limit', TOP_ADOPTERS_DEFAULT_LIMIT))
+        min_adoptions = int(request.args.get('min_adoptions', TOP_ADOPTERS_MIN_ADOPTIONS))
+    except ValueError:
+        return None, (jsonify({"error": "'limit' and 'min_adoptions' must be integers"}), 400)
+    if limit < 1 or limit > MAX_PAGE_SIZE or min_adoptions < 1:
+        return None, (jsonify({"error": f"'limit' must be between 1 and {MAX_PAGE_SIZE}, 'min_adoptions' at least 1"}), 400)
+    return (limit, min_adoptions), None
+
+def parse_percentile_args():
+    """
+    Reads the repeated ?p= percentiles (default 25, 50, 75, 90).
+    Returns: (tuple, None) on success, (None, error_response) on bad input
+    """
+    try:
+        percentiles = tuple(float(p) for p in request.args.getlist('p')) or (25, 50, 75, 90)
+    except ValueError:
+        return None, (jsonify({"error": "'p' must be a number"}), 400)
+    if not all(0 <= p <= 100 for p in percentiles):
+        return None, (jsonify({"error": "'p' must be between 0 and 100"}), 400)
+    return percentiles, None
+
+# --- ETag helpers (conditional_get / async_conditional_get) ---
+def table_etag(tables, versions):
+    """Strong ETag for the current URL at the given table versions."""
+    state = request.full_path + '|' + ','.join(f"{t}:{versions[t]}" for t in tables)
+    return hashlib.sha1(state.encode('utf-8')).hexdigest()
+
+def etag_response(response, etag):
+    """Adds ETag + Cache-Control to a 200 / 304 response (errors are sent as they are)."""
+    if response.status_code not in (200, 304):
+        return response
+    response.set_etag(etag)
+    # Browser har baar revalidate kare (If-None-Match), bina poocha cache use na kare
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
@@ -1,51 +1,120 @@
 # backend/app.py
 
-from flask import Flask, jsonify, request, render_template, send_from_directory
+from flask import Flask, Response, g, jsonify, make_response, request, render_template, send_from_directory
 from flask_cors import CORS
+import csv
+import io
+import json
 import os
+import re
+import time
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from functools import wraps
 
 # --- Import your generic query functions ---
 try:
     from .db.queries import (
-        select_all_records, 
         select_record_by_id, 
-        select_records_by_criteria,
+        select_records_page,
+        search_animals,
+        stream_all_records,
+        get_table_versions,
         get_all_adopter_details,
         get_all_donor_details,
         get_report_shelter_occupancy,
         get_report_employees_above_average,
-        get_report_multi_adopters
+        get_report_multi_adopters,
+        get_report_top_adopters,
+        get_salary_stats,
+        get_salary_histogram,
+        get_report_salary_percentiles
     )
     from .db.update_delete import (
         update_record, 
         delete_record, 
         insert_record, 
+        insert_animals_bulk,
         execute_adoption_procedure,
+        execute_adoption_batch,
         execute_create_adopter,
         execute_create_donor,
     )
+    from .db.dashboard import DASHBOARD_TABLES, get_dashboard
+    from .db.connection import get_pool_stats
+    from .db.report_cache import db_table_versions, get_report_cache_stats
+    from .db.suggest_index import SUGGEST_KINDS, start_suggest_index, search_suggestions, get_suggest_index_stats
+    from .db.metrics import METRICS_ENABLED, observe_request, render_metrics
+    from .db.logs import request_id_var
+    from .json_provider import install_json_provider
+    from .compression import install_compression
+    from .static_assets import install_static_assets
+    from .api_helpers import (
+        handle_query_result,
+        parse_page_args,
+        parse_fields_arg,
+        page_response,
+        list_arg,
+        MAX_SEARCH_TEXT_LENGTH,
+        parse_animal_search_args,
+        parse_top_adopters_args,
+        parse_percentile_args,
+        table_etag,
+        etag_response,
+    )
 except ImportError:
     print("ERROR: Make sure app.py is in the 'backend' folder")
     print("And your query files are in 'backend/db/'")
     # Fallback for simple testing
     from db.queries import (
-        select_all_records, 
         select_record_by_id, 
-        select_records_by_criteria,
+        select_records_page,
+        search_animals,
+        stream_all_records,
+        get_table_versions,
         get_all_adopter_details,
         get_all_donor_details,
         get_report_shelter_occupancy,
         get_report_employees_above_average,
-        get_report_multi_adopters
+        get_report_multi_adopters,
+        get_report_top_adopters,
+        get_salary_stats,
+        get_salary_histogram,
+        get_report_salary_percentiles
     )
     from db.update_delete import (
         update_record, 
         delete_record, 
         insert_record, 
+        insert_animals_bulk,
         execute_adoption_procedure,
+        execute_adoption_batch,
         execute_create_adopter,
         execute_create_donor
     )
+    from db.dashboard import DASHBOARD_TABLES, get_dashboard
+    from db.connection import get_pool_stats
+    from db.report_cache import db_table_versions, get_report_cache_stats
+    from db.suggest_index import SUGGEST_KINDS, start_suggest_index, search_suggestions, get_suggest_index_stats
+    from db.metrics import METRICS_ENABLED, observe_request, render_metrics
+    from db.logs import request_id_var
+    from json_provider import install_json_provider
+    from compression import install_compression
+    from static_assets import install_static_assets
+    from api_helpers import (
+        handle_query_result,
+        parse_page_args,
+        parse_fields_arg,
+        page_response,
+        list_arg,
+        MAX_SEARCH_TEXT_LENGTH,
+        parse_animal_search_args,
+        parse_top_adopters_args,
+        parse_percentile_args,
+        table_etag,
+        etag_response,
+    )
 
 # --- Flask App Setup ---
 # *** Hum Flask ko bata rahe hain ki templates folder kahan hai ***
@@ -54,36 +123,128 @@ app = Flask(__name__,
             template_folder=os.path.join(os.path.dirname(__file__), '..', 'templates'),
             static_folder=os.path.join(os.path.dirname(__file__), '..', 'static'))
 
-CORS(app) # Allows frontend to call this API
+# jsonify() orjson se (agar installed hai), output byte-identical
+install_json_provider(app)
+
+# /static: content-hashed URLs (immutable cache) + startup par precompressed gzip / brotli
+install_static_assets(app)
+# API responses >= COMPRESS_MIN_SIZE bytes gzip / brotli mein (Accept-Encoding ke hisaab se)
+install_compression(app)
+
+CORS(app, expose_headers=['X-Next-Cursor', 'Link', 'ETag', 'X-Request-ID']) # Allows frontend to call this API
+
+
+# Type-ahead index background mein banta hai (/api/suggest)
+start_suggest_index()
+
+
+# --- Request IDs (har log line mein) ---
+REQUEST_ID_RE = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+
+@app.before_request
+def assign_request_id():
+    # Proxy / client ka X-Request-ID use karo (agar safe hai), warna naya banao
+    request_id = request.headers.get('X-Request-ID', '')
+    if not REQUEST_ID_RE.match(request_id):
+        request_id = uuid.uuid4().hex[:16]
+    g.request_id = request_id
+    request_id_var.set(request_id)
+
+@app.after_request
+def add_request_id_header(response):
+    if 'request_id' in g:
+        response.headers['X-Request-ID'] = g.request_id
+    return response
+
+# --- Request metrics (exposed on /metrics) ---
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
 
+@app.after_request
+def record_request_metrics(response):
+    start = g.get('request_start')
+    if METRICS_ENABLED and start is not None:
+        # Route template (e.g. /api/animals/<int:animal_id>), taaki har ID alag series na bane
+        route = request.url_rule.rule if request.url_rule else '<unmatched>'
+        observe_request(request.method, route, response.status_code, time.perf_counter() - start)
+    return response
 
-# --- Helper for checking query results ---
-def handle_query_result(data, error, success_code=200):
-    """Generates a standard API response from query results."""
+
+# --- Pagination (helpers api_helpers.py mein) ---
+def paged_response(table_name, criteria=None):
+    """
+    Returns one keyset page of a table as a JSON list.
+    Agla page ka cursor 'X-Next-Cursor' header (aur 'Link' header) mein jaata hai,
+    taaki purane clients jo list expect karte hain woh na tootein.
+    ?fields= sirf woh columns laata hai (primary key hamesha saath aati hai).
+    """
+    page_args, error_response = parse_page_args()
+    if error_response:
+        return error_response
+    limit, after = page_args
+
+    page, error = select_records_page(table_name, limit, after=after, criteria=criteria, fields=parse_fields_arg())
     if error:
-        # Check for user-defined errors (e.g., "Shelter is full")
-        if "45000" in str(error): # MySQL user-defined error
-            # Error message ko clean kar rahe hain
-            user_error = str(error).split(":")[-1].strip().replace("'", "")
-            return jsonify({"error": user_error}), 400
-        
-        # Check for "Not Found" errors from our query functions
-        if "No record found" in str(error):
-            return jsonify({"error": str(error)}), 404
+        return handle_query_result(None, error)
+    return page_response(page, limit)
 
-        # Baki sab errors 500 hain
-        return jsonify({"error": f"Internal Server Error: {error}"}), 500
-    
-    # Agar data list hai aur khaali hai
-    if isinstance(data, list) and not data:
-        return jsonify([]), 200 # Empty list is valid JSON, not an error
+# --- Suggest args ---
+SUGGEST_DEFAULT_LIMIT = 10
+SUGGEST_MAX_LIMIT = 50
 
-    # Agar data None hai (jo nahi hona chahiye agar error None hai, but just in case)
-    if data is None:
-        return jsonify({"error": "No data found"}), 404
+def parse_suggest_args():
+    """
+    Reads ?q=, ?type=animal,customer,employee, ?limit= and ?status= for /api/suggest.
+    Returns: ((q, kinds, limit, status), None) on success, (None, error_response) on bad input
+    """
+    q = request.args.get('q', '').strip()
+    if not q or len(q) > MAX_SEARCH_TEXT_LENGTH:
+        return None, (jsonify({"error": f"'q' is required (at most {MAX_SEARCH_TEXT_LENGTH} characters)"}), 400)
+
+    kinds = tuple(list_arg('type')) or tuple(SUGGEST_KINDS)
+    unknown = [kind for kind in kinds if kind not in SUGGEST_KINDS]
+    if unknown:
+        return None, (jsonify({"error": f"'type' must be among: {', '.join(SUGGEST_KINDS)}"}), 400)
 
-    # On success
-    return jsonify(data), success_code
+    try:
+        limit = int(request.args.get('limit', SUGGEST_DEFAULT_LIMIT))
+    except ValueError:
+        return None, (jsonify({"error": "'limit' must be an integer"}), 400)
+    if limit < 1 or limit > SUGGEST_MAX_LIMIT:
+        return None, (jsonify({"error": f"'limit' must be between 1 and {SUGGEST_MAX_LIMIT}"}), 400)
+    return (q, kinds, limit, request.args.get('status') or None), None
+
+# --- Conditional GET (ETag / If-None-Match) ---
+def conditional_get(tables):
+    """
+    Route decorator: strong ETag built from the TableVersion counters of `tables`.
+    If the client's If-None-Match matches, returns 304 without calling the view
+    (so the underlying SELECT never runs). Counters na mile toh normal response, bina ETag.
+    """
+    tables = tuple(tables)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            # Versions SELECT se PEHLE padho: beech mein koi write hua toh ETag purana hoga
+            # aur agli request par poora data jayega (galat 304 kabhi nahi)
+            versions, error = get_table_versions(tables)
+            if error:
+                return view(*args, **kwargs)
+
+            etag = table_etag(tables, versions)
+            # Weak comparison: compressed responses ka ETag W/"..." hota hai (compression.py)
+            if request.if_none_match.contains_weak(etag):
+                return etag_response(app.response_class(status=304), etag)
+            # Report cache in counters se purani entry pehchanta hai (doosre worker / script ke writes)
+            token = db_table_versions.set(versions)
+            try:
+                return etag_response(make_response(view(*args, **kwargs)), etag)
+            finally:
+                db_table_versions.reset(token)
+        return wrapper
+    return decorator
 
 # ===============================================
 #  *** ROUTE TO SERVE FRONTEND ***
@@ -133,13 +294,14 @@ def serve_reports_page():
 
 # --- Shelter Routes ---
 @app.route('/api/shelters', methods=['GET'])
+@conditional_get(tables=["Shelter"])
 def get_shelters():
-    data, error = select_all_records(table_name="Shelter")
-    return handle_query_result(data, error)
+    return paged_response(table_name="Shelter")
 
 @app.route('/api/shelters/<int:shelter_id>', methods=['GET'])
 def get_shelter_by_id(shelter_id):
-    data, error = select_record_by_id(table_name="Shelter", id_column="shelter_id", id_value=shelter_id)
+    data, error = select_record_by_id(table_name="Shelter", id_column="shelter_id", id_value=shelter_id,
+                                      fields=parse_fields_arg())
     return handle_query_result(data, error)
 
 @app.route('/api/shelters', methods=['POST'])
@@ -165,15 +327,29 @@ def delete_shelter_route(shelter_id):
 
 # --- Animal Routes ---
 @app.route('/api/animals', methods=['GET'])
+@conditional_get(tables=["Animal"])
 def get_animals():
-    # Example: /api/animals?status=Available
+    # Example: /api/animals?status=Available&limit=50&after=120
     status = request.args.get('status')
-    if status:
-        criteria = {"status": status}
-        data, error = select_records_by_criteria(table_name="Animal", criteria=criteria)
-    else:
-        data, error = select_all_records(table_name="Animal")
-    return handle_query_result(data, error)
+    criteria = {"status": status} if status else None
+    return paged_response(table_name="Animal", criteria=criteria)
+
+@app.route('/api/animals/search', methods=['GET'])
+@conditional_get(tables=["Animal"])
+def search_animals_route():
+    """
+    Filtered, sorted, paginated animal search.
+    Example: /api/animals/search?species=Dog,Cat&min_age=1&max_age=5&shelter_id=2&q=gold&sort=-dob&limit=20
+    """
+    search_args, error_response = parse_animal_search_args()
+    if error_response:
+        return error_response
+    filters, sort, limit, after = search_args
+
+    page, error = search_animals(filters, sort, limit, after=after, fields=parse_fields_arg())
+    if error:
+        return handle_query_result(None, error)
+    return page_response(page, limit)
 
 @app.route('/api/animals', methods=['POST'])
 def add_new_animal():
@@ -183,9 +359,44 @@ def add_new_animal():
     # 201 = Created (aur hum naya 'data' (new_id) bhej rahe hain)
     return handle_query_result({"new_animal_id": data}, error, success_code=201)
 
+MAX_BULK_ANIMALS = int(os.environ.get('MAX_BULK_ANIMALS', 10000))
+
+@app.route('/api/animals/bulk', methods=['POST'])
+def add_animals_bulk():
+    """
+    Bulk animal intake (e.g. partner shelter transfers).
+    Accepts a JSON array / {"animals": [...], "strict": bool}, or a CSV body
+    (Content-Type: text/csv) with a header row. ?strict=1 aborts on any failure.
+    """
+    strict = request.args.get('strict', '0').lower() in ('1', 'true', 'yes')
+
+    if request.mimetype == 'text/csv':
+        rows = list(csv.DictReader(io.StringIO(request.get_data(as_text=True))))
+    else:
+        payload = request.get_json(silent=True)
+        if isinstance(payload, dict):
+            strict = bool(payload.get('strict', strict))
+            payload = payload.get('animals')
+        rows = payload
+
+    if not isinstance(rows, list) or not rows:
+        return jsonify({"error": "Send a non-empty JSON array of animals or a CSV file"}), 400
+    if len(rows) > MAX_BULK_ANIMALS:
+        return jsonify({"error": f"Too many rows (max {MAX_BULK_ANIMALS})"}), 400
+
+    data, error = insert_animals_bulk(rows, strict=strict)
+    if error:
+        return handle_query_result(None, error)
+
+    if not data["committed"]:
+        return jsonify(data), 400
+    return jsonify(data), 201 if data["failed"] == 0 else 207
+
 @app.route('/api/animals/<int:animal_id>', methods=['GET'])
 def get_animal_by_id(animal_id):
-    data, error = select_record_by_id(table_name="Animal", id_column="animal_id", id_value=animal_id)
+    # Example: /api/animals/7?fields=name,status
+    data, error = select_record_by_id(table_name="Animal", id_column="animal_id", id_value=animal_id,
+                                      fields=parse_fields_arg())
     return handle_query_result(data, error)
 
 @app.route('/api/animals/<int:animal_id>', methods=['PUT'])
@@ -201,8 +412,14 @@ def delete_animal_route(animal_id):
 
 # --- Employee Routes ---
 @app.route('/api/employees', methods=['GET'])
+@conditional_get(tables=["Employee"])
 def get_employees():
-    data, error = select_all_records(table_name="Employee")
+    return paged_response(table_name="Employee")
+
+@app.route('/api/employees/<int:employee_id>', methods=['GET'])
+def get_employee_by_id(employee_id):
+    data, error = select_record_by_id(table_name="Employee", id_column="employee_id", id_value=employee_id,
+                                      fields=parse_fields_arg())
     return handle_query_result(data, error)
 
 @app.route('/api/employees', methods=['POST'])
@@ -223,8 +440,14 @@ def update_employee_salary(employee_id):
 
 # --- Adopter/Donor (Customer) Routes ---
 @app.route('/api/customers', methods=['GET'])
+@conditional_get(tables=["Customer"])
 def get_customers():
-    data, error = select_all_records(table_name="Customer")
+    return paged_response(table_name="Customer")
+
+@app.route('/api/customers/<int:customer_id>', methods=['GET'])
+def get_customer_by_id(customer_id):
+    data, error = select_record_by_id(table_name="Customer", id_column="customer_id", id_value=customer_id,
+                                      fields=parse_fields_arg())
     return handle_query_result(data, error)
 
 @app.route('/api/adopters/details', methods=['GET'])
@@ -258,8 +481,7 @@ def create_new_adopter():
 
 @app.route('/api/adopters', methods=['GET'])
 def get_adopters():
-    data, error = select_all_records(table_name="Adopter")
-    return handle_query_result(data, error)
+    return paged_response(table_name="Adopter")
 
 # --- Donor Routes  ---
 @app.route('/api/donors/details', methods=['GET'])
@@ -293,19 +515,16 @@ def create_new_donor():
 
 @app.route('/api/donors', methods=['GET'])
 def get_donors():
-    data, error = select_all_records(table_name="Donor")
-    return handle_query_result(data, error)
+    return paged_response(table_name="Donor")
 
 # --- Adoption & Donation Routes ---
 @app.route('/api/adoptions', methods=['GET'])
 def get_adoptions():
-    data, error = select_all_records(table_name="Adoption")
-    return handle_query_result(data, error)
+    return paged_response(table_name="Adoption")
 
 @app.route('/api/donations', methods=['GET'])
 def get_donations():
-    data, error = select_all_records(table_name="Donation")
-    return handle_query_result(data, error)
+    return paged_response(table_name="Donation")
 
 # --- THE MOST IMPORTANT ROUTE ---
 # This route runs the procedure that fires all your triggers!
@@ -330,6 +549,39 @@ def create_adoption():
         
     return jsonify({"message": "Adoption successful!", "adoption_details": data}), 201
 
+MAX_ADOPTION_BATCH = int(os.environ.get('MAX_ADOPTION_BATCH', 1000))
+
+@app.route('/api/adopt/batch', methods=['POST'])
+def create_adoption_batch():
+    """
+    Processes many adoptions in one connection + one transaction.
+    Expects JSON: {"adoptions": [{"animal_id": .., "adopter_id": .., "employee_id": ..}, ...],
+                   "mode": "all_or_nothing" | "best_effort"}
+    """
+    batch_data = request.json or {}
+    adoptions = batch_data.get('adoptions')
+    mode = batch_data.get('mode', 'all_or_nothing')
+
+    if not isinstance(adoptions, list) or not adoptions:
+        return jsonify({"error": "Request body must include a non-empty 'adoptions' list"}), 400
+    if len(adoptions) > MAX_ADOPTION_BATCH:
+        return jsonify({"error": f"Batch too large (max {MAX_ADOPTION_BATCH} adoptions)"}), 400
+    if mode not in ('all_or_nothing', 'best_effort'):
+        return jsonify({"error": "'mode' must be 'all_or_nothing' or 'best_effort'"}), 400
+
+    for index, item in enumerate(adoptions):
+        if not isinstance(item, dict) or not all(k in item for k in ('animal_id', 'adopter_id', 'employee_id')):
+            return jsonify({"error": f"Item {index} must include 'animal_id', 'adopter_id', and 'employee_id'"}), 400
+
+    data, error = execute_adoption_batch(adoptions, all_or_nothing=(mode == 'all_or_nothing'))
+    if error:
+        return handle_query_result(None, error)
+
+    if not data["committed"]:
+        return jsonify(data), 400
+    # 207 = kuch items fail hue (best_effort mode)
+    return jsonify(data), 201 if data["failed"] == 0 else 207
+
 
 
 # THIS CODE HAS BEEN MOVED UP DEKHLENA SAB
@@ -362,23 +614,183 @@ def create_adoption():
 
 
 @app.route('/api/reports/shelter-occupancy', methods=['GET'])
+@conditional_get(tables=get_report_shelter_occupancy.depends_on)
 def get_shelter_occupancy_report():
     """API route for Report 1"""
     data, error = get_report_shelter_occupancy()
     return handle_query_result(data, error)
 
 @app.route('/api/reports/employees-above-average', methods=['GET'])
+@conditional_get(tables=get_report_employees_above_average.depends_on)
 def get_employees_above_average_report():
     """API route for Report 2"""
     data, error = get_report_employees_above_average()
     return handle_query_result(data, error)
 
 @app.route('/api/reports/multi-adopters', methods=['GET'])
+@conditional_get(tables=get_report_multi_adopters.depends_on)
 def get_multi_adopters_report():
     """API route for Report 3"""
     data, error = get_report_multi_adopters()
     return handle_query_result(data, error)
 
+@app.route('/api/reports/top-adopters', methods=['GET'])
+@conditional_get(tables=get_report_top_adopters.depends_on)
+def get_top_adopters_report():
+    """
+    API route for Report 3b.
+    Example: /api/reports/top-adopters?limit=5&min_adoptions=3
+    """
+    report_args, error_response = parse_top_adopters_args()
+    if error_response:
+        return error_response
+
+    data, error = get_report_top_adopters(*report_args)
+    return handle_query_result(data, error)
+
+@app.route('/api/reports/salary-stats', methods=['GET'])
+@conditional_get(tables=get_salary_stats.depends_on)
+def get_salary_stats_report():
+    """Running salary count / sum / average: overall, per role and per shelter."""
+    data, error = get_salary_stats()
+    return handle_query_result(data, error)
+
+@app.route('/api/reports/salary-histogram', methods=['GET'])
+@conditional_get(tables=get_salary_histogram.depends_on)
+def get_salary_histogram_report():
+    """Employee count per salary bucket."""
+    data, error = get_salary_histogram()
+    return handle_query_result(data, error)
+
+@app.route('/api/reports/salary-percentiles', methods=['GET'])
+@conditional_get(tables=get_salary_histogram.depends_on)
+def get_salary_percentiles_report():
+    """
+    Approximate salary percentiles from the histogram.
+    Example: /api/reports/salary-percentiles?p=50&p=90 (default 25, 50, 75, 90)
+    """
+    percentiles, error_response = parse_percentile_args()
+    if error_response:
+        return error_response
+
+    data, error = get_report_salary_percentiles(percentiles)
+    return handle_query_result(data, error)
+
+# --- Dashboard (front page ka sab kuch, ek request mein) ---
+@app.route('/api/dashboard', methods=['GET'])
+@conditional_get(tables=DASHBOARD_TABLES)
+def get_dashboard_route():
+    """
+    Available animals (paged like /api/animals), headline counts and the three reports.
+    The parts run concurrently on separate pooled connections.
+    Example: /api/dashboard?limit=20&fields=name,species
+    """
+    page_args, error_response = parse_page_args()
+    if error_response:
+        return error_response
+    limit, after = page_args
+
+    data, error = get_dashboard(limit, after=after, fields=parse_fields_arg())
+    return handle_query_result(data, error)
+
+@app.route('/api/reports/cache-stats', methods=['GET'])
+def get_reports_cache_stats():
+    """Hit/miss counters of the report cache."""
+    return jsonify(get_report_cache_stats()), 200
+
+# --- Type-ahead suggestions (in-process prefix index, no DB query) ---
+@app.route('/api/suggest', methods=['GET'])
+def get_suggestions():
+    """
+    Prefix lookup over animal names, customer names / phones and employee names.
+    Example: /api/suggest?q=cha&type=animal&status=Available&limit=5
+    """
+    suggest_args, error_response = parse_suggest_args()
+    if error_response:
+        return error_response
+    q, kinds, limit, status = suggest_args
+
+    data, error = search_suggestions(q, kinds, limit, status=status)
+    if error:
+        # Startup par index abhi ban raha hai
+        response = jsonify({"error": error})
+        response.headers['Retry-After'] = '1'
+        return response, 503
+    return jsonify(data), 200
+
+@app.route('/api/suggest/stats', methods=['GET'])
+def get_suggest_stats():
+    """Size and build time of the suggest index."""
+    return jsonify(get_suggest_index_stats()), 200
+
+# --- Bulk Export (streaming) ---
+EXPORT_TABLES = {"Animal", "Adoption", "Donation", "Shelter", "Employee", "Customer", "Adopter", "Donor"}
+EXPORT_CHUNK_SIZE = int(os.environ.get('EXPORT_CHUNK_SIZE', 1000))
+
+def _export_default(value):
+    """JSON fallback for MySQL types (Decimal -> string, date -> ISO format)."""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _ndjson_lines(columns, chunks):
+    for rows in chunks:
+        yield ''.join(json.dumps(dict(zip(columns, row)), default=_export_default) + '\n' for row in rows)
+
+def _csv_lines(columns, chunks):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for rows in chunks:
+        writer.writerows(rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue()
+
+@app.route('/api/export/<table_name>', methods=['GET'])
+def export_table(table_name):
+    """
+    Streams a whole table as NDJSON (default) or CSV.
+    Example: /api/export/Animal?format=csv
+    """
+    if table_name not in EXPORT_TABLES:
+        return jsonify({"error": f"Export not allowed for table '{table_name}'"}), 404
+
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in ('ndjson', 'csv'):
+        return jsonify({"error": "'format' must be 'ndjson' or 'csv'"}), 400
+
+    stream, error = stream_all_records(table_name, chunk_size=EXPORT_CHUNK_SIZE)
+    if error:
+        return handle_query_result(None, error)
+
+    if export_format == 'csv':
+        body, mimetype = _csv_lines(stream["columns"], stream["chunks"]), 'text/csv'
+    else:
+        body, mimetype = _ndjson_lines(stream["columns"], stream["chunks"]), 'application/x-ndjson'
+
+    response = Response(body, mimetype=mimetype)
+    # HEAD / jaldi disconnect par generator kabhi chalta hi nahi: connection yahan lautao
+    response.call_on_close(stream["close"])
+    response.headers['Content-Disposition'] = f'attachment; filename="{table_name}.{export_format}"'
+    return response
+
+
+# --- Diagnostics ---
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Request latency, DB time, rows, pool acquire time and DB errors in Prometheus text format."""
+    return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/api/db/pool-stats', methods=['GET'])
+def get_db_pool_stats():
+    """Live connection pool stats (in-use, idle, wait time)."""
+    return jsonify(get_pool_stats()), 200
+
 
 # --- Main entry point ---
 if __name__ == '__main__':
@@ -0,0 +1,377 @@
+# backend/asgi.py
+# ASGI entry point: ek process mein sainkdon DB calls ek saath "in flight" rakh sakta hai.
+#
+#   pip install aiomysql asgiref uvicorn
+#   uvicorn backend.asgi:app --workers 4        (repo root se)
+#
+# Hot read routes (GET: lists, by-id, search, reports, dashboard) yahan patle async views hain
+# (db/async_queries.py) jo aiomysql pool par chalte hain, isliye MySQL ka wait kisi thread ko nahi rokta.
+# Argument parsing aur responses api_helpers.py se aate hain (app.py bhi wahi use karta hai), isliye
+# yahan har view sirf args -> await data call -> response hai.
+# Baaki sab (writes, HTML pages, bulk intake, adoption batch, export, stats) app.py ke Flask app par
+# jaata hai (asgiref WsgiToAsgi, thread mein). Async views bhi Flask ka request context,
+# jsonify aur after_request (CORS) use karte hain, isliye responses bilkul ek jaise hain.
+
+import io
+import sys
+from functools import wraps
+
+from asgiref.wsgi import WsgiToAsgi
+from flask import request
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import Map, Rule
+
+try:
+    from .app import app as flask_app, get_suggestions as flask_get_suggestions
+    from .api_helpers import (
+        handle_query_result,
+        parse_page_args,
+        parse_fields_arg,
+        parse_animal_search_args,
+        page_response,
+        table_etag,
+        etag_response,
+        parse_top_adopters_args,
+        parse_percentile_args,
+    )
+    from .db import async_queries as aq
+    from .db.async_connection import close_async_pools
+    from .db.dashboard import DASHBOARD_TABLES
+    from .db.report_cache import db_table_versions
+except ImportError:
+    # This fallback helps if running from inside the 'backend' folder
+    from app import app as flask_app, get_suggestions as flask_get_suggestions
+    from api_helpers import (
+        handle_query_result,
+        parse_page_args,
+        parse_fields_arg,
+        parse_animal_search_args,
+        page_response,
+        table_etag,
+        etag_response,
+        parse_top_adopters_args,
+        parse_percentile_args,
+    )
+    from db import async_queries as aq
+    from db.async_connection import close_async_pools
+    from db.dashboard import DASHBOARD_TABLES
+    from db.report_cache import db_table_versions
+
+
+_url_map = Map()
+_views = {}
+
+def async_route(rule, methods):
+    """Registers an async view (same URL rules as Flask's @app.route)."""
+    def decorator(view):
+        _url_map.add(Rule(rule, endpoint=view.__name__, methods=methods))
+        _views[view.__name__] = view
+        return view
+    return decorator
+
+def async_conditional_get(tables):
+    """app.conditional_get() for async views: 304 without running the view's SELECT."""
+    tables = tuple(tables)
+
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(**kwargs):
+            versions, error = await aq.get_table_versions(tables)
+            if error:
+                return await view(**kwargs)
+
+            etag = table_etag(tables, versions)
+            if request.if_none_match.contains_weak(etag):
+                return etag_response(flask_app.response_class(status=304), etag)
+            token = db_table_versions.set(versions)
+            try:
+                return etag_response(flask_app.make_response(await view(**kwargs)), etag)
+            finally:
+                db_table_versions.reset(token)
+        return wrapper
+    return decorator
+
+async def async_paged_response(table_name, criteria=None):
+    """app.paged_response() on the async pool."""
+    page_args, error_response = parse_page_args()
+    if error_response:
+        return error_response
+    limit, after = page_args
+
+    page, error = await aq.select_records_page(table_name, limit, after=after, criteria=criteria, fields=parse_fields_arg())
+    if error:
+        return handle_query_result(None, error)
+    return page_response(page, limit)
+
+
+# ===============================================
+#  *** ASYNC READ ROUTES (same behaviour as app.py) ***
+# ===============================================
+
+# --- Shelter Routes ---
+@async_route('/api/shelters', methods=['GET'])
+@async_conditional_get(tables=["Shelter"])
+async def get_shelters():
+    return await async_paged_response(table_name="Shelter")
+
+@async_route('/api/shelters/<int:shelter_id>', methods=['GET'])
+async def get_shelter_by_id(shelter_id):
+    data, error = await aq.select_record_by_id(table_name="Shelter", id_column="shelter_id", id_value=shelter_id,
+                                               fields=parse_fields_arg())
+    return handle_query_result(data, error)
+
+# --- Animal Routes ---
+@async_route('/api/animals', methods=['GET'])
+@async_conditional_get(tables=["Animal"])
+async def get_animals():
+    status = request.args.get('status')
+    criteria = {"status": status} if status else None
+    return await async_paged_response(table_name="Animal", criteria=criteria)
+
+@async_route('/api/animals/search', methods=['GET'])
+@async_conditional_get(tables=["Animal"])
+async def search_animals_route():
+    search_args, error_response = parse_animal_search_args()
+    if error_response:
+        return error_response
+    filters, sort, limit, after = search_args
+
+    page, error = await aq.search_animals(filters, sort, limit, after=after, fields=parse_fields_arg())
+    if error:
+        return handle_query_result(None, error)
+    return page_response(page, limit)
+
+@async_route('/api/animals/<int:animal_id>', methods=['GET'])
+async def get_animal_by_id(animal_id):
+    data, error = await aq.select_record_by_id(table_name="Animal", id_column="animal_id", id_value=animal_id,
+                                               fields=parse_fields_arg())
+    return handle_query_result(data, error)
+
+# --- Employee Routes ---
+@async_route('/api/employees', methods=['GET'])
+@async_conditional_get(tables=["Employee"])
+async def get_employees():
+    return await async_paged_response(table_name="Employee")
+
+@async_route('/api/employees/<int:employee_id>', methods=['GET'])
+async def get_employee_by_id(employee_id):
+    data, error = await aq.select_record_by_id(table_name="Employee", id_column="employee_id", id_value=employee_id,
+                                               fields=parse_fields_arg())
+    return handle_query_result(data, error)
+
+# --- Customer / Adopter / Donor Routes ---
+@async_route('/api/customers', methods=['GET'])
+@async_conditional_get(tables=["Customer"])
+async def get_customers():
+    return await async_paged_response(table_name="Customer")
+
+@async_route('/api/customers/<int:customer_id>', methods=['GET'])
+async def get_customer_by_id(customer_id):
+    data, error = await aq.select_record_by_id(table_name="Customer", id_column="customer_id", id_value=customer_id,
+                                               fields=parse_fields_arg())
+    return handle_query_result(data, error)
+
+@async_route('/api/adopters/details', methods=['GET'])
+async def get_adopter_details():
+    data, error = await aq.get_all_adopter_details()
+    return handle_query_result(data, error)
+
+@async_route('/api/adopters', methods=['GET'])
+async def get_adopters():
+    return await async_paged_response(table_name="Adopter")
+
+@async_route('/api/donors/details', methods=['GET'])
+async def get_donor_details():
+    data, error = await aq.get_all_donor_details()
+    return handle_query_result(data, error)
+
+@async_route('/api/donors', methods=['GET'])
+async def get_donors():
+    return await async_paged_response(table_name="Donor")
+
+# --- Adoption & Donation Routes ---
+@async_route('/api/adoptions', methods=['GET'])
+async def get_adoptions():
+    return await async_paged_response(table_name="Adoption")
+
+@async_route('/api/donations', methods=['GET'])
+async def get_donations():
+    return await async_paged_response(table_name="Donation")
+
+# --- Report Routes ---
+@async_route('/api/reports/shelter-occupancy', methods=['GET'])
+@async_conditional_get(tables=aq.get_report_shelter_occupancy.depends_on)
+async def get_shelter_occupancy_report():
+    data, error = await aq.get_report_shelter_occupancy()
+    return handle_query_result(data, error)
+
+@async_route('/api/reports/employees-above-average', methods=['GET'])
+@async_conditional_get(tables=aq.get_report_employees_above_average.depends_on)
+async def get_employees_above_average_report():
+    data, error = await aq.get_report_employees_above_average()
+    return handle_query_result(data, error)
+
+@async_route('/api/reports/multi-adopters', methods=['GET'])
+@async_conditional_get(tables=aq.get_report_multi_adopters.depends_on)
+async def get_multi_adopters_report():
+    data, error = await aq.get_report_multi_adopters()
+    return handle_query_result(data, error)
+
+@async_route('/api/reports/top-adopters', methods=['GET'])
+@async_conditional_get(tables=aq.get_report_top_adopters.depends_on)
+async def get_top_adopters_report():
+    report_args, error_response = parse_top_adopters_args()
+    if error_response:
+        return error_response
+
+    data, error = await aq.get_report_top_adopters(*report_args)
+    return handle_query_result(data, error)
+
+@async_route('/api/reports/salary-stats', methods=['GET'])
+@async_conditional_get(tables=aq.get_salary_stats.depends_on)
+async def get_salary_stats_report():
+    data, error = await aq.get_salary_stats()
+    return handle_query_result(data, error)
+
+@async_route('/api/reports/salary-histogram', methods=['GET'])
+@async_conditional_get(tables=aq.get_salary_histogram.depends_on)
+async def get_salary_histogram_report():
+    data, error = await aq.get_salary_histogram()
+    return handle_query_result(data, error)
+
+@async_route('/api/reports/salary-percentiles', methods=['GET'])
+@async_conditional_get(tables=aq.get_salary_histogram.depends_on)
+async def get_salary_percentiles_report():
+    percentiles, error_response = parse_percentile_args()
+    if error_response:
+        return error_response
+
+    data, error = await aq.get_report_salary_percentiles(percentiles)
+    return handle_query_result(data, error)
+
+
+# --- Dashboard ---
+@async_route('/api/dashboard', methods=['GET'])
+@async_conditional_get(tables=DASHBOARD_TABLES)
+async def get_dashboard_route():
+    # Thread pool ki zaroorat nahi: saare parts asyncio.gather se ek saath await hote hain
+    page_args, error_response = parse_page_args()
+    if error_response:
+        return error_response
+    limit, after = page_args
+
+    data, error = await aq.get_dashboard(limit, after=after, fields=parse_fields_arg())
+    return handle_query_result(data, error)
+
+# --- Type-ahead ---
+@async_route('/api/suggest', methods=['GET'])
+async def get_suggestions():
+    # In-process index, koi DB call nahi: thread pool ke bina seedha chalao
+    return flask_get_suggestions()
+
+
+# ===============================================
+#  *** ASGI PLUMBING ***
+# ===============================================
+_url_adapter = _url_map.bind('localhost')
+_flask_fallback = WsgiToAsgi(flask_app)
+
+def _wsgi_environ(scope, body):
+    """Builds the WSGI environ Flask's request context needs from an ASGI scope."""
+    root_path = scope.get('root_path', '')
+    path = scope['path']
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path):]
+    server = scope.get('server') or ('localhost', 80)
+
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': root_path.encode('utf-8').decode('latin-1'),
+        'PATH_INFO': path.encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1] or 80),
+        'SERVER_PROTOCOL': 'HTTP/' + scope.get('http_version', '1.1'),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    if scope.get('client'):
+        environ['REMOTE_ADDR'] = scope['client'][0]
+
+    for name, value in scope.get('headers', []):
+        name = name.decode('latin-1')
+        if name == 'content-length':
+            key = 'CONTENT_LENGTH'
+        elif name == 'content-type':
+            key = 'CONTENT_TYPE'
+        else:
+            key = 'HTTP_' + name.upper().replace('-', '_')
+        value = value.decode('latin-1')
+        environ[key] = environ[key] + ',' + value if key in environ else value
+    return environ
+
+async def _read_body(receive):
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body'):
+            return b''.join(chunks)
+
+async def _serve_async_view(view, view_args, scope, receive, send):
+    """Runs an async view inside a Flask request context, the way Flask's full_dispatch_request does."""
+    body = await _read_body(receive)
+    ctx = flask_app.request_context(_wsgi_environ(scope, body))
+    ctx.push()
+    try:
+        try:
+            try:
+                rv = flask_app.preprocess_request()
+                if rv is None:
+                    rv = await view(**view_args)
+            except Exception as e:
+                rv = flask_app.handle_user_exception(e)
+            response = flask_app.finalize_request(rv)
+        except Exception as e:
+            response = flask_app.handle_exception(e)
+        headers = [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                   for name, value in response.headers.to_wsgi_list()]
+        payload = b'' if scope['method'] == 'HEAD' else response.get_data()
+    finally:
+        ctx.pop()
+
+    await send({'type': 'http.response.start', 'status': response.status_code, 'headers': headers})
+    await send({'type': 'http.response.body', 'body': payload})
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await close_async_pools()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+async def app(scope, receive, send):
+    """The ASGI application."""
+    if scope['type'] == 'lifespan':
+        await _lifespan(receive, send)
+        return
+
+    if scope['type'] == 'http':
+        try:
+            endpoint, view_args = _url_adapter.match(scope['path'], scope['method'])
+        except HTTPException:
+            # 404 / 405 / redirect / OPTIONS preflight: Flask hi jawab de
+            endpoint = None
+        if endpoint is not None:
+            await _serve_async_view(_views[endpoint], view_args, scope, receive, send)
+            return
+
+    await _flask_fallback(scope, receive, send)
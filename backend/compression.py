@@ -0,0 +1,111 @@
+# backend/compression.py
+# Responses ko gzip / brotli mein bhejna (Accept-Encoding ke hisaab se).
+# Slow links waali shelter sites par badi JSON lists ka size ~10x kam ho jaata hai.
+#
+# - COMPRESS_ENABLED=1            0 = API responses bina compression ke
+# - COMPRESS_MIN_SIZE=1024        isse chhote bodies compress nahi hote (bytes)
+# - COMPRESS_LEVEL=6              gzip level (1-9) API responses ke liye
+# - COMPRESS_BROTLI_QUALITY=4     brotli quality (0-11) API responses ke liye
+#
+# Static files startup par ek hi baar max level par compress hote hain (static_assets.py).
+# Brotli optional hai (pip install brotli); na ho toh sirf gzip.
+
+import gzip
+import os
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESS_ENABLED = os.environ.get('COMPRESS_ENABLED', '1') == '1'
+COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))
+COMPRESS_LEVEL = int(os.environ.get('COMPRESS_LEVEL', 6))
+COMPRESS_BROTLI_QUALITY = int(os.environ.get('COMPRESS_BROTLI_QUALITY', 4))
+
+# Inke alawa (images, fonts, zip) pehle se compressed hote hain
+COMPRESSIBLE_MIMETYPES = {
+    'application/json', 'application/x-ndjson', 'application/javascript',
+    'text/javascript', 'text/css', 'text/csv', 'text/html', 'text/plain',
+    'image/svg+xml',
+}
+
+# Brotli pehle (chhota output), barabar quality par bhi
+ENCODINGS = ('br', 'gzip') if brotli else ('gzip',)
+
+
+def is_compressible(mimetype):
+    return mimetype in COMPRESSIBLE_MIMETYPES
+
+
+def compress(data, encoding, level=None):
+    """`data` compressed with `encoding` ('gzip' or 'br'); level=None uses the configured API level."""
+    if encoding == 'br':
+        return brotli.compress(data, quality=COMPRESS_BROTLI_QUALITY if level is None else level)
+    # mtime=0: same input -> same bytes (static ETags stable rehte hain)
+    return gzip.compress(data, compresslevel=COMPRESS_LEVEL if level is None else level, mtime=0)
+
+
+def negotiate_encoding(available=ENCODINGS):
+    """
+    Best of `available` for the request's Accept-Encoding (highest q wins, order breaks ties).
+    Returns None when the client accepts none of them (identity).
+    """
+    best, best_quality = None, 0
+    for encoding in available:
+        quality = request.accept_encodings.quality(encoding)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def weaken_etag(response):
+    """
+    Compressed body ka ETag weak kar do (nginx jaisa): strong ETag sirf ek exact byte
+    representation ke liye hota hai. If-None-Match weak comparison use karta hai, isliye
+    304 waise hi kaam karta hai.
+    """
+    etag, is_weak = response.get_etag()
+    if etag and not is_weak:
+        response.set_etag(etag, weak=True)
+
+
+def compress_response(response):
+    """
+    after_request hook: gzip / brotli for compressible bodies of at least COMPRESS_MIN_SIZE
+    bytes. Streamed (export), file (send_file) and already-encoded responses are left alone.
+    """
+    if (not COMPRESS_ENABLED
+            or request.method == 'HEAD'
+            or not 200 <= response.status_code < 300 or response.status_code in (204, 206)
+            or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or not is_compressible(response.mimetype)
+            or request.endpoint == 'static'):      # static files startup par hi compress ho chuke
+        return response
+
+    # Body size par depend na karke hamesha Vary: cache ko pata rahe ki encoding badal sakti hai
+    response.vary.add('Accept-Encoding')
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+
+    encoding = negotiate_encoding()
+    if encoding is None:
+        return response
+
+    compressed = compress(data, encoding)
+    if len(compressed) >= len(data):
+        return response
+    response.set_data(compressed)   # Content-Length bhi update ho jaata hai
+    response.headers['Content-Encoding'] = encoding
+    weaken_etag(response)
+    return response
+
+
+def install_compression(app):
+    """Registers compress_response() on `app` (runs after every other after_request hook)."""
+    # after_request hooks ulte order mein chalte hain: sabse pehle register = sabse aakhir mein chale
+    app.after_request_funcs.setdefault(None, []).insert(0, compress_response)
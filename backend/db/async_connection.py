@@ -0,0 +1,162 @@
+# backend/db/async_connection.py
+# asyncio ke liye alag connection pool (aiomysql).
+# connection.py ka sync pool scripts (insertion.py, reconcile.py ...) aur Flask ke liye
+# waisa hi rehta hai; yeh pool sirf asgi.py ke async routes use karte hain.
+#
+# Install: pip install aiomysql
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+
+import aiomysql
+from pymysql.err import MySQLError
+
+try:
+    from .connection import POOL_TIMEOUT, POOL_MAX_LIFETIME
+    from .metrics import observe_pool_acquire, register_collector, POOL_GAUGES
+    from .logs import get_logger
+except ImportError:
+    # This fallback helps if running the file directly
+    from connection import POOL_TIMEOUT, POOL_MAX_LIFETIME
+    from metrics import observe_pool_acquire, register_collector, POOL_GAUGES
+    from logs import get_logger
+
+# Async pool bada ho sakta hai: ek connection ek thread nahi rokta
+ASYNC_POOL_SIZE = int(os.environ.get('DB_ASYNC_POOL_SIZE', 50))
+ASYNC_POOL_MIN_SIZE = int(os.environ.get('DB_ASYNC_POOL_MIN_SIZE', 1))
+
+log = get_logger('db.async_pool')
+
+_async_pools = {}
+_async_pools_lock = asyncio.Lock()
+
+
+async def get_async_pool(db_name):
+    """Returns the aiomysql pool for a database, creating it on first use (inside the running loop)."""
+    pool = _async_pools.get(db_name)
+    if pool is None:
+        async with _async_pools_lock:
+            pool = _async_pools.get(db_name)
+            if pool is None:
+                pool = await aiomysql.create_pool(
+                    host=os.environ.get('DB_HOST', 'localhost'),
+                    user=os.environ.get('DB_USER', 'root'),
+                    password=os.environ.get('DB_PASSWORD') or '',
+                    db=db_name,
+                    minsize=min(ASYNC_POOL_MIN_SIZE, ASYNC_POOL_SIZE),
+                    maxsize=ASYNC_POOL_SIZE,
+                    pool_recycle=int(POOL_MAX_LIFETIME) if POOL_MAX_LIFETIME else -1,
+                    # Reads bina transaction ke; writes khud BEGIN / COMMIT karte hain
+                    autocommit=True,
+                )
+                _async_pools[db_name] = pool
+    return pool
+
+
+async def acquire_async_connection(db_name):
+    """
+    Borrows a connection from the async pool for `db_name`.
+    Waits up to DB_POOL_TIMEOUT seconds when every connection is busy.
+    Returns an aiomysql connection, or None if no connection could be obtained.
+    """
+    start = time.perf_counter()
+    try:
+        pool = await get_async_pool(db_name)
+        connection = await asyncio.wait_for(pool.acquire(), POOL_TIMEOUT)
+        observe_pool_acquire(f"async:{db_name}", time.perf_counter() - start)
+        return connection
+    except asyncio.TimeoutError:
+        log.error("Async connection pool for '%s' exhausted (%s in use).", db_name, ASYNC_POOL_SIZE)
+        return None
+    except (MySQLError, OSError) as e:
+        log.error("Error connecting to MySQL Database: %s", e)
+        return None
+
+
+async def release_async_connection(db_name, connection, reusable=True):
+    """
+    Returns a connection to its pool. Adhoora transaction rollback hota hai;
+    reusable=False (e.g. query cancel hui, protocol state pata nahi) closes it instead.
+    """
+    if reusable and not connection.closed and connection.get_transaction_status():
+        try:
+            await connection.rollback()
+        except MySQLError:
+            reusable = False
+    if not reusable:
+        connection.close()
+    _async_pools[db_name].release(connection)
+
+
+@asynccontextmanager
+async def async_connection(db_name):
+    """
+    `async with async_connection(DB_NAME) as connection:` -> connection or None.
+    The connection goes back to the pool on exit. If the block is cancelled or fails
+    with a non-MySQL exception half way, the connection is closed, not reused.
+    """
+    connection = await acquire_async_connection(db_name)
+    if connection is None:
+        yield None
+        return
+
+    reusable = False
+    try:
+        yield connection
+        reusable = True
+    except MySQLError:
+        # Server ne error bheja, connection abhi bhi theek hai
+        reusable = True
+        raise
+    finally:
+        await release_async_connection(db_name, connection, reusable)
+
+
+def error_errno(e):
+    """MySQL error number of a PyMySQL/aiomysql exception (None if it has none)."""
+    return e.args[0] if e.args and isinstance(e.args[0], int) else None
+
+
+def error_message(e):
+    """Server message of a PyMySQL/aiomysql exception (the SIGNAL text for errno 1644)."""
+    return e.args[1] if len(e.args) > 1 else str(e)
+
+
+def error_text(e):
+    """'errno: message', like str() of a mysql-connector Error."""
+    errno = error_errno(e)
+    return f"{errno}: {error_message(e)}" if errno is not None else str(e)
+
+
+def get_async_pool_stats():
+    """Stats for every async pool in this process."""
+    return [
+        {
+            "db_name": db_name,
+            "max_size": pool.maxsize,
+            "size": pool.size,
+            "idle": pool.freesize,
+            "in_use": pool.size - pool.freesize,
+        }
+        for db_name, pool in list(_async_pools.items())
+    ]
+
+
+def _async_pool_metric_lines():
+    stats = get_async_pool_stats()
+    return [(f"db_pool_{key}", documentation, ("pool",), [((f"async:{s['db_name']}",), s[key]) for s in stats])
+            for key, documentation in POOL_GAUGES]
+
+
+register_collector(_async_pool_metric_lines)
+
+
+async def close_async_pools():
+    """Closes every async pool (ASGI lifespan shutdown)."""
+    pools = list(_async_pools.values())
+    _async_pools.clear()
+    for pool in pools:
+        pool.close()
+        await pool.wait_closed()
@@ -0,0 +1,426 @@
+# backend/db/async_queries.py
+# queries.py ke read functions ka asyncio version (aiomysql pool par).
+# SQL aur result shaping queries.py se hi aate hain, taaki dono versions ek jaisa data dein.
+# Har function wahi (data, error) tuple return karta hai, bas `await` karna padta hai.
+
+import asyncio
+
+import aiomysql
+from pymysql.err import MySQLError
+
+try:
+    from .async_connection import async_connection, error_text
+    from .report_cache import async_cached_report
+    from .metrics import timed_query, timed_execute, count_rows
+    from .logs import get_logger, log_success
+    from .dashboard import DASHBOARD_PARTS, build_dashboard
+    from .statements import COMPILED_STATEMENTS, statement_cache, statement_key
+    from .queries import (
+        DB_NAME,
+        TABLE_PRIMARY_KEYS,
+        TABLE_COLUMNS_QUERY,
+        TABLE_COLUMNS_CACHE,
+        ADOPTER_DETAILS_QUERY,
+        DONOR_DETAILS_QUERY,
+        SHELTER_OCCUPANCY_QUERY,
+        AVERAGE_SALARY_QUERY,
+        ABOVE_AVERAGE_QUERY,
+        SALARY_STATS_QUERY,
+        SALARY_HISTOGRAM_QUERY,
+        store_table_columns,
+        check_fields,
+        build_page_query,
+        build_animal_search_query,
+        split_search_page,
+        search_fields,
+        split_page,
+        check_table_versions,
+        build_salary_stats,
+        build_salary_histogram,
+        build_percentile_report,
+        build_adopters_by_count_query,
+        HEADLINE_COUNTS_QUERY,
+    )
+except ImportError:
+    # This fallback helps if running the file directly
+    from async_connection import async_connection, error_text
+    from report_cache import async_cached_report
+    from metrics import timed_query, timed_execute, count_rows
+    from logs import get_logger, log_success
+    from dashboard import DASHBOARD_PARTS, build_dashboard
+    from statements import COMPILED_STATEMENTS, statement_cache, statement_key
+    from queries import (
+        DB_NAME,
+        TABLE_PRIMARY_KEYS,
+        TABLE_COLUMNS_QUERY,
+        TABLE_COLUMNS_CACHE,
+        ADOPTER_DETAILS_QUERY,
+        DONOR_DETAILS_QUERY,
+        SHELTER_OCCUPANCY_QUERY,
+        AVERAGE_SALARY_QUERY,
+        ABOVE_AVERAGE_QUERY,
+        SALARY_STATS_QUERY,
+        SALARY_HISTOGRAM_QUERY,
+        store_table_columns,
+        check_fields,
+        build_page_query,
+        build_animal_search_query,
+        split_search_page,
+        search_fields,
+        split_page,
+        check_table_versions,
+        build_salary_stats,
+        build_salary_histogram,
+        build_percentile_report,
+        build_adopters_by_count_query,
+        HEADLINE_COUNTS_QUERY,
+    )
+
+log = get_logger('db.async_queries')
+
+
+async def _select(query, params=None, one=False, as_dict=True):
+    """
+    Runs one SELECT on a pooled async connection.
+    Returns:
+        (list or dict/None, None) on success (one=True -> fetchone())
+        (None, str) on error
+    """
+    async with async_connection(DB_NAME) as connection:
+        if connection is None:
+            return (None, "Failed to connect to database.")
+        try:
+            async with connection.cursor(aiomysql.DictCursor if as_dict else aiomysql.Cursor) as cursor:
+                await timed_execute(cursor, query, params)
+                if one:
+                    row = await cursor.fetchone()
+                    count_rows(1 if row is not None else 0)
+                    return (row, None) # SUCCESS
+                rows = list(await cursor.fetchall())
+                count_rows(len(rows))
+                return (rows, None) # SUCCESS
+        except MySQLError as e:
+            return (None, error_text(e)) # FAILURE
+
+
+# --- SCHEMA METADATA (same cache as queries.py) ---
+@timed_query
+async def get_table_columns(table_name):
+    """
+    Column names of a table, read from information_schema once per process.
+    Returns: (tuple, None) on success, (None, str) on error
+    """
+    columns = TABLE_COLUMNS_CACHE.get(table_name)
+    if columns is not None:
+        return (columns, None)
+    rows, error = await _select(TABLE_COLUMNS_QUERY, (table_name,), as_dict=False)
+    if error:
+        log.error("Error reading columns of %s: %s", table_name, error)
+        return (None, error)
+    return store_table_columns(table_name, [row[0] for row in rows])
+
+
+async def resolve_fields(table_name, fields):
+    """Validated column tuple for a projection, or None for SELECT * (see queries.resolve_fields)."""
+    if not fields:
+        return (None, None)
+    columns, error = await get_table_columns(table_name)
+    if error:
+        return (None, error)
+    return check_fields(table_name, columns, fields)
+
+
+async def get_statement(operation, table_name, columns=(), key_column=None):
+    """
+    queries.get_statement() with the async schema lookup (same compiled-statement cache).
+    aiomysql has no binary protocol, so the SQL still goes out as a text query.
+    """
+    # Hit: sirf nested dict lookups (statements.py)
+    try:
+        return (COMPILED_STATEMENTS[operation][table_name][key_column][tuple(columns)], None)
+    except KeyError:
+        pass
+    table_columns, error = await get_table_columns(table_name)
+    if error:
+        return (None, error)
+    return statement_cache.compile(statement_key(operation, table_name, columns, key_column), table_columns)
+
+
+# --- GENERIC SELECT ALL FUNCTION ---
+@timed_query
+async def select_all_records(table_name):
+    """
+    Fetches all records from a table.
+    Returns: (list, None) on success, (None, str) on error
+    """
+    results, error = await _select(f"SELECT * FROM `{table_name}`")
+    if error:
+        log.error("Error while fetching records: %s", error)
+        return (None, error)
+    log_success(log, "Successfully fetched %s records from %s.", len(results), table_name)
+    return (results, None)
+
+
+# --- GENERIC SELECT BY ID FUNCTION ---
+@timed_query
+async def select_record_by_id(table_name, id_column, id_value, fields=None):
+    """
+    Fetches a single record by its ID (only `fields` + primary key if given).
+    Returns: (dict, None) on success, (None, str) on error / not found
+    """
+    fields, error = await resolve_fields(table_name, fields)
+    if error:
+        return (None, error)
+    # Cache hit sirf dict lookups hai; KeyError (miss) par get_statement() validate + compile karta hai
+    try:
+        query = COMPILED_STATEMENTS["select_by_id"][table_name][id_column][fields or ()]
+    except KeyError:
+        query, error = await get_statement("select_by_id", table_name, fields or (), id_column)
+        if error:
+            return (None, error)
+    result, error = await _select(query, (id_value,), one=True)
+    if error:
+        log.error("Error while fetching record: %s", error)
+        return (None, error)
+    if result is None:
+        log_success(log, "No record found with ID %s in %s.", id_value, table_name)
+        return (None, f"No record found with ID {id_value} in {table_name}.") # FAILURE (Not found)
+    log_success(log, "Successfully fetched record %s from %s.", id_value, table_name)
+    return (result, None)
+
+
+# --- GENERIC SELECT BY CRITERIA ---
+@timed_query
+async def select_records_by_criteria(table_name, criteria):
+    """
+    Fetches records based on a dictionary of criteria.
+    Returns: (list, None) on success, (None, str) on error
+    """
+    try:
+        query = COMPILED_STATEMENTS["select_by_criteria"][table_name][None][tuple(criteria)]
+    except KeyError:
+        query, error = await get_statement("select_by_criteria", table_name, criteria.keys())
+        if error:
+            return (None, error)
+    results, error = await _select(query, tuple(criteria.values()))
+    if error:
+        log.error("Error while fetching records: %s", error)
+        return (None, error)
+    log_success(log, "Successfully fetched %s records from %s matching criteria.", len(results), table_name)
+    return (results, None)
+
+
+# --- GENERIC KEYSET PAGINATION ---
+@timed_query
+async def select_records_page(table_name, limit, after=None, criteria=None, fields=None):
+    """
+    Fetches one keyset page of records ordered by the table's primary key.
+    Returns:
+        ({"data": list, "next_cursor": int or None}, None) on success
+        (None, str) on error
+    """
+    id_column = TABLE_PRIMARY_KEYS.get(table_name)
+    if id_column is None:
+        return (None, f"Pagination not supported for table {table_name}.")
+
+    fields, error = await resolve_fields(table_name, fields)
+    if error:
+        return (None, error)
+
+    query, values = build_page_query(table_name, id_column, limit, after, criteria, fields)
+    results, error = await _select(query, values)
+    if error:
+        log.error("Error while fetching page: %s", error)
+        return (None, error)
+
+    page = split_page(results, limit, id_column)
+    log_success(log, "Successfully fetched page of %s records from %s.", len(page['data']), table_name)
+    return (page, None)
+
+
+# --- ANIMAL SEARCH ---
+@timed_query
+async def search_animals(filters, sort=("animal_id", False), limit=100, after=None, fields=None):
+    """
+    Server-side animal search, one keyset page at a time (see queries.build_animal_search_query).
+    Returns:
+        ({"data": list, "next_cursor": str or None}, None) on success
+        (None, str) on error
+    """
+    fields, error = await resolve_fields("Animal", fields)
+    if error:
+        return (None, error)
+
+    query, values = build_animal_search_query(filters, sort, limit, after, search_fields(fields, sort))
+    results, error = await _select(query, values)
+    if error:
+        log.error("Error while searching animals: %s", error)
+        return (None, error)
+
+    page = split_search_page(results, limit, sort)
+    log_success(log, "Animal search returned %s records.", len(page['data']))
+    return (page, None)
+
+
+# --- TABLE CHANGE COUNTERS (for ETags) ---
+@timed_query
+async def get_table_versions(tables):
+    """
+    Reads the change counters of the given tables from `TableVersion`.
+    Returns: (dict, None) on success, (None, str) on error (or if a table has no counter)
+    """
+    placeholders = ', '.join(['%s'] * len(tables))
+    query = f"SELECT `table_name`, `version` FROM `TableVersion` WHERE `table_name` IN ({placeholders})"
+    rows, error = await _select(query, tuple(tables), as_dict=False)
+    if error:
+        log.error("Error reading table versions: %s", error)
+        return (None, error)
+    return check_table_versions(tables, dict(rows))
+
+
+@timed_query
+async def get_all_adopter_details():
+    """
+    Fetches all adopters by joining Customer and Adopter tables.
+    Returns: (list, None) on success, (None, str) on error
+    """
+    results, error = await _select(ADOPTER_DETAILS_QUERY)
+    if error:
+        log.error("Error fetching adopter details: %s", error)
+        return (None, error)
+    log_success(log, "Successfully fetched %s adopter detail records.", len(results))
+    return (results, None)
+
+
+@timed_query
+async def get_all_donor_details():
+    """
+    Fetches all donors by joining Customer and Donor tables.
+    Returns: (list, None) on success, (None, str) on error
+    """
+    results, error = await _select(DONOR_DETAILS_QUERY)
+    if error:
+        log.error("Error fetching donor details: %s", error)
+        return (None, error)
+    log_success(log, "Successfully fetched %s donor detail records.", len(results))
+    return (results, None)
+
+
+@async_cached_report(depends_on=["Shelter", "Animal"])
+@timed_query
+async def get_report_shelter_occupancy():
+    """REPORT 1: available-animal count per shelter (from ShelterAnimalSummary)."""
+    results, error = await _select(SHELTER_OCCUPANCY_QUERY)
+    if error:
+        log.error("Error fetching shelter occupancy report: %s", error)
+        return (None, error)
+    log_success(log, "Successfully fetched shelter occupancy report.")
+    return (results, None)
+
+
+@async_cached_report(depends_on=["Employee"])
+@timed_query
+async def get_report_employees_above_average():
+    """REPORT 2: employees earning more than the stored average salary."""
+    async with async_connection(DB_NAME) as connection:
+        if connection is None:
+            return (None, "Failed to connect to database.")
+        try:
+            async with connection.cursor(aiomysql.DictCursor) as cursor:
+                await timed_execute(cursor, AVERAGE_SALARY_QUERY)
+                row = await cursor.fetchone()
+                if row is None:
+                    # Kisi employee ki salary nahi hai
+                    return ([], None)
+
+                await timed_execute(cursor, ABOVE_AVERAGE_QUERY, (row["average_salary"],))
+                results = list(await cursor.fetchall())
+                count_rows(len(results))
+            log_success(log, "Successfully fetched above-average employees report.")
+            return (results, None)
+        except MySQLError as e:
+            log.error("Error fetching above-average employees report: %s", e)
+            return (None, error_text(e))
+
+
+@async_cached_report(depends_on=["Employee"])
+@timed_query
+async def get_salary_stats():
+    """Running salary aggregates: overall, per role and per shelter."""
+    rows, error = await _select(SALARY_STATS_QUERY)
+    if error:
+        log.error("Error fetching salary stats: %s", error)
+        return (None, error)
+    return (build_salary_stats(rows), None)
+
+
+@async_cached_report(depends_on=["Employee"])
+@timed_query
+async def get_salary_histogram():
+    """Salary histogram (empty buckets skipped)."""
+    rows, error = await _select(SALARY_HISTOGRAM_QUERY)
+    if error:
+        log.error("Error fetching salary histogram: %s", error)
+        return (None, error)
+    return (build_salary_histogram(rows), None)
+
+
+async def get_report_salary_percentiles(percentiles=(25, 50, 75, 90)):
+    """Approximate salary percentiles computed from the cached histogram."""
+    histogram, error = await get_salary_histogram()
+    if error:
+        return (None, error)
+    return (build_percentile_report(histogram, percentiles), None)
+
+
+async def _select_adopters_by_count(min_adoptions, limit=None):
+    """Adopters with at least `min_adoptions` adoptions, most adoptions first."""
+    return await _select(*build_adopters_by_count_query(min_adoptions, limit))
+
+
+@async_cached_report(depends_on=["Adoption", "Adopter", "Customer"])
+@timed_query
+async def get_report_multi_adopters():
+    """REPORT 3: adopters who have adopted more than one animal."""
+    results, error = await _select_adopters_by_count(min_adoptions=2)
+    if error:
+        log.error("Error fetching multi-adopters report: %s", error)
+        return (None, error)
+    log_success(log, "Successfully fetched multi-adopters report.")
+    return (results, None)
+
+
+@async_cached_report(depends_on=["Adoption", "Adopter", "Customer"])
+@timed_query
+async def get_report_top_adopters(limit=10, min_adoptions=1):
+    """REPORT 3b: the `limit` most frequent adopters with at least `min_adoptions` adoptions."""
+    results, error = await _select_adopters_by_count(min_adoptions=min_adoptions, limit=limit)
+    if error:
+        log.error("Error fetching top adopters report: %s", error)
+        return (None, error)
+    log_success(log, "Successfully fetched top adopters report.")
+    return (results, None)
+
+
+@async_cached_report(depends_on=["Animal", "Shelter", "Employee", "Adopter"])
+@timed_query
+async def get_headline_counts():
+    """Animal (by status), shelter, employee and adopter counts for the dashboard."""
+    counts, error = await _select(HEADLINE_COUNTS_QUERY, one=True)
+    if error:
+        log.error("Error fetching headline counts: %s", error)
+        return (None, error)
+    log_success(log, "Successfully fetched headline counts.")
+    return (counts, None)
+
+
+async def get_dashboard(animal_limit, after=None, fields=None):
+    """dashboard.get_dashboard() on the async pool: every part is awaited concurrently (asyncio.gather)."""
+    parts = (
+        select_records_page("Animal", animal_limit, after=after, criteria={"status": "Available"}, fields=fields),
+        get_headline_counts(),
+        get_report_shelter_occupancy(),
+        get_report_employees_above_average(),
+        get_report_multi_adopters(),
+    )
+    return build_dashboard(dict(zip(DASHBOARD_PARTS, await asyncio.gather(*parts))))
@@ -0,0 +1,260 @@
+# backend/db/async_update_delete.py
+# update_delete.py ke write functions ka asyncio version (aiomysql pool par).
+# Pool autocommit par chalta hai, isliye har write khud BEGIN / COMMIT / ROLLBACK karta hai.
+# Bulk intake aur adoption batch yahan nahi hain: woh lambe transactions hain aur
+# asgi.py unhe Flask (thread) par hi bhejta hai.
+
+import aiomysql
+from pymysql.err import MySQLError
+
+try:
+    from .async_connection import async_connection, error_errno, error_message, error_text
+    from .report_cache import invalidate_tables
+    from .suggest_index import suggest_upsert, suggest_update, suggest_delete
+    from .queries import DB_NAME
+    from .async_queries import COMPILED_STATEMENTS, get_statement
+    from .update_delete import changed_tables
+    from .metrics import timed_query, timed_execute, count_rows
+    from .logs import get_logger, log_success
+except ImportError:
+    # This fallback helps if running the file directly
+    from async_connection import async_connection, error_errno, error_message, error_text
+    from report_cache import invalidate_tables
+    from suggest_index import suggest_upsert, suggest_update, suggest_delete
+    from queries import DB_NAME
+    from async_queries import COMPILED_STATEMENTS, get_statement
+    from update_delete import changed_tables
+    from metrics import timed_query, timed_execute, count_rows
+    from logs import get_logger, log_success
+
+log = get_logger('db.async_update_delete')
+
+
+def _write_error(e):
+    """SIGNAL SQLSTATE '45000' (errno 1644) ka sirf message, baaki errors 'errno: message'."""
+    if error_errno(e) == 1644:
+        return error_message(e)
+    return error_text(e)
+
+
+# --- TABLE CHANGE COUNTERS ---
+async def bump_table_versions(cursor, tables):
+    """
+    Increments the `TableVersion` counters of `tables` inside the caller's transaction.
+    Once per transaction, right before commit (update_delete.bump_table_versions()).
+    """
+    placeholders = ', '.join(['%s'] * len(tables))
+    try:
+        await timed_execute(
+            cursor,
+            f"UPDATE `TableVersion` SET `version` = `version` + 1 WHERE `table_name` IN ({placeholders})",
+            tuple(tables)
+        )
+    except MySQLError as e:
+        if error_errno(e) != 1146: # Table doesn't exist (migration 002 abhi nahi chali)
+            raise
+
+
+async def _call_procedure(cursor, name, args):
+    """CALLs a stored procedure and returns the last row of its last result set."""
+    placeholders = ', '.join(['%s'] * len(args))
+    await timed_execute(cursor, f"CALL `{name}`({placeholders})", tuple(args))
+    result = None
+    while True:
+        if cursor.description:
+            row = await cursor.fetchone()
+            if row is not None:
+                count_rows(1)
+                result = row
+        if not await cursor.nextset():
+            break
+    return result
+
+
+# --- GENERIC INSERT FUNCTION ---
+@timed_query
+async def insert_record(table_name, insert_data):
+    """
+    Inserts a new record into any table.
+    Returns: (int, None) on success, (None, str) on error
+    """
+    # Cache hit sirf dict lookups hai; KeyError (miss) par get_statement() validate + compile karta hai
+    try:
+        insert_query = COMPILED_STATEMENTS["insert"][table_name][None][tuple(insert_data)]
+    except KeyError:
+        insert_query, error = await get_statement("insert", table_name, insert_data.keys())
+        if error:
+            return (None, error)
+
+    async with async_connection(DB_NAME) as connection:
+        if connection is None:
+            return (None, "Failed to connect to database.")
+        try:
+            async with connection.cursor() as cursor:
+                await connection.begin()
+                await timed_execute(cursor, insert_query, tuple(insert_data.values()))
+                new_record_id = cursor.lastrowid
+                await bump_table_versions(cursor, changed_tables(table_name))
+                await connection.commit()
+            invalidate_tables([table_name])
+            suggest_upsert(table_name, new_record_id, insert_data)
+
+            log_success(log, "Record inserted successfully into %s with ID: %s", table_name, new_record_id)
+            return (new_record_id, None) # SUCCESS
+
+        except MySQLError as e:
+            log.error("Error while inserting record: %s", e)
+            await connection.rollback()
+            return (None, _write_error(e)) # FAILURE
+
+
+# --- GENERIC DELETE FUNCTION ---
+@timed_query
+async def delete_record(table_name, id_column, id_value):
+    """
+    Deletes a record from any table based on its ID.
+    Returns: (int, None) on success, (None, str) on error
+    """
+    try:
+        delete_query = COMPILED_STATEMENTS["delete"][table_name][id_column][()]
+    except KeyError:
+        delete_query, error = await get_statement("delete", table_name, key_column=id_column)
+        if error:
+            return (None, error)
+
+    async with async_connection(DB_NAME) as connection:
+        if connection is None:
+            return (None, "Failed to connect to database.")
+        try:
+            async with connection.cursor() as cursor:
+                await connection.begin()
+                await timed_execute(cursor, delete_query, (id_value,))
+                rows_affected = cursor.rowcount
+                if rows_affected:
+                    # FK cascade se badli child tables ke counters bhi
+                    await bump_table_versions(cursor, changed_tables(table_name, deleted=True))
+                await connection.commit()
+            invalidate_tables([table_name])
+
+            if rows_affected == 0:
+                log_success(log, "No record found with ID %s in table %s. Nothing deleted.", id_value, table_name)
+                return (None, f"No record found with ID {id_value} in {table_name}.") # FAILURE (Not found)
+
+            suggest_delete(table_name, id_value)
+            log_success(log, "Record %s deleted successfully from table %s", id_value, table_name)
+            return (rows_affected, None) # SUCCESS
+
+        except MySQLError as e:
+            log.error("Error while deleting record: %s", e)
+            await connection.rollback()
+            return (None, _write_error(e)) # FAILURE
+
+
+# --- GENERIC UPDATE FUNCTION ---
+@timed_query
+async def update_record(table_name, id_column, id_value, update_data):
+    """
+    Updates one or more columns for a record in any table.
+    Returns: (int, None) on success, (None, str) on error
+    """
+    try:
+        update_query = COMPILED_STATEMENTS["update"][table_name][id_column][tuple(update_data)]
+    except KeyError:
+        update_query, error = await get_statement("update", table_name, update_data.keys(), id_column)
+        if error:
+            return (None, error)
+    values = list(update_data.values()) + [id_value]
+
+    async with async_connection(DB_NAME) as connection:
+        if connection is None:
+            return (None, "Failed to connect to database.")
+        try:
+            async with connection.cursor() as cursor:
+                await connection.begin()
+                await timed_execute(cursor, update_query, tuple(values))
+                rows_affected = cursor.rowcount
+                if rows_affected:
+                    await bump_table_versions(cursor, changed_tables(table_name))
+                await connection.commit()
+            invalidate_tables([table_name])
+
+            if rows_affected == 0:
+                log_success(log, "No record found with ID %s in table %s. Nothing updated.", id_value, table_name)
+                return (0, None) # SUCCESS (but no rows changed)
+
+            suggest_update(table_name, id_column, id_value, update_data)
+            log_success(log, "Record %s in table %s updated successfully. Rows: %s", id_value, table_name, rows_affected)
+            return (rows_affected, None) # SUCCESS
+
+        except MySQLError as e:
+            log.error("Error while updating record: %s", e)
+            await connection.rollback()
+            return (None, _write_error(e)) # FAILURE
+
+
+async def _execute_procedure(name, args, tables, label):
+    """
+    Runs one stored procedure in its own transaction.
+    Returns: (dict, None) with the procedure's last row on success, (None, str) on error
+    """
+    async with async_connection(DB_NAME) as connection:
+        if connection is None:
+            return (None, "Failed to connect to database.")
+        try:
+            async with connection.cursor(aiomysql.DictCursor) as cursor:
+                await connection.begin()
+                result = await _call_procedure(cursor, name, args)
+                await connection.commit()
+            invalidate_tables(tables)
+
+            if result:
+                log_success(log, "Successfully executed %s procedure for %s", name, label)
+                return (result, None) # SUCCESS
+            return (None, f"{name} procedure ran but did not return details.")
+
+        except MySQLError as e:
+            log.error("Error executing %s procedure: %s", name, e)
+            await connection.rollback()
+            return (None, _write_error(e)) # FAILURE
+
+
+# --- SPECIFIC FUNCTION: EXECUTE ADOPTION ---
+@timed_query
+async def execute_adoption_procedure(animal_id, adopter_id, employee_id):
+    """
+    Calls the 'CreateAdoption' stored procedure.
+    Returns: (dict, None) on success, (None, str) on error
+    """
+    result, error = await _execute_procedure('CreateAdoption', [animal_id, adopter_id, employee_id],
+                                             ["Adoption", "Animal", "Shelter"], f"animal {animal_id}")
+    if not error:
+        suggest_update("Animal", "animal_id", animal_id, {"status": "Adopted"})
+    return (result, error)
+
+
+# --- SPECIFIC FUNCTION: EXECUTE CREATE ADOPTER ---
+@timed_query
+async def execute_create_adopter(first_name, last_name, phone):
+    """
+    Calls the 'CreateAdopter' stored procedure.
+    Returns: (dict, None) on success (new adopter details), (None, str) on error
+    """
+    result, error = await _execute_procedure('CreateAdopter', [first_name, last_name, phone],
+                                             ["Customer", "Adopter"], first_name)
+    if not error:
+        suggest_upsert("Customer", result["customer_id"], result)
+    return (result, error)
+
+
+# --- SPECIFIC FUNCTION: EXECUTE CREATE DONOR ---
+@timed_query
+async def execute_create_donor(first_name, last_name, phone, amount):
+    """
+    Calls the 'CreateDonor' stored procedure.
+    Returns: (dict, None) on success (new donor details), (None, str) on error
+    """
+    result, error = await _execute_procedure('CreateDonor', [first_name, last_name, phone, amount],
+                                             ["Customer", "Donor"], first_name)
+    if not error:
+        suggest_upsert("Customer", result["customer_id"], result)
+    return (result, error)
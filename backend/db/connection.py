@@ -1,12 +1,35 @@
 import mysql.connector
 from mysql.connector import Error
 import os
+import threading
+import time
+from collections import OrderedDict
 from dotenv import load_dotenv
 
+try:
+    from .metrics import MetricsCursor, METRICS_ENABLED, observe_pool_acquire, register_collector, POOL_GAUGES
+    from .logs import get_logger
+except ImportError:
+    # This fallback helps if running the file directly
+    from metrics import MetricsCursor, METRICS_ENABLED, observe_pool_acquire, register_collector, POOL_GAUGES
+    from logs import get_logger
+
 # Load .env file from the 'backend' folder (one level up)
 dotenv_path = os.path.join(os.path.dirname(__file__), '..', '.env')
 load_dotenv(dotenv_path=dotenv_path)
 
+
+def _connect_kwargs(db_name=None):
+    """Connection settings shared by the one-off connections and the pool."""
+    return dict(
+        host=os.environ.get('DB_HOST', 'localhost'),
+        user=os.environ.get('DB_USER', 'root'),
+        password=os.environ.get('DB_PASSWORD'),
+        database=db_name,
+        use_pure=True
+    )
+
+
 def get_db_connection(db_name=None):
     """
     Creates a connection to the MySQL server.
@@ -14,25 +37,419 @@ def get_db_connection(db_name=None):
     """
     connection = None
     try:
-        connection = mysql.connector.connect(
-            host=os.environ.get('DB_HOST', 'localhost'),
-            user=os.environ.get('DB_USER', 'root'),
-            password=os.environ.get('DB_PASSWORD'),
-            database=db_name,
-            use_pure=True  
-        )
+        connection = mysql.connector.connect(**_connect_kwargs(db_name))
         # print("MySQL (Pure Python) connection successful")
     except Error as e:
         print(f"Error connecting to MySQL Database: {e}")
         print("Error: MySQL se connect nahi ho pa raha. Check karo ki .env file 'backend' folder mein hai aur password sahi hai.")
         exit(1)
-        
+
     return connection
 
+
+# ===============================================
+#  *** CONNECTION POOL ***
+# ===============================================
+# Har API call par naya connection (TCP + auth) banana mehenga hai.
+# Pool connections ko reuse karta hai: borrow -> kaam -> close() (jo pool mein wapas jaata hai).
+
+log = get_logger('db.pool')
+
+POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 10))
+POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', 10))           # seconds to wait for a free connection
+POOL_MAX_LIFETIME = float(os.environ.get('DB_POOL_MAX_LIFETIME', 1800)) # recycle connections older than this
+POOL_PING_AFTER = float(os.environ.get('DB_POOL_PING_AFTER', 5))       # ping on borrow if idle longer than this
+# Server-side prepared statements (binary protocol) for the generic CRUD functions
+PREPARED_STATEMENTS = os.environ.get('DB_PREPARED_STATEMENTS', '1') == '1'
+PREPARED_STATEMENTS_PER_CONNECTION = int(os.environ.get('DB_PREPARED_STATEMENTS_PER_CONNECTION', 32))
+
+
+def _socket_open(raw):
+    """True while `raw` still has an open socket. No server round trip (unlike is_connected())."""
+    socket = getattr(raw, '_socket', None)
+    sock = getattr(socket, 'sock', None)
+    try:
+        return sock is not None and sock.fileno() != -1
+    except OSError:
+        return False
+
+
+class PooledConnection:
+    """
+    Thin wrapper around a MySQL connection borrowed from a ConnectionPool.
+    Everything is delegated to the real connection, except close(),
+    which hands the connection back to the pool instead of closing it.
+    """
+
+    def __init__(self, pool, raw, created_at):
+        self._pool = pool
+        self._raw = raw
+        self._created_at = created_at
+        self._returned = False
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def cursor(self, *args, **kwargs):
+        cursor = self._raw.cursor(*args, **kwargs)
+        # Statement time, rows aur errors /metrics ke liye
+        return MetricsCursor(cursor) if METRICS_ENABLED else cursor
+
+    def is_connected(self):
+        # Returned wrappers behave like a closed connection.
+        # Sirf local socket check: raw.is_connected() har call par COM_PING bhejta hai
+        if self._returned:
+            return False
+        return _socket_open(self._raw)
+
+    def close(self):
+        if self._returned:
+            return
+        self._returned = True
+        self._pool._release(self._raw, self._created_at)
+
+    def discard(self):
+        """
+        Closes the underlying connection instead of reusing it
+        (e.g. a streaming result was abandoned half way).
+        """
+        if self._returned:
+            return
+        self._returned = True
+        self._pool._release(self._raw, self._created_at, reusable=False)
+
+    def statement_cursor(self, statement, dictionary=False):
+        """
+        Cursor for one cached CRUD statement (db/statements.py).
+        With DB_PREPARED_STATEMENTS=1 it is a server-side prepared cursor kept on the underlying
+        connection, so later borrowers skip the PREPARE; otherwise a normal (text protocol) cursor.
+        close() works as usual either way.
+        """
+        if not PREPARED_STATEMENTS:
+            return self.cursor(dictionary=dictionary)
+        cursor = PreparedStatementCursor(self._raw, self._pool._prepared_cursor(self._raw, statement, dictionary))
+        return MetricsCursor(cursor) if METRICS_ENABLED else cursor
+
+
+class PreparedStatementCursor:
+    """
+    A cached prepared cursor on loan to one borrower. close() only reads any leftover rows:
+    the statement stays prepared on the server for the next execute().
+    """
+
+    def __init__(self, raw, cursor):
+        self._raw = raw
+        self._cursor = cursor
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def close(self):
+        # Adhoore result waali connection pool mein reuse nahi hoti
+        if self._raw.unread_result:
+            self._cursor.fetchall()
+
+
+class ConnectionPool:
+    """
+    Bounded pool of MySQL connections for one database.
+    - Connections are created lazily, up to max_size.
+    - Borrowers wait up to `timeout` seconds when the pool is exhausted.
+    - Idle connections are pinged before reuse and recycled after max_lifetime.
+    - After os.fork() the child drops the parent's sockets and starts fresh.
+    """
+
+    def __init__(self, db_name, max_size=POOL_SIZE, timeout=POOL_TIMEOUT,
+                 max_lifetime=POOL_MAX_LIFETIME, ping_after=POOL_PING_AFTER):
+        self.db_name = db_name
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.ping_after = ping_after
+
+        self._cond = threading.Condition()
+        self._idle = []       # list of (raw_connection, created_at, returned_at)
+        self._in_use = 0
+        self._pid = os.getpid()
+        self._statements = {} # id(raw_connection) -> OrderedDict((sql, dictionary) -> prepared cursor)
+        self._counters = {
+            "checkouts": 0,
+            "waits": 0,
+            "timeouts": 0,
+            "created": 0,
+            "recycled": 0,
+            "discarded": 0,
+            "total_wait_ms": 0.0,
+            "max_wait_ms": 0.0,
+            "statements_prepared": 0,
+            "statement_reuses": 0,
+            "statements_evicted": 0,
+        }
+
+    # --- fork safety ---
+    def _reset_after_fork(self):
+        """
+        Called in the child process after fork. Parent ke sockets ko close
+        NAHI karte (COM_QUIT parent ka connection tod dega), bas bhool jaate hain.
+        """
+        self._cond = threading.Condition()
+        self._idle = []
+        self._in_use = 0
+        self._pid = os.getpid()
+        self._statements = {}
+
+    def _check_pid(self):
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+
+    # --- internal helpers ---
+    def _new_connection(self):
+        raw = mysql.connector.connect(**_connect_kwargs(self.db_name))
+        self._counters["created"] += 1
+        return raw, time.monotonic()
+
+    def _discard(self, raw):
+        # Server statements connection ke saath hi band ho jaate hain
+        self._statements.pop(id(raw), None)
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+    def _prepared_cursor(self, raw, statement, dictionary):
+        """
+        The prepared cursor for `statement` on `raw`, created on first use. At most
+        PREPARED_STATEMENTS_PER_CONNECTION stay prepared per connection (least recently used is closed).
+        Only the borrower of `raw` gets here, so the per-connection dict needs no lock.
+        """
+        statements = self._statements.setdefault(id(raw), OrderedDict())
+        key = (statement, dictionary)
+        cursor = statements.get(key)
+        if cursor is not None:
+            statements.move_to_end(key)
+            with self._cond:
+                self._counters["statement_reuses"] += 1
+            return cursor
+
+        cursor = raw.cursor(prepared=True, dictionary=dictionary)
+        statements[key] = cursor
+        evicted = []
+        while len(statements) > PREPARED_STATEMENTS_PER_CONNECTION:
+            evicted.append(statements.popitem(last=False)[1])
+        with self._cond:
+            self._counters["statements_prepared"] += 1
+            self._counters["statements_evicted"] += len(evicted)
+        for old_cursor in evicted:
+            try:
+                old_cursor.close()   # COM_STMT_CLOSE
+            except Error:
+                pass
+        return cursor
+
+    def _check_idle(self, raw, created_at, returned_at):
+        """
+        Liveness + lifetime check for an idle connection before reuse.
+        Called outside the pool lock (ping is a network round trip).
+        Returns None if usable, else the counter to bump ("recycled" / "discarded").
+        """
+        now = time.monotonic()
+        if self.max_lifetime and now - created_at > self.max_lifetime:
+            return "recycled"
+        if now - returned_at > self.ping_after:
+            try:
+                raw.ping(reconnect=False)
+            except Error:
+                return "discarded"
+        return None
+
+    # --- public API ---
+    def get_connection(self):
+        """
+        Borrows a connection from the pool.
+        Returns a PooledConnection, or None if the pool is exhausted / MySQL is unreachable.
+        """
+        self._check_pid()
+        start = time.monotonic()
+        waited = False
+
+        while True:
+            idle = None
+            with self._cond:
+                while True:
+                    # 1. Koi idle connection hai? Slot le lo, validate lock ke bahar hoga
+                    if self._idle:
+                        idle = self._idle.pop()
+                        self._in_use += 1
+                        break
+
+                    # 2. Pool full nahi hai? Naya connection banao
+                    if self._in_use < self.max_size:
+                        self._in_use += 1
+                        break
+
+                    # 3. Sab busy hain, wait karo
+                    remaining = self.timeout - (time.monotonic() - start)
+                    if remaining <= 0:
+                        self._counters["timeouts"] += 1
+                        log.error("Connection pool for '%s' exhausted (%s in use).", self.db_name, self.max_size)
+                        return None
+                    waited = True
+                    self._cond.wait(remaining)
+
+            if idle is None:
+                break
+
+            # Ping lock ke bahar: dheema / mara hua socket baaki borrowers ko nahi rokta
+            raw, created_at, returned_at = idle
+            problem = self._check_idle(raw, created_at, returned_at)
+            if problem is None:
+                with self._cond:
+                    self._record_checkout(start, waited)
+                return PooledConnection(self, raw, created_at)
+
+            self._discard(raw)
+            with self._cond:
+                self._counters[problem] += 1
+                self._in_use -= 1
+                self._cond.notify()
+
+        # Connect outside the lock so other borrowers are not blocked on the handshake
+        try:
+            raw, created_at = self._new_connection()
+        except Error as e:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            log.error("Error connecting to MySQL Database: %s", e)
+            return None
+
+        with self._cond:
+            self._record_checkout(start, waited)
+        return PooledConnection(self, raw, created_at)
+
+    def _record_checkout(self, start, waited):
+        wait_ms = (time.monotonic() - start) * 1000
+        observe_pool_acquire(self.db_name, wait_ms / 1000)
+        self._counters["checkouts"] += 1
+        if waited:
+            self._counters["waits"] += 1
+        self._counters["total_wait_ms"] += wait_ms
+        self._counters["max_wait_ms"] = max(self._counters["max_wait_ms"], wait_ms)
+
+    def _release(self, raw, created_at, reusable=True):
+        """Returns a connection to the pool (called by PooledConnection.close())."""
+        if self._pid != os.getpid():
+            # Connection belongs to the parent process, ignore it
+            return
+
+        try:
+            # Unread rows waali connection dobara use nahi ho sakti.
+            # Yahan ping nahi: mara hua connection agle borrow par ping/lifetime check mein pakda jaata hai
+            if reusable and _socket_open(raw) and not raw.unread_result:
+                # Adhoora transaction pool mein wapas nahi jaana chahiye
+                if raw.in_transaction:
+                    raw.rollback()
+            else:
+                reusable = False
+        except Error:
+            reusable = False
+
+        with self._cond:
+            self._in_use -= 1
+            if reusable and len(self._idle) < self.max_size:
+                self._idle.append((raw, created_at, time.monotonic()))
+                raw = None
+            else:
+                self._counters["discarded"] += 1
+            self._cond.notify()
+        if raw is not None:
+            # COM_QUIT lock ke bahar
+            self._discard(raw)
+
+    def close_all(self):
+        """Closes every idle connection (borrowed ones are closed when returned)."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+        for raw, _, _ in idle:
+            self._discard(raw)
+
+    def stats(self):
+        """Live pool statistics."""
+        with self._cond:
+            checkouts = self._counters["checkouts"]
+            return {
+                "db_name": self.db_name,
+                "max_size": self.max_size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "checkouts": checkouts,
+                "waits": self._counters["waits"],
+                "timeouts": self._counters["timeouts"],
+                "created": self._counters["created"],
+                "recycled": self._counters["recycled"],
+                "discarded": self._counters["discarded"],
+                "avg_wait_ms": round(self._counters["total_wait_ms"] / checkouts, 3) if checkouts else 0.0,
+                "max_wait_ms": round(self._counters["max_wait_ms"], 3),
+                "prepared_statements": sum(len(statements) for statements in list(self._statements.values())),
+                "statements_prepared": self._counters["statements_prepared"],
+                "statement_reuses": self._counters["statement_reuses"],
+                "statements_evicted": self._counters["statements_evicted"],
+            }
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_name):
+    """Returns the (per-process) pool for a database, creating it on first use."""
+    pool = _pools.get(db_name)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(db_name)
+            if pool is None:
+                pool = ConnectionPool(db_name)
+                _pools[db_name] = pool
+    return pool
+
+
+def get_pooled_connection(db_name):
+    """
+    Borrows a connection from the pool for `db_name`.
+    Use it exactly like get_db_connection(): connection.close() returns it to the pool.
+    Returns None if no connection could be obtained.
+    """
+    return get_pool(db_name).get_connection()
+
+
+def get_pool_stats():
+    """Stats for every pool in this process."""
+    return [pool.stats() for pool in list(_pools.values())]
+
+
+def _pool_metric_lines():
+    stats = get_pool_stats()
+    return [(f"db_pool_{key}", documentation, ("pool",), [((s["db_name"],), s[key]) for s in stats])
+            for key, documentation in POOL_GAUGES + (("timeouts", "Borrowers that gave up waiting (since start)."),)]
+
+
+register_collector(_pool_metric_lines)
+
+
+def _reset_pools_after_fork():
+    for pool in list(_pools.values()):
+        pool._reset_after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    # gunicorn/uwsgi workers: har worker apna pool banayega
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
 # --- Test function (sirf is file ko run karne ke liye) ---
 if __name__ == "__main__":
     print("Testing connection.py directly...")
-    
+
     # 1. Server se connection (bina database ke)
     conn_server = get_db_connection()
     if conn_server:
@@ -50,5 +467,12 @@ if __name__ == "__main__":
             conn_db.close()
         else:
             print(f"Database connection (db_name={DB_NAME_TEST}) FAILED.")
+
+        # 3. Pool se connection borrow karo
+        pooled = get_pooled_connection(DB_NAME_TEST)
+        if pooled:
+            print(f"Pooled connection (db_name={DB_NAME_TEST}) SUCCESSFUL.")
+            pooled.close()
+        print(f"Pool stats: {get_pool_stats()}")
     else:
-        print("Skipping DB connection test (DB_NAME not in .env).")
\ No newline at end of file
+        print("Skipping DB connection test (DB_NAME not in .env).")
@@ -0,0 +1,133 @@
+# backend/db/dashboard.py
+# /api/dashboard: front page ka saara data ek hi request mein -- available animals (ek page),
+# teeno reports aur headline counts.
+# Har part apne pooled connection par ek bounded thread pool mein saath-saath chalta hai, isliye
+# latency sabse dheemi query jitni hoti hai, sabka jod nahi.
+#
+# - DASHBOARD_WORKERS=5     poore process mein ek saath chalne waale dashboard parts (DB_POOL_SIZE tak)
+#
+# Pool process-wide hai (har request ka naya nahi), isliye 50 dashboard requests bhi DB pool se
+# DASHBOARD_WORKERS se zyada connections nahi lete; baaki parts queue mein rukte hain.
+
+import contextvars
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from .connection import POOL_SIZE
+    from .logs import get_logger
+    from .queries import (
+        select_records_page,
+        get_headline_counts,
+        get_report_shelter_occupancy,
+        get_report_employees_above_average,
+        get_report_multi_adopters,
+    )
+except ImportError:
+    # This fallback helps if running the file directly
+    from connection import POOL_SIZE
+    from logs import get_logger
+    from queries import (
+        select_records_page,
+        get_headline_counts,
+        get_report_shelter_occupancy,
+        get_report_employees_above_average,
+        get_report_multi_adopters,
+    )
+
+DASHBOARD_WORKERS = max(1, min(int(os.environ.get('DASHBOARD_WORKERS', 5)), POOL_SIZE))
+
+# Parts ka order; async_queries.get_dashboard() bhi isi order mein results deta hai
+DASHBOARD_PARTS = ("available_animals", "counts", "shelter_occupancy", "employees_above_average", "multi_adopters")
+
+# Koi bhi in tables mein likhe toh dashboard ka ETag badal jaata hai
+DASHBOARD_TABLES = tuple(sorted(
+    {"Animal"}
+    | set(get_headline_counts.depends_on)
+    | set(get_report_shelter_occupancy.depends_on)
+    | set(get_report_employees_above_average.depends_on)
+    | set(get_report_multi_adopters.depends_on)
+))
+
+log = get_logger('db.dashboard')
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """The process-wide dashboard thread pool (created on first use)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=DASHBOARD_WORKERS, thread_name_prefix='dashboard')
+    return _executor
+
+
+def run_concurrently(calls):
+    """
+    Runs {name: (func, args, kwargs)} on the dashboard pool and waits for all of them.
+    Each call gets a copy of the caller's context, so request IDs and DB metrics stay attached.
+    Returns: {name: func's return value}
+    """
+    executor = get_executor()
+    futures = {name: executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
+               for name, (func, args, kwargs) in calls.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
+def build_dashboard(results):
+    """
+    Combines the (data, error) result of every part into the dashboard payload.
+    Returns:
+        (dict, None) on success
+        (None, str) if any part failed (its error)
+    """
+    for name in DASHBOARD_PARTS:
+        data, error = results[name]
+        if error:
+            log.error("Dashboard part '%s' failed: %s", name, error)
+            return (None, error)
+
+    page = results["available_animals"][0]
+    return ({
+        "available_animals": page["data"],
+        "next_cursor": page["next_cursor"],
+        "counts": results["counts"][0],
+        "reports": {
+            "shelter_occupancy": results["shelter_occupancy"][0],
+            "employees_above_average": results["employees_above_average"][0],
+            "multi_adopters": results["multi_adopters"][0],
+        },
+    }, None)
+
+
+def get_dashboard(animal_limit, after=None, fields=None):
+    """
+    Available animals (one keyset page, optional `fields` projection), headline counts and the
+    three reports, each on its own pooled connection, all at the same time.
+    Returns:
+        (dict, None) on success
+        (None, str) on error
+    """
+    return build_dashboard(run_concurrently({
+        "available_animals": (select_records_page, ("Animal", animal_limit),
+                              {"after": after, "criteria": {"status": "Available"}, "fields": fields}),
+        "counts": (get_headline_counts, (), {}),
+        "shelter_occupancy": (get_report_shelter_occupancy, (), {}),
+        "employees_above_average": (get_report_employees_above_average, (), {}),
+        "multi_adopters": (get_report_multi_adopters, (), {}),
+    }))
+
+
+def _reset_after_fork():
+    # Parent ke worker threads child mein nahi hote: naya pool pehli call par banega
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,344 @@
+# backend/db/generate_data.py
+# Seeded synthetic data generator (production-size data ke liye).
+# insertion.py sirf chhota sample set daalta hai; yeh script lakhon rows bana sakta hai.
+#
+# Usage (backend folder se):
+#   python db/generate_data.py --shelters 1000 --animals 5000000 --customers 2000000 --seed 42
+#   python db/generate_data.py --method infile ...   (LOAD DATA LOCAL INFILE, sabse fast)
+#
+# Load ke baad TableVersion counters ek baar bump hote hain (triggers ab per-row bump nahi karte),
+# taaki chalte hue API server ke ETags aur report cache purane na rahein.
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+import mysql.connector
+from mysql.connector import Error
+from connection import _connect_kwargs
+
+SPECIES_BREEDS = {
+    "Dog": ["Labrador", "Golden Retriever", "German Shepherd", "Beagle", "Boxer", "Pug", "Indie"],
+    "Cat": ["Siamese", "Persian", "Domestic", "Maine Coon", "Bengal"],
+    "Rabbit": ["Dwarf", "Lop", "Rex"],
+    "Bird": ["Canary", "Parrot", "Budgie"],
+}
+ANIMAL_NAMES = ["Buddy", "Whiskers", "Charlie", "Luna", "Max", "Milo", "Goldie", "Rocky", "Smokey",
+                "Daisy", "Bella", "Simba", "Coco", "Bruno", "Tiger", "Oreo", "Sheru", "Motu", "Kiwi", "Pepper"]
+FIRST_NAMES = ["Amit", "Priya", "Rahul", "Sunita", "Vikram", "Anjali", "Suresh", "Deepa", "John", "Jane",
+               "Raj", "Anita", "Michael", "Sarah", "David", "Emily", "Chris", "Maria", "Arjun", "Neha"]
+LAST_NAMES = ["Sharma", "Singh", "Verma", "Rao", "Mehta", "Joshi", "Kumar", "Nair", "Doe", "Smith",
+              "Patel", "Gupta", "Brown", "Lee", "Chen", "White", "Taylor", "Garcia", "Iyer", "Das"]
+CITIES = ["Delhi", "Mumbai", "Bangalore", "Chennai", "Kolkata", "Pune", "Hyderabad", "Jaipur"]
+ROLES = ["Manager", "Vet", "Coordinator", "Volunteer", "Cleaner"]
+
+TODAY = date.today()
+
+
+def spread(index, selected, total):
+    """
+    True for exactly `selected` of `total` indexes, evenly spread.
+    Animals aur Adoptions dono generators isse same animals choose karte hain,
+    bina poori list memory mein rakhe.
+    """
+    return (index + 1) * selected // total > index * selected // total
+
+
+def next_id(cursor, table, id_column):
+    cursor.execute(f"SELECT COALESCE(MAX(`{id_column}`), 0) + 1 FROM `{table}`")
+    return cursor.fetchone()[0]
+
+
+# --- Row generators (sab streaming hain) ---
+
+def gen_shelters(rng, cfg, base):
+    available_animals = cfg.animals - cfg.adoptions
+    per_shelter = available_animals / cfg.shelters
+    for i in range(cfg.shelters):
+        # Itni capacity ki Available animals kabhi capacity cross na karein
+        capacity = int(per_shelter * rng.uniform(1.4, 1.8)) + 20
+        yield (base + i, f"{rng.choice(ANIMAL_NAMES)} Shelter #{base + i}",
+               f"{rng.randint(1, 999)} Main Rd, {rng.choice(CITIES)}", capacity, 0)
+
+
+def gen_employees(rng, cfg, base, shelter_base):
+    for i in range(cfg.employees):
+        salary = round(rng.uniform(25000, 120000), -2)
+        yield (base + i, shelter_base + rng.randrange(cfg.shelters),
+               f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", rng.choice(ROLES), salary)
+
+
+def gen_customers(rng, cfg, base):
+    for i in range(cfg.customers):
+        # phone UNIQUE hai, isliye customer_id se banate hain
+        yield (base + i, rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES), f"9{base + i:09d}")
+
+
+def gen_adopters(cfg, base, customer_base):
+    for i in range(cfg.adopters):
+        yield (base + i, customer_base + i)
+
+
+def gen_donors(rng, cfg, base, customer_base):
+    # Donors customers ki list ke end se aate hain (kuch log adopter + donor dono honge)
+    start = cfg.customers - cfg.donors
+    for i in range(cfg.donors):
+        yield (base + i, customer_base + start + i, round(rng.uniform(100, 50000), 2))
+
+
+def gen_animals(rng, cfg, base, shelter_base, capacities):
+    available = [0] * cfg.shelters
+    for i in range(cfg.animals):
+        shelter = rng.randrange(cfg.shelters)
+        species = rng.choice(list(SPECIES_BREEDS))
+        dob = TODAY - timedelta(days=rng.randrange(30, 15 * 365))
+        age = (TODAY - dob).days // 365
+
+        if spread(i, cfg.adoptions, cfg.animals):
+            status = "Adopted"
+        elif rng.random() < 0.85 and available[shelter] < capacities[shelter] - 1:
+            status = "Available"
+            available[shelter] += 1
+        else:
+            # Trigger ke liye occupancy < capacity rehna chahiye, isliye Pending
+            status = "Pending"
+
+        yield (base + i, shelter_base + shelter, rng.choice(ANIMAL_NAMES), species,
+               rng.choice(SPECIES_BREEDS[species]), age, rng.choice("MFN"), dob, status)
+
+
+def gen_adoptions(rng, cfg, base, animal_base, adopter_base, employee_base):
+    adoption_id = base
+    for i in range(cfg.animals):
+        if not spread(i, cfg.adoptions, cfg.animals):
+            continue
+        adoption_date = TODAY - timedelta(days=rng.randrange(0, 3 * 365))
+        yield (adoption_id, animal_base + i, adopter_base + rng.randrange(cfg.adopters),
+               employee_base + rng.randrange(cfg.employees), adoption_date)
+        adoption_id += 1
+
+
+def gen_donations(rng, cfg, base, donor_base, shelter_base):
+    for i in range(cfg.donations):
+        yield (base + i, donor_base + rng.randrange(cfg.donors), shelter_base + rng.randrange(cfg.shelters),
+               round(rng.uniform(50, 25000), 2), TODAY - timedelta(days=rng.randrange(0, 3 * 365)))
+
+
+def gen_salary_changes(rng, cfg, employee_base, salaries):
+    # Har change purani salary -> nayi salary; aakhri change Employee ki current salary par khatam hota hai
+    for _ in range(cfg.salary_changes):
+        emp = rng.randrange(cfg.employees)
+        new_salary = salaries[emp]
+        old_salary = round(new_salary * rng.uniform(0.8, 0.98), -2)
+        yield (employee_base + emp, old_salary, new_salary)
+
+
+# --- Loaders ---
+
+class Progress:
+    def __init__(self, table, total):
+        self.table = table
+        self.total = total
+        self.done = 0
+        self.start = time.perf_counter()
+        self.last_print = 0.0
+
+    def update(self, count, force=False):
+        self.done += count
+        now = time.perf_counter()
+        if force or now - self.last_print >= 2:
+            self.last_print = now
+            elapsed = max(now - self.start, 1e-9)
+            pct = 100.0 * self.done / self.total if self.total else 100.0
+            print(f"  {self.table}: {self.done}/{self.total} ({pct:.1f}%) - {self.done / elapsed:,.0f} rows/sec")
+
+    def finish(self):
+        self.update(0, force=True)
+        return self.done, time.perf_counter() - self.start
+
+
+def load_with_inserts(connection, table, columns, rows, total, batch_size):
+    """Multi-row INSERTs (executemany INSERT ko ek multi-row statement mein badal deta hai)."""
+    cursor = connection.cursor()
+    query = (f"INSERT INTO `{table}` (`" + "`, `".join(columns) + "`) VALUES ("
+             + ", ".join(["%s"] * len(columns)) + ")")
+    progress = Progress(table, total)
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            cursor.executemany(query, batch)
+            connection.commit()
+            progress.update(len(batch))
+            batch = []
+    if batch:
+        cursor.executemany(query, batch)
+        connection.commit()
+        progress.update(len(batch))
+    cursor.close()
+    return progress.finish()
+
+
+def _tsv_value(value):
+    if value is None:
+        return "\\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+def load_with_infile(connection, table, columns, rows, total, batch_size):
+    """Rows ko temp TSV file mein likho, fir LOAD DATA LOCAL INFILE (triggers phir bhi chalte hain)."""
+    cursor = connection.cursor()
+    progress = Progress(table, total)
+    with tempfile.NamedTemporaryFile('w', suffix=f'_{table}.tsv', delete=False, encoding='utf-8') as f:
+        path = f.name
+        for row in rows:
+            f.write("\t".join(_tsv_value(v) for v in row) + "\n")
+    try:
+        cursor.execute(
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE `{table}` "
+            f"FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' "
+            f"(`" + "`, `".join(columns) + "`)",
+            (path,)
+        )
+        connection.commit()
+        progress.update(total)
+    finally:
+        cursor.close()
+        os.remove(path)
+    return progress.finish()
+
+
+def bump_table_versions(connection, tables):
+    """Loaded tables ke TableVersion counters ek hi UPDATE mein (migration 002 ke bina skip)."""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            "UPDATE `TableVersion` SET `version` = `version` + 1 WHERE `table_name` IN ("
+            + ", ".join(["%s"] * len(tables)) + ")",
+            tuple(tables)
+        )
+        connection.commit()
+    except Error as e:
+        if e.errno != 1146: # Table doesn't exist
+            raise
+    finally:
+        cursor.close()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate a seeded synthetic dataset for the pet adoption DB.")
+    parser.add_argument("--shelters", type=int, default=1000)
+    parser.add_argument("--employees", type=int, default=20000)
+    parser.add_argument("--customers", type=int, default=2000000)
+    parser.add_argument("--adopter-ratio", type=float, default=0.6, help="fraction of customers that are adopters")
+    parser.add_argument("--donor-ratio", type=float, default=0.5, help="fraction of customers that are donors")
+    parser.add_argument("--animals", type=int, default=5000000)
+    parser.add_argument("--adoptions", type=int, default=None, help="default: 40%% of animals")
+    parser.add_argument("--donations", type=int, default=1000000)
+    parser.add_argument("--salary-changes", type=int, default=40000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--method", choices=["insert", "infile"], default="insert",
+                        help="insert = multi-row INSERTs, infile = LOAD DATA LOCAL INFILE")
+    cfg = parser.parse_args()
+
+    cfg.adopters = int(cfg.customers * cfg.adopter_ratio)
+    cfg.donors = int(cfg.customers * cfg.donor_ratio)
+    if cfg.adoptions is None:
+        cfg.adoptions = int(cfg.animals * 0.4)
+
+    if cfg.shelters < 1 or cfg.employees < 1 or cfg.adopters < 1 or cfg.donors < 1:
+        parser.error("need at least 1 shelter, employee, adopter and donor")
+    if cfg.adoptions > cfg.animals:
+        parser.error("--adoptions cannot be more than --animals")
+    return cfg
+
+
+def main():
+    cfg = parse_args()
+
+    dotenv_path = os.path.join(os.path.dirname(__file__), '..', '.env')
+    from dotenv import load_dotenv
+    load_dotenv(dotenv_path=dotenv_path)
+    db_name = os.environ.get('DB_NAME', 'pet_adoption_db')
+
+    try:
+        connection = mysql.connector.connect(**_connect_kwargs(db_name), allow_local_infile=(cfg.method == "infile"))
+    except Error as e:
+        print(f"Could not connect to database '{db_name}': {e}")
+        return
+
+    load = load_with_infile if cfg.method == "infile" else load_with_inserts
+    cursor = connection.cursor()
+    # Naye IDs existing data ke baad se shuru honge (script dobara chala sakte ho)
+    bases = {
+        "Shelter": next_id(cursor, "Shelter", "shelter_id"),
+        "Employee": next_id(cursor, "Employee", "employee_id"),
+        "Customer": next_id(cursor, "Customer", "customer_id"),
+        "Adopter": next_id(cursor, "Adopter", "adopter_id"),
+        "Donor": next_id(cursor, "Donor", "donor_id"),
+        "Animal": next_id(cursor, "Animal", "animal_id"),
+        "Adoption": next_id(cursor, "Adoption", "adoption_id"),
+        "Donation": next_id(cursor, "Donation", "donation_id"),
+    }
+    cursor.close()
+
+    print(f"Generating dataset (seed={cfg.seed}, method={cfg.method}) into '{db_name}'...")
+    overall_start = time.perf_counter()
+    totals = []
+
+    try:
+        # Har table ka apna RNG, taaki ek table ka size badalne se baaki data na badle
+        shelters = list(gen_shelters(random.Random(f"{cfg.seed}-shelter"), cfg, bases["Shelter"]))
+        capacities = [row[3] for row in shelters]
+        totals.append(load(connection, "Shelter", ["shelter_id", "name", "address", "capacity", "current_occupancy"],
+                           iter(shelters), cfg.shelters, cfg.batch_size))
+
+        employees = list(gen_employees(random.Random(f"{cfg.seed}-employee"), cfg, bases["Employee"], bases["Shelter"]))
+        salaries = [row[4] for row in employees]
+        totals.append(load(connection, "Employee", ["employee_id", "shelter_id", "name", "role", "salary"],
+                           iter(employees), cfg.employees, cfg.batch_size))
+        del employees
+
+        totals.append(load(connection, "Customer", ["customer_id", "first_name", "last_name", "phone"],
+                           gen_customers(random.Random(f"{cfg.seed}-customer"), cfg, bases["Customer"]),
+                           cfg.customers, cfg.batch_size))
+        totals.append(load(connection, "Adopter", ["adopter_id", "customer_id"],
+                           gen_adopters(cfg, bases["Adopter"], bases["Customer"]), cfg.adopters, cfg.batch_size))
+        totals.append(load(connection, "Donor", ["donor_id", "customer_id", "amount"],
+                           gen_donors(random.Random(f"{cfg.seed}-donor"), cfg, bases["Donor"], bases["Customer"]),
+                           cfg.donors, cfg.batch_size))
+        totals.append(load(connection, "Animal",
+                           ["animal_id", "shelter_id", "name", "species", "breed", "age", "gender", "dob", "status"],
+                           gen_animals(random.Random(f"{cfg.seed}-animal"), cfg, bases["Animal"], bases["Shelter"], capacities),
+                           cfg.animals, cfg.batch_size))
+        totals.append(load(connection, "Adoption", ["adoption_id", "animal_id", "adopter_id", "employee_id", "adoption_date"],
+                           gen_adoptions(random.Random(f"{cfg.seed}-adoption"), cfg, bases["Adoption"],
+                                         bases["Animal"], bases["Adopter"], bases["Employee"]),
+                           cfg.adoptions, cfg.batch_size))
+        totals.append(load(connection, "Donation", ["donation_id", "donor_id", "shelter_id", "amount", "donation_date"],
+                           gen_donations(random.Random(f"{cfg.seed}-donation"), cfg, bases["Donation"],
+                                         bases["Donor"], bases["Shelter"]),
+                           cfg.donations, cfg.batch_size))
+        totals.append(load(connection, "SalaryChangeLog", ["employee_id", "old_salary", "new_salary"],
+                           gen_salary_changes(random.Random(f"{cfg.seed}-salary"), cfg, bases["Employee"], salaries),
+                           cfg.salary_changes, cfg.batch_size))
+        bump_table_versions(connection, ["Shelter", "Employee", "Customer", "Adopter", "Animal", "Adoption"])
+
+    except Error as e:
+        print(f"Error generating data: {e}")
+        connection.rollback()
+        return
+    finally:
+        connection.close()
+
+    rows = sum(done for done, _ in totals)
+    elapsed = time.perf_counter() - overall_start
+    print(f"\nGenerated {rows:,} rows in {elapsed:.1f}s ({rows / max(elapsed, 1e-9):,.0f} rows/sec overall).")
+
+
+if __name__ == "__main__":
+    main()
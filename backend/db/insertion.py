@@ -92,6 +92,16 @@ def insert_data(connection):
         
         print("Sample adoptions added. 'Multi-Adopter' report will now work.")
 
+        # TableVersion counters ek baar bump karo (triggers per-row bump nahi karte)
+        try:
+            cursor.execute(
+                "UPDATE `TableVersion` SET `version` = `version` + 1 WHERE `table_name` IN "
+                "('Shelter', 'Employee', 'Customer', 'Adopter', 'Animal', 'Adoption')"
+            )
+        except Error as e:
+            if e.errno != 1146: # Table doesn't exist (migration 002 abhi nahi chali)
+                raise
+
         connection.commit()
         print("All sample data inserted successfully (10+ entries).")
 
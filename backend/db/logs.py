@@ -0,0 +1,157 @@
+# backend/db/logs.py
+# Leveled logging for the API and the DB layer (request path par print() ki jagah).
+# Request thread sirf record ko queue mein daalta hai (QueueHandler); stdout par likhna
+# ek background thread (QueueListener) karta hai, isliye query functions log I/O par nahi rukte.
+#
+# - LOG_LEVEL=INFO                 DEBUG / INFO / WARNING / ERROR
+# - LOG_FORMAT=text                'text' ya 'json' (ek line = ek JSON object)
+# - LOG_SUCCESS_SAMPLE_RATE=0.1    routine success lines ka itna hissa hi likha jaata hai
+# - LOG_QUEUE_SIZE=10000           queue bhar jaaye toh naye INFO / DEBUG records drop (request kabhi block nahi hoti)
+# Errors hamesha log hote hain: queue bhari ho toh ERROR / CRITICAL seedha stderr par likhe jaate hain. Har line mein request ID hoti hai (app.py set karta hai).
+
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+LOG_FORMAT = os.environ.get('LOG_FORMAT', 'text').lower()
+LOG_SUCCESS_SAMPLE_RATE = float(os.environ.get('LOG_SUCCESS_SAMPLE_RATE', 0.1))
+LOG_QUEUE_SIZE = int(os.environ.get('LOG_QUEUE_SIZE', 10000))
+
+ROOT_LOGGER_NAME = 'pet_adoption'
+TEXT_FORMAT = '%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s'
+
+# Current request ka ID (Flask before_request set karta hai; background threads mein '-')
+request_id_var = contextvars.ContextVar('request_id', default='-')
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamps every record with the current request ID (runs in the caller's thread / task)."""
+
+    def filter(self, record):
+        record.request_id = request_id_var.get()
+        return True
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that never blocks the caller: a full queue drops the record and counts it.
+    ERROR and above are never dropped; with a full queue they are written to stderr right here.
+    Only the message is rendered here; timestamps / JSON are formatted on the writer thread.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self.overflow_formatter = logging.Formatter(TEXT_FORMAT)
+
+    def prepare(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno < logging.ERROR:
+                self.dropped += 1
+                return
+            # Writer thread peeche hai: error ko caller ke thread mein hi likh do
+            try:
+                sys.stderr.write(self.overflow_formatter.format(record) + '\n')
+                sys.stderr.flush()
+            except Exception:
+                self.handleError(record)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line (LOG_FORMAT=json)."""
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, 'request_id', '-'),
+            "message": record.getMessage(),
+        }
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+_queue_handler = None
+_listener = None
+
+
+def _start_listener():
+    global _listener
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonFormatter() if LOG_FORMAT == 'json' else logging.Formatter(TEXT_FORMAT))
+    _queue_handler.overflow_formatter = handler.formatter
+    _queue_handler.queue = queue.Queue(LOG_QUEUE_SIZE)
+    _listener = logging.handlers.QueueListener(_queue_handler.queue, handler)
+    _listener.start()
+
+
+def _stop_listener():
+    # Exit par queue mein bache records likh do
+    if _listener is not None:
+        _listener.stop()
+
+
+def configure_logging():
+    """Installs the queue handler on the 'pet_adoption' logger (once per process)."""
+    global _queue_handler
+    if _queue_handler is not None:
+        return
+    _queue_handler = NonBlockingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+    _queue_handler.addFilter(RequestIdFilter())
+
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    root.setLevel(LOG_LEVEL)
+    root.addHandler(_queue_handler)
+    root.propagate = False
+
+    _start_listener()
+    atexit.register(_stop_listener)
+
+
+def _restart_after_fork():
+    # Writer thread fork ke baad child mein nahi hota: nayi queue + naya thread
+    if _queue_handler is not None:
+        _start_listener()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_after_fork)
+
+
+def get_logger(name):
+    """Logger under 'pet_adoption' (e.g. get_logger('db.queries'))."""
+    configure_logging()
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+
+
+def log_success(logger, msg, *args):
+    """
+    Routine success line at INFO, written for LOG_SUCCESS_SAMPLE_RATE of the calls.
+    Dropped lines cost one random() call; errors go through logger.error() and are never sampled.
+    """
+    if LOG_SUCCESS_SAMPLE_RATE < 1.0 and random.random() >= LOG_SUCCESS_SAMPLE_RATE:
+        return
+    logger.info(msg, *args)
+
+
+def get_dropped_log_records():
+    return _queue_handler.dropped if _queue_handler is not None else 0
@@ -0,0 +1,307 @@
+# backend/db/metrics.py
+# In-process metrics (Prometheus text exposition format) for the API and the DB layer.
+# prometheus_client ki zaroorat nahi: sirf counters aur fixed-bucket histograms hain,
+# har observe() ek bisect + ek chhota lock hai, isliye production mein on rakh sakte hain.
+#
+# - Routes: app.py ke before/after_request hooks  -> http_request_duration_seconds
+# - DB functions: @timed_query                     -> db_function_duration_seconds
+# - Har statement: MetricsCursor / timed_execute    -> db_statement_duration_seconds,
+#                                                     db_rows_returned_total, db_errors_total
+# - Pool: connection.py                            -> db_pool_acquire_seconds
+
+import contextvars
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from inspect import iscoroutinefunction
+
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '1').lower() in ('1', 'true', 'yes')
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Kaunsa DB function abhi chal raha hai (statement metrics ka label)
+current_db_function = contextvars.ContextVar('current_db_function', default='other')
+
+# aiomysql/PyMySQL errors mein SQLSTATE nahi hota, isliye aam errno ka mapping
+ERRNO_SQLSTATES = {
+    1644: '45000',  # SIGNAL SQLSTATE '45000' (triggers / procedures)
+    1062: '23000', 1451: '23000', 1452: '23000', 1048: '23000',
+    1146: '42S02', 1054: '42S22', 1064: '42000',
+    1213: '40001', 1205: 'HY000',
+}
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs.extend(f'{name}="{value}"' for name, value in extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter with labels."""
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._values = {}   # label values tuple -> number
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for label_values, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labels, label_values)} {_format_number(value)}")
+        return lines
+
+
+class Histogram:
+    """Fixed-bucket histogram with labels (buckets are upper bounds, like Prometheus 'le')."""
+
+    def __init__(self, name, documentation, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._series = {}   # label values tuple -> [per-bucket counts (+Inf last), sum]
+
+    def observe(self, value, *label_values):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._series.items())
+        for label_values, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                labels = _format_labels(self.labels, label_values, extra=[('le', _format_number(bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels, label_values)
+            lines.append(f"{self.name}_sum{labels} {total!r}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+_registry = []
+_collectors = []    # callables returning gauge families (pool / cache stats)
+
+
+def _register(metric):
+    _registry.append(metric)
+    return metric
+
+
+def register_collector(collector):
+    """
+    `collector()` is called on every scrape and returns a list of gauge families:
+    (name, documentation, label names, [(label values, value), ...]).
+    Families with the same name from different collectors are merged.
+    """
+    _collectors.append(collector)
+
+
+HTTP_REQUEST_DURATION = _register(Histogram(
+    'http_request_duration_seconds', 'HTTP request latency by route template.',
+    labels=('method', 'route', 'status')))
+DB_FUNCTION_DURATION = _register(Histogram(
+    'db_function_duration_seconds', 'Wall time of DB layer functions (pool wait + queries).',
+    labels=('function',)))
+DB_STATEMENT_DURATION = _register(Histogram(
+    'db_statement_duration_seconds', 'Time spent executing SQL statements (server + network).',
+    labels=('function',)))
+DB_ROWS_RETURNED = _register(Counter(
+    'db_rows_returned_total', 'Rows fetched from MySQL.', labels=('function',)))
+DB_ERRORS = _register(Counter(
+    'db_errors_total', 'MySQL errors by SQLSTATE (45000 = trigger / procedure SIGNAL).',
+    labels=('function', 'sqlstate', 'errno')))
+DB_POOL_ACQUIRE = _register(Histogram(
+    'db_pool_acquire_seconds', 'Time to borrow a connection from the pool.',
+    labels=('pool',)))
+
+
+# Sync aur async pool dono yahi gauges dete hain (pool label alag)
+POOL_GAUGES = (("in_use", "Connections currently borrowed."),
+               ("idle", "Idle connections in the pool."),
+               ("max_size", "Pool size limit."))
+
+
+# --- recording helpers ---
+def observe_request(method, route, status, seconds):
+    HTTP_REQUEST_DURATION.observe(seconds, method, route, str(status))
+
+
+def observe_pool_acquire(pool, seconds):
+    if METRICS_ENABLED:
+        DB_POOL_ACQUIRE.observe(seconds, pool)
+
+
+def count_rows(count):
+    if METRICS_ENABLED and count:
+        DB_ROWS_RETURNED.inc(current_db_function.get(), amount=count)
+
+
+def count_db_error(e, function=None):
+    """Counts one MySQL error (mysql-connector or PyMySQL/aiomysql exception)."""
+    if not METRICS_ENABLED:
+        return
+    errno = getattr(e, 'errno', None)
+    if errno is None and e.args and isinstance(e.args[0], int):
+        errno = e.args[0]   # PyMySQL: args = (errno, message)
+    sqlstate = getattr(e, 'sqlstate', None) or ERRNO_SQLSTATES.get(errno, 'HY000')
+    DB_ERRORS.inc(function or current_db_function.get(), sqlstate, str(errno))
+
+
+def timed_query(func):
+    """
+    Decorator for DB layer functions (sync or async).
+    Records the call's wall time and labels every statement it runs with its name.
+    """
+    name = func.__name__
+
+    if iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if not METRICS_ENABLED:
+                return await func(*args, **kwargs)
+            token = current_db_function.set(name)
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                DB_FUNCTION_DURATION.observe(time.perf_counter() - start, name)
+                current_db_function.reset(token)
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not METRICS_ENABLED:
+            return func(*args, **kwargs)
+        token = current_db_function.set(name)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            DB_FUNCTION_DURATION.observe(time.perf_counter() - start, name)
+            current_db_function.reset(token)
+    return wrapper
+
+
+class MetricsCursor:
+    """
+    Wraps a mysql-connector cursor: times execute()/callproc(), counts fetched rows
+    and MySQL errors. The function label is fixed when the cursor is created, so rows
+    fetched later (e.g. a streaming export generator) still count for the right function.
+    """
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self._function = current_db_function.get()
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def _timed(self, method, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        except Exception as e:
+            if hasattr(e, 'errno'):
+                count_db_error(e, self._function)
+            raise
+        finally:
+            DB_STATEMENT_DURATION.observe(time.perf_counter() - start, self._function)
+
+    def execute(self, *args, **kwargs):
+        return self._timed(self._cursor.execute, *args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        return self._timed(self._cursor.executemany, *args, **kwargs)
+
+    def callproc(self, *args, **kwargs):
+        return self._timed(self._cursor.callproc, *args, **kwargs)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            DB_ROWS_RETURNED.inc(self._function)
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        if rows:
+            DB_ROWS_RETURNED.inc(self._function, amount=len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        if rows:
+            DB_ROWS_RETURNED.inc(self._function, amount=len(rows))
+        return rows
+
+
+async def timed_execute(cursor, query, params=None):
+    """`await cursor.execute(query, params)` for aiomysql cursors, with statement time and error counts."""
+    if not METRICS_ENABLED:
+        return await cursor.execute(query, params)
+    start = time.perf_counter()
+    try:
+        return await cursor.execute(query, params)
+    except Exception as e:
+        if e.args and isinstance(e.args[0], int):
+            count_db_error(e)
+        raise
+    finally:
+        DB_STATEMENT_DURATION.observe(time.perf_counter() - start, current_db_function.get())
+
+
+def render_metrics():
+    """Every metric in Prometheus text exposition format (version 0.0.4)."""
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+
+    gauges = {}     # name -> (documentation, labels, samples)
+    for collector in list(_collectors):
+        try:
+            for name, documentation, labels, samples in collector():
+                gauges.setdefault(name, (documentation, labels, []))[2].extend(samples)
+        except Exception as e:
+            # Ek collector ki galti poora scrape na tode
+            logging.getLogger('pet_adoption.metrics').error(
+                "Error in metrics collector %s: %s", getattr(collector, '__name__', collector), e)
+    for name, (documentation, labels, samples) in gauges.items():
+        lines.append(f"# HELP {name} {documentation}")
+        lines.append(f"# TYPE {name} gauge")
+        for label_values, value in samples:
+            lines.append(f"{name}{_format_labels(labels, label_values)} {_format_number(value)}")
+    return '\n'.join(lines) + '\n'
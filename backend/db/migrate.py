@@ -0,0 +1,347 @@
+# backend/db/migrate.py
+# Versioned, incremental schema migrations.
+# schema.sql har baar DROP + CREATE karta hai; production mein yeh nahi chal sakta.
+# Yeh runner `SchemaMigration` table mein applied version yaad rakhta hai aur
+# migrations/ folder ki sirf NAYI files (001_..., 002_..., ...) order mein chalata hai.
+#
+# Usage (backend folder se):
+#   python db/migrate.py              # pending migrations apply karo
+#   python db/migrate.py --dry-run    # kya chalega + expected lock / rebuild cost
+#   python db/migrate.py --status
+#   python db/migrate.py --baseline 1 # purani DB: 001 pehle se applied hai, sirf record karo
+
+import argparse
+import hashlib
+import os
+import re
+import time
+
+from mysql.connector import Error
+from connection import get_db_connection
+from sql_script import split_sql_commands
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), 'migrations')
+MIGRATION_FILE_RE = re.compile(r'^(\d+)_([\w\-]+)\.sql$')
+
+# MySQL: "ALGORITHM=... is not supported for this operation"
+ONLINE_DDL_NOT_SUPPORTED = (1845, 1846)
+
+ALGORITHM_ORDER = ["INSTANT", "INPLACE", "COPY"]
+LOCK_ORDER = ["NONE", "SHARED", "EXCLUSIVE"]
+
+
+# --- Discovery / bookkeeping ---
+
+def discover_migrations():
+    """Returns migrations/ files sorted by version: list of dicts."""
+    migrations = []
+    if not os.path.isdir(MIGRATIONS_DIR):
+        return migrations
+    for file_name in os.listdir(MIGRATIONS_DIR):
+        match = MIGRATION_FILE_RE.match(file_name)
+        if not match:
+            continue
+        path = os.path.join(MIGRATIONS_DIR, file_name)
+        with open(path, 'rb') as f:
+            checksum = hashlib.sha256(f.read()).hexdigest()
+        migrations.append({"version": int(match.group(1)), "name": match.group(2),
+                           "path": path, "checksum": checksum})
+    migrations.sort(key=lambda m: m["version"])
+
+    versions = [m["version"] for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError("Duplicate migration version numbers in migrations/")
+    return migrations
+
+
+def ensure_migration_table(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS `SchemaMigration` (
+          `version` INT PRIMARY KEY,
+          `name` VARCHAR(255) NOT NULL,
+          `checksum` CHAR(64) NOT NULL,
+          `duration_ms` INT,
+          `applied_at` TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def applied_migrations(cursor):
+    """Returns {version: checksum} of already applied migrations."""
+    cursor.execute("SELECT `version`, `checksum` FROM `SchemaMigration`")
+    return {version: checksum for version, checksum in cursor.fetchall()}
+
+
+def record_migration(cursor, migration, duration_ms):
+    cursor.execute(
+        "INSERT INTO `SchemaMigration` (`version`, `name`, `checksum`, `duration_ms`) VALUES (%s, %s, %s, %s)",
+        (migration["version"], migration["name"], migration["checksum"], duration_ms)
+    )
+
+
+# --- Lock / rebuild cost estimation (dry-run) ---
+
+def _worst(values, order):
+    return max(values, key=order.index)
+
+
+def classify_statement(sql):
+    """
+    Estimates how MySQL 8 (InnoDB) will execute a statement.
+    Returns dict: kind, table, algorithm, lock, rebuild, note
+    """
+    text = ' '.join(sql.split())
+    upper = text.upper()
+    table_match = re.search(r'(?:ALTER TABLE|CREATE TABLE(?: IF NOT EXISTS)?|DROP TABLE(?: IF EXISTS)?|'
+                            r'INSERT INTO|UPDATE|DELETE FROM|ON|INTO TABLE)\s+`?(\w+)`?', text, re.IGNORECASE)
+    table = table_match.group(1) if table_match else None
+    result = {"kind": "other", "table": table, "algorithm": None, "lock": None, "rebuild": False, "note": ""}
+
+    if upper.startswith("CREATE TABLE"):
+        result.update(kind="create table", algorithm="INSTANT", lock="NONE", note="new table")
+    elif upper.startswith("DROP TABLE"):
+        result.update(kind="drop table", lock="EXCLUSIVE", note="DESTRUCTIVE: table data is lost")
+    elif re.match(r'(CREATE|DROP)\s+(DEFINER\s*=\s*\S+\s+)?(TRIGGER|PROCEDURE|FUNCTION|VIEW)', upper) \
+            or upper.startswith("CREATE OR REPLACE VIEW"):
+        result.update(kind="routine/trigger", lock="NONE",
+                      note="brief metadata lock on the table (waits for running transactions)")
+    elif upper.startswith("USE ") or upper.startswith("SET "):
+        result.update(kind="session")
+    elif re.match(r'CREATE\s+(UNIQUE\s+|FULLTEXT\s+)?INDEX', upper) or upper.startswith("ALTER TABLE"):
+        result.update(kind="alter table")
+        _classify_alter(upper, result)
+    elif re.match(r'(INSERT|UPDATE|DELETE|REPLACE|LOAD DATA)', upper):
+        result.update(kind="dml", lock="NONE", note="row locks on affected rows; cost grows with rows touched")
+    return result
+
+
+def _classify_alter(upper, result):
+    ops = []  # (algorithm, lock, rebuild, note)
+    if re.search(r'FULLTEXT', upper):
+        ops.append(("INPLACE", "SHARED", True, "FULLTEXT index: writes blocked, first one rebuilds the table"))
+    elif re.search(r'\bADD\s+(UNIQUE\s+)?(INDEX|KEY)\b|CREATE\s+(UNIQUE\s+)?INDEX', upper):
+        ops.append(("INPLACE", "NONE", False, "secondary index build, concurrent DML allowed"))
+    if re.search(r'\bDROP\s+(INDEX|KEY)\b', upper):
+        ops.append(("INPLACE", "NONE", False, "metadata-only index drop"))
+    if re.search(r'\b(ADD|DROP)\s+PRIMARY\s+KEY\b', upper):
+        ops.append(("INPLACE", "NONE", True, "primary key change rebuilds the table"))
+    if re.search(r'\bADD\s+(CONSTRAINT\s+\S+\s+)?FOREIGN\s+KEY\b', upper):
+        ops.append(("COPY", "SHARED", True, "FOREIGN KEY needs COPY unless foreign_key_checks=0"))
+    if re.search(r'\bADD\s+(CONSTRAINT\s+\S+\s+)?CHECK\b', upper):
+        ops.append(("COPY", "SHARED", True, "CHECK constraint validates every row (COPY)"))
+    if re.search(r'\bADD\s+(COLUMN\s+)?`?\w+`?\s+(INT|BIGINT|SMALLINT|TINYINT|VARCHAR|CHAR|DECIMAL|DATE|'
+                 r'DATETIME|TIMESTAMP|TEXT|BOOLEAN|ENUM|FLOAT|DOUBLE)', upper):
+        ops.append(("INSTANT", "NONE", False, "ADD COLUMN is INSTANT on MySQL 8.0.12+"))
+    if re.search(r'\bDROP\s+COLUMN\b', upper):
+        ops.append(("INPLACE", "NONE", True, "DROP COLUMN rebuilds (INSTANT on MySQL 8.0.29+)"))
+    if re.search(r'\b(MODIFY|CHANGE)\s+(COLUMN\s+)?', upper):
+        ops.append(("COPY", "SHARED", True, "column type change copies the table, writes blocked"))
+    if re.search(r'\bRENAME\b', upper):
+        ops.append(("INSTANT", "NONE", False, "rename is metadata-only"))
+    if re.search(r'\b(ENGINE\s*=|FORCE\b|CONVERT TO)', upper):
+        ops.append(("INPLACE", "NONE", True, "table rebuild"))
+
+    if not ops:
+        ops.append(("COPY", "SHARED", True, "unrecognised ALTER, assuming worst case"))
+
+    result["algorithm"] = _worst([op[0] for op in ops], ALGORITHM_ORDER)
+    result["lock"] = _worst([op[1] for op in ops], LOCK_ORDER)
+    result["rebuild"] = any(op[2] for op in ops)
+    result["note"] = "; ".join(op[3] for op in ops)
+
+    # Explicit ALGORITHM / LOCK clause wins over the estimate
+    explicit_algorithm = re.search(r'ALGORITHM\s*=\s*(\w+)', upper)
+    explicit_lock = re.search(r'LOCK\s*=\s*(\w+)', upper)
+    if explicit_algorithm and explicit_algorithm.group(1) in ALGORITHM_ORDER:
+        result["algorithm"] = explicit_algorithm.group(1)
+    if explicit_lock and explicit_lock.group(1) in LOCK_ORDER:
+        result["lock"] = explicit_lock.group(1)
+
+
+def table_size(cursor, db_name, table):
+    """(approx rows, size in MB) from information_schema, or (None, None)."""
+    if not table:
+        return (None, None)
+    cursor.execute(
+        "SELECT `TABLE_ROWS`, (`DATA_LENGTH` + `INDEX_LENGTH`) / 1048576 FROM information_schema.TABLES "
+        "WHERE `TABLE_SCHEMA` = %s AND `TABLE_NAME` = %s",
+        (db_name, table)
+    )
+    row = cursor.fetchone()
+    return (row[0], float(row[1] or 0)) if row else (None, None)
+
+
+def with_online_ddl_options(sql):
+    """
+    ALTER TABLE bina ALGORITHM/LOCK clause ke ho toh online options jod do.
+    Returns the rewritten statement, or None if nothing should be added.
+    """
+    info = classify_statement(sql)
+    upper = sql.upper()
+    if not upper.lstrip().startswith("ALTER TABLE") or "ALGORITHM" in upper or "LOCK" in upper:
+        return None
+    if info["algorithm"] == "INSTANT":
+        return sql.rstrip() + ", ALGORITHM=INSTANT"
+    if info["algorithm"] == "INPLACE" and info["lock"] == "NONE":
+        return sql.rstrip() + ", ALGORITHM=INPLACE, LOCK=NONE"
+    return None
+
+
+# --- Runner ---
+
+def _short(sql, width=90):
+    text = ' '.join(sql.split())
+    return text if len(text) <= width else text[:width - 3] + '...'
+
+
+def dry_run(cursor, db_name, pending):
+    """Prints every pending statement with its expected lock / rebuild cost."""
+    if not pending:
+        print("No pending migrations.")
+        return
+    for migration in pending:
+        print(f"\n[{migration['version']:03d}] {migration['name']}")
+        with open(migration["path"], 'r', encoding='utf-8') as f:
+            commands = list(split_sql_commands(f.read()))
+        for number, command in enumerate(commands, start=1):
+            info = classify_statement(command)
+            rows, size_mb = table_size(cursor, db_name, info["table"])
+            size = f" | {info['table']}: ~{rows:,} rows, {size_mb:.1f} MB" if rows is not None else ""
+            cost = f"{info['algorithm'] or '-'}, LOCK={info['lock'] or '-'}, " \
+                   f"{'REBUILD' if info['rebuild'] else 'no rebuild'}"
+            print(f"  {number}. {_short(command)}")
+            print(f"     -> {info['kind']}: {cost}{size}")
+            if info["note"]:
+                print(f"        {info['note']}")
+
+
+def apply_migration(connection, migration):
+    """Runs one migration file statement by statement. Returns True on success."""
+    cursor = connection.cursor()
+    with open(migration["path"], 'r', encoding='utf-8') as f:
+        commands = list(split_sql_commands(f.read()))
+
+    print(f"\nApplying [{migration['version']:03d}] {migration['name']} ({len(commands)} statements)")
+    start = time.perf_counter()
+    try:
+        for number, command in enumerate(commands, start=1):
+            step_start = time.perf_counter()
+            online = with_online_ddl_options(command)
+            try:
+                cursor.execute(online or command)
+            except Error as e:
+                if online and e.errno in ONLINE_DDL_NOT_SUPPORTED:
+                    # Online DDL support nahi hai, normal tarike se chalao
+                    print(f"  (online DDL not supported here, falling back: {e.msg})")
+                    cursor.execute(command)
+                else:
+                    raise
+            print(f"  {number}. {_short(command, 70)}  [{(time.perf_counter() - step_start) * 1000:.0f} ms]")
+
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        record_migration(cursor, migration, duration_ms)
+        connection.commit()
+        print(f"Applied [{migration['version']:03d}] in {duration_ms} ms")
+        return True
+
+    except Error as e:
+        print(f"\n--- ERROR in migration {migration['version']:03d}, statement {number} ---")
+        print(f"Error: {e}")
+        print(f"Failed Command: {_short(command, 300)}")
+        print("DDL is not transactional in MySQL: statements before this one stay applied.")
+        connection.rollback()
+        return False
+    finally:
+        cursor.close()
+
+
+def run_migrations(db_name, dry=False, target=None, baseline=None, status=False, connection=None):
+    """
+    Applies pending migrations (or just reports them). Returns True on success.
+    Pass an open connection to reuse it (it is left open for the caller).
+    """
+    try:
+        migrations = discover_migrations()
+    except ValueError as e:
+        print(f"Error: {e}")
+        return False
+
+    own_connection = connection is None
+    if own_connection:
+        connection = get_db_connection(db_name)
+    cursor = connection.cursor()
+    try:
+        ensure_migration_table(cursor)
+        connection.commit()
+        applied = applied_migrations(cursor)
+
+        for migration in migrations:
+            recorded = applied.get(migration["version"])
+            if recorded and recorded != migration["checksum"]:
+                print(f"WARNING: migration {migration['version']:03d} changed after it was applied "
+                      f"(add a new migration instead of editing old ones).")
+
+        if baseline is not None:
+            for migration in migrations:
+                if migration["version"] <= baseline and migration["version"] not in applied:
+                    record_migration(cursor, migration, 0)
+                    applied[migration["version"]] = migration["checksum"]
+                    print(f"Baselined [{migration['version']:03d}] {migration['name']} (not executed)")
+            connection.commit()
+
+        pending = [m for m in migrations
+                   if m["version"] not in applied and (target is None or m["version"] <= target)]
+        current = max(applied) if applied else 0
+
+        if status:
+            print(f"Current schema version: {current}")
+            for migration in migrations:
+                state = "applied" if migration["version"] in applied else "pending"
+                print(f"  [{migration['version']:03d}] {migration['name']:40} {state}")
+            return True
+
+        if dry:
+            print(f"Current schema version: {current}. Dry run, nothing will be executed.")
+            dry_run(cursor, db_name, pending)
+            return True
+
+        if not pending:
+            print(f"Schema is up to date (version {current}).")
+            return True
+
+        for migration in pending:
+            if not apply_migration(connection, migration):
+                return False
+        print(f"\nSchema is now at version {pending[-1]['version']}.")
+        return True
+
+    except Error as e:
+        print(f"Error running migrations: {e}")
+        return False
+    finally:
+        cursor.close()
+        if own_connection:
+            connection.close()
+
+
+def main():
+    dotenv_path = os.path.join(os.path.dirname(__file__), '..', '.env')
+    from dotenv import load_dotenv
+    load_dotenv(dotenv_path=dotenv_path)
+
+    parser = argparse.ArgumentParser(description="Apply numbered migrations from backend/db/migrations/.")
+    parser.add_argument("--dry-run", action="store_true", help="show pending steps with expected lock/rebuild cost")
+    parser.add_argument("--status", action="store_true", help="list applied and pending migrations")
+    parser.add_argument("--target", type=int, default=None, help="only apply migrations up to this version")
+    parser.add_argument("--baseline", type=int, default=None,
+                        help="mark migrations up to this version as applied without running them")
+    args = parser.parse_args()
+
+    db_name = os.environ.get('DB_NAME', 'pet_adoption_db')
+    ok = run_migrations(db_name, dry=args.dry_run, target=args.target, baseline=args.baseline, status=args.status)
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+/* backend/db/migrations/001_hot_path_indexes.sql */
+/* Secondary indexes for the hot query paths. Sirf ADD INDEX hai, koi DROP TABLE nahi, */
+/* isliye live database par chala sakte ho. InnoDB inhe online (INPLACE, LOCK=NONE) banata hai. */
+
+/* /api/animals?status=Available (keyset pagination on animal_id). */
+/* InnoDB secondary index mein PK apne aap hota hai, toh yeh (status, animal_id) ki tarah kaam karta hai. */
+ALTER TABLE `Animal`
+  ADD INDEX `idx_animal_status` (`status`),
+  ALGORITHM=INPLACE, LOCK=NONE;
+
+/* Shelter occupancy report: LEFT JOIN Animal ON shelter_id AND status = 'Available'. */
+/* (shelter_id, status) + implicit animal_id = covering index for COUNT(a.animal_id). */
+ALTER TABLE `Animal`
+  ADD INDEX `idx_animal_shelter_status` (`shelter_id`, `status`),
+  ALGORITHM=INPLACE, LOCK=NONE;
+
+/* Employees-above-average report: AVG(salary) and salary > X ORDER BY salary DESC. */
+/* (salary, name, role) + implicit employee_id covers the whole report query. */
+ALTER TABLE `Employee`
+  ADD INDEX `idx_employee_salary_cover` (`salary`, `name`, `role`),
+  ALGORITHM=INPLACE, LOCK=NONE;
+
+/* Multi-adopters report: GROUP BY adopter_id with COUNT(adoption_id). */
+/* (adopter_id, adoption_id) covers it explicitly instead of relying on the FK's auto-created index. */
+ALTER TABLE `Adoption`
+  ADD INDEX `idx_adoption_adopter` (`adopter_id`, `adoption_id`),
+  ALGORITHM=INPLACE, LOCK=NONE;
@@ -0,0 +1,18 @@
+/* backend/db/migrations/002_table_versions.sql */
+/* Per-table change counters for conditional GET (ETag / 304). */
+/* Counters har write transaction mein commit se theek pehle ek baar badhte hain: update_delete.py / */
+/* async_update_delete.py ka bump_table_versions(), procedures.sql ke procedures aur reconcile.py / */
+/* generate_data.py / insertion.py. Triggers counters nahi badhate: app ke bahar (manual SQL, doosre tools) */
+/* ke writes ko khud 'UPDATE TableVersion SET version = version + 1 WHERE table_name IN (...)' chalana */
+/* hoga, warna ETag nahi badlega aur clients ko purana data 304 ke saath milta rahega. */
+/* Live DB par yeh migration chalane ke baad procedures.sql bhi chalao */
+/* ('python db/creation.py --migrations-only' dono karta hai). */
+
+CREATE TABLE IF NOT EXISTS `TableVersion` (
+  `table_name` VARCHAR(64) PRIMARY KEY,
+  `version` BIGINT UNSIGNED NOT NULL DEFAULT 0
+);
+
+/* Pehle se maujood rows ko mat chhuo (INSERT IGNORE) */
+INSERT IGNORE INTO `TableVersion` (`table_name`, `version`)
+VALUES ('Shelter', 1), ('Animal', 1), ('Employee', 1), ('Customer', 1), ('Adopter', 1), ('Adoption', 1);
@@ -0,0 +1,23 @@
+/* backend/db/migrations/003_shelter_animal_summary.sql */
+/* Per-shelter animal counts by status, for the shelter occupancy report. */
+/* Backfill ke baad triggers.sql + procedures.sql chalao (trg_animal_summary_*, AdjustShelterSummary), */
+/* fir 'python db/reconcile.py --repair' beech mein hue writes ko theek kar dega. */
+
+CREATE TABLE IF NOT EXISTS `ShelterAnimalSummary` (
+  `shelter_id` INT PRIMARY KEY,
+  `available_count` INT NOT NULL DEFAULT 0,
+  `pending_count` INT NOT NULL DEFAULT 0,
+  `adopted_count` INT NOT NULL DEFAULT 0,
+  FOREIGN KEY (`shelter_id`) REFERENCES `Shelter`(`shelter_id`) ON DELETE CASCADE
+);
+
+/* Ek baar poora recount (idx_animal_shelter_status se) */
+INSERT IGNORE INTO `ShelterAnimalSummary` (`shelter_id`, `available_count`, `pending_count`, `adopted_count`)
+SELECT
+    s.`shelter_id`,
+    COUNT(CASE WHEN a.`status` = 'Available' THEN 1 END),
+    COUNT(CASE WHEN a.`status` = 'Pending' THEN 1 END),
+    COUNT(CASE WHEN a.`status` = 'Adopted' THEN 1 END)
+FROM `Shelter` s
+LEFT JOIN `Animal` a ON a.`shelter_id` = s.`shelter_id`
+GROUP BY s.`shelter_id`;
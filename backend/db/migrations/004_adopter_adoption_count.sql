@@ -0,0 +1,17 @@
+/* backend/db/migrations/004_adopter_adoption_count.sql */
+/* Per-adopter adoption counter for the multi-adopters and top-adopters reports. */
+/* Backfill ke baad triggers.sql chalao (trg_adoption_count_*), */
+/* fir 'python db/reconcile.py --repair' beech mein hue writes ko theek kar dega. */
+
+CREATE TABLE IF NOT EXISTS `AdopterAdoptionCount` (
+  `adopter_id` INT PRIMARY KEY,
+  `adoption_count` INT NOT NULL DEFAULT 0,
+  INDEX `idx_adoption_count` (`adoption_count`),
+  FOREIGN KEY (`adopter_id`) REFERENCES `Adopter`(`adopter_id`) ON DELETE CASCADE
+);
+
+/* Ek baar poora recount (idx_adoption_adopter se) */
+INSERT IGNORE INTO `AdopterAdoptionCount` (`adopter_id`, `adoption_count`)
+SELECT `adopter_id`, COUNT(*)
+FROM `Adoption`
+GROUP BY `adopter_id`;
@@ -0,0 +1,39 @@
+/* backend/db/migrations/005_salary_stats.sql */
+/* Running salary aggregates + histogram for the salary reports. */
+/* Backfill ke baad triggers.sql + procedures.sql chalao (trg_employee_salary_stats_*, AdjustSalaryStats), */
+/* fir 'python db/reconcile.py --repair' beech mein hue writes ko theek kar dega. */
+
+/* Salary ke running aggregates (Employee triggers maintain karte hain). */
+/* scope: 'all' (scope_key ''), 'role' (role ka naam), 'shelter' (shelter_id). NULL salary gini nahi jaati. */
+CREATE TABLE IF NOT EXISTS `SalaryStats` (
+  `scope` VARCHAR(10) NOT NULL,
+  `scope_key` VARCHAR(50) NOT NULL,
+  `salary_count` INT NOT NULL DEFAULT 0,
+  `salary_sum` DECIMAL(20, 2) NOT NULL DEFAULT 0,
+  PRIMARY KEY (`scope`, `scope_key`)
+);
+
+/* Salary histogram: fixed-width buckets (AdjustSalaryStats mein width 5000) */
+CREATE TABLE IF NOT EXISTS `SalaryHistogram` (
+  `bucket_start` DECIMAL(10, 2) PRIMARY KEY,
+  `employee_count` INT NOT NULL DEFAULT 0
+);
+
+/* Ek baar poora recount */
+INSERT IGNORE INTO `SalaryStats` (`scope`, `scope_key`, `salary_count`, `salary_sum`)
+SELECT 'all', '', COUNT(`salary`), COALESCE(SUM(`salary`), 0) FROM `Employee`;
+
+INSERT IGNORE INTO `SalaryStats` (`scope`, `scope_key`, `salary_count`, `salary_sum`)
+SELECT 'role', COALESCE(`role`, ''), COUNT(*), SUM(`salary`)
+FROM `Employee` WHERE `salary` IS NOT NULL
+GROUP BY COALESCE(`role`, '');
+
+INSERT IGNORE INTO `SalaryStats` (`scope`, `scope_key`, `salary_count`, `salary_sum`)
+SELECT 'shelter', COALESCE(CAST(`shelter_id` AS CHAR), ''), COUNT(*), SUM(`salary`)
+FROM `Employee` WHERE `salary` IS NOT NULL
+GROUP BY COALESCE(CAST(`shelter_id` AS CHAR), '');
+
+INSERT IGNORE INTO `SalaryHistogram` (`bucket_start`, `employee_count`)
+SELECT FLOOR(`salary` / 5000) * 5000, COUNT(*)
+FROM `Employee` WHERE `salary` IS NOT NULL
+GROUP BY FLOOR(`salary` / 5000) * 5000;
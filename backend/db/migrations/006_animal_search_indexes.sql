@@ -0,0 +1,30 @@
+/* backend/db/migrations/006_animal_search_indexes.sql */
+/* Indexes for /api/animals/search (IN-lists, ranges, sort columns, full-text name/breed). */
+/* shelter_id filter ke liye idx_animal_shelter_status (migration 001) pehle se hai. */
+
+/* ?species=Dog,Cat&breed=... : IN-list on species, then breed inside each species. */
+ALTER TABLE `Animal`
+  ADD INDEX `idx_animal_species_breed` (`species`, `breed`),
+  ALGORITHM=INPLACE, LOCK=NONE;
+
+/* min_age / max_age range + sort=age. Implicit animal_id = (age, animal_id) keyset order. */
+ALTER TABLE `Animal`
+  ADD INDEX `idx_animal_age` (`age`),
+  ALGORITHM=INPLACE, LOCK=NONE;
+
+/* dob_from / dob_to range + sort=dob. */
+ALTER TABLE `Animal`
+  ADD INDEX `idx_animal_dob` (`dob`),
+  ALGORITHM=INPLACE, LOCK=NONE;
+
+/* sort=name (keyset on (name, animal_id)). */
+ALTER TABLE `Animal`
+  ADD INDEX `idx_animal_name` (`name`),
+  ALGORITHM=INPLACE, LOCK=NONE;
+
+/* ?q= prefix search: MATCH(name, breed) AGAINST ('+gold*' IN BOOLEAN MODE). */
+/* Table ka pehla FULLTEXT index table rebuild karta hai (FTS_DOC_ID column) aur build ke dauraan */
+/* writes block rehte hain (LOCK=SHARED), isliye bade database par low-traffic time mein chalao. */
+ALTER TABLE `Animal`
+  ADD FULLTEXT INDEX `ft_animal_name_breed` (`name`, `breed`),
+  ALGORITHM=INPLACE, LOCK=SHARED;
@@ -43,6 +43,10 @@ BEGIN
         SELECT * FROM `Adoption` 
         WHERE `adoption_id` = LAST_INSERT_ID();
 
+        /* 4. ETag counters: ek baar, commit se theek pehle (animal status se occupancy bhi badli) */
+        UPDATE `TableVersion` SET `version` = `version` + 1
+        WHERE `table_name` IN ('Adoption', 'Animal', 'Shelter');
+
         COMMIT;
     END IF;
 
@@ -84,6 +88,10 @@ BEGIN
     JOIN `Adopter` a ON c.customer_id = a.customer_id
     WHERE c.customer_id = new_customer_id;
 
+    /* ETag counters: ek baar, commit se theek pehle */
+    UPDATE `TableVersion` SET `version` = `version` + 1
+    WHERE `table_name` IN ('Customer', 'Adopter');
+
     COMMIT;
 END$$
 DELIMITER ;
@@ -124,6 +132,125 @@ BEGIN
     JOIN `Donor` d ON c.customer_id = d.customer_id
     WHERE c.customer_id = new_customer_id;
 
+    /* ETag counters: ek baar, commit se theek pehle */
+    UPDATE `TableVersion` SET `version` = `version` + 1
+    WHERE `table_name` IN ('Customer', 'Donor');
+
     COMMIT;
 END$$
-DELIMITER ;
\ No newline at end of file
+DELIMITER ;
+
+/* --- Procedure 4: CreateAdoptionInBatch (NO transaction control) --- */
+/* Batch adoption ke liye: transaction/savepoint Python side se control hota hai, */
+/* isliye yahan START TRANSACTION / COMMIT / ROLLBACK nahi hai. */
+/* TableVersion counters bhi Python poore batch ke liye ek baar badhata hai. */
+DROP PROCEDURE IF EXISTS `CreateAdoptionInBatch`;
+DELIMITER $$
+CREATE PROCEDURE `CreateAdoptionInBatch` (
+    IN p_animal_id INT,
+    IN p_adopter_id INT,
+    IN p_employee_id INT
+)
+BEGIN
+    DECLARE animal_current_status VARCHAR(20);
+
+    /* Row lock le lo taaki do batches ek hi animal adopt na kar sakein */
+    SELECT `status` INTO animal_current_status
+    FROM `Animal`
+    WHERE `animal_id` = p_animal_id
+    FOR UPDATE;
+
+    IF animal_current_status IS NULL THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Error: Animal not found.';
+    ELSEIF animal_current_status != 'Available' THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Error: This animal is not available for adoption.';
+    END IF;
+
+    INSERT INTO `Adoption` (`animal_id`, `adopter_id`, `employee_id`, `adoption_date`)
+    VALUES (p_animal_id, p_adopter_id, p_employee_id, CURDATE());
+
+    UPDATE `Animal`
+    SET `status` = 'Adopted'
+    WHERE `animal_id` = p_animal_id;
+
+    SELECT * FROM `Adoption`
+    WHERE `adoption_id` = LAST_INSERT_ID();
+END$$
+DELIMITER ;
+
+
+/* --- Procedure 5: AdjustShelterSummary (triggers se call hota hai) --- */
+/* ShelterAnimalSummary mein ek shelter ki ek status waali ginti ko p_delta se badlo. */
+/* Koi transaction control nahi: yeh trigger waale statement ka hi hissa hai. */
+DROP PROCEDURE IF EXISTS `AdjustShelterSummary`;
+DELIMITER $$
+CREATE PROCEDURE `AdjustShelterSummary` (
+    IN p_shelter_id INT,
+    IN p_status VARCHAR(20),
+    IN p_delta INT
+)
+BEGIN
+    DECLARE v_available INT DEFAULT 0;
+    DECLARE v_pending INT DEFAULT 0;
+    DECLARE v_adopted INT DEFAULT 0;
+
+    IF p_shelter_id IS NOT NULL THEN
+        IF p_status = 'Available' THEN
+            SET v_available = p_delta;
+        ELSEIF p_status = 'Pending' THEN
+            SET v_pending = p_delta;
+        ELSEIF p_status = 'Adopted' THEN
+            SET v_adopted = p_delta;
+        END IF;
+
+        /* Row na ho (jaise migration se pehle ka shelter) toh bana do */
+        INSERT INTO `ShelterAnimalSummary` (`shelter_id`, `available_count`, `pending_count`, `adopted_count`)
+        VALUES (p_shelter_id, GREATEST(v_available, 0), GREATEST(v_pending, 0), GREATEST(v_adopted, 0))
+        ON DUPLICATE KEY UPDATE
+            `available_count` = `available_count` + v_available,
+            `pending_count` = `pending_count` + v_pending,
+            `adopted_count` = `adopted_count` + v_adopted;
+    END IF;
+END$$
+DELIMITER ;
+
+
+/* --- Procedure 6: AdjustSalaryStats (triggers se call hota hai) --- */
+/* Ek employee ki salary ko SalaryStats ('all', role, shelter) aur SalaryHistogram mein */
+/* p_delta (+1 / -1) ke saath jodo ya hatao. 'all' row hamesha pehle: reconcile.py isi row */
+/* ko lock karke saare writers ko rokta hai. Koi transaction control nahi. */
+DROP PROCEDURE IF EXISTS `AdjustSalaryStats`;
+DELIMITER $$
+CREATE PROCEDURE `AdjustSalaryStats` (
+    IN p_role VARCHAR(50),
+    IN p_shelter_id INT,
+    IN p_salary DECIMAL(10, 2),
+    IN p_delta INT
+)
+BEGIN
+    IF p_salary IS NOT NULL THEN
+        INSERT INTO `SalaryStats` (`scope`, `scope_key`, `salary_count`, `salary_sum`)
+        VALUES ('all', '', GREATEST(p_delta, 0), GREATEST(p_delta, 0) * p_salary)
+        ON DUPLICATE KEY UPDATE
+            `salary_count` = `salary_count` + p_delta,
+            `salary_sum` = `salary_sum` + p_delta * p_salary;
+
+        INSERT INTO `SalaryStats` (`scope`, `scope_key`, `salary_count`, `salary_sum`)
+        VALUES ('role', COALESCE(p_role, ''), GREATEST(p_delta, 0), GREATEST(p_delta, 0) * p_salary)
+        ON DUPLICATE KEY UPDATE
+            `salary_count` = `salary_count` + p_delta,
+            `salary_sum` = `salary_sum` + p_delta * p_salary;
+
+        INSERT INTO `SalaryStats` (`scope`, `scope_key`, `salary_count`, `salary_sum`)
+        VALUES ('shelter', COALESCE(CAST(p_shelter_id AS CHAR), ''), GREATEST(p_delta, 0), GREATEST(p_delta, 0) * p_salary)
+        ON DUPLICATE KEY UPDATE
+            `salary_count` = `salary_count` + p_delta,
+            `salary_sum` = `salary_sum` + p_delta * p_salary;
+
+        /* Bucket width yahan 5000 hai (queries.py SALARY_BUCKET_WIDTH bhi) */
+        INSERT INTO `SalaryHistogram` (`bucket_start`, `employee_count`)
+        VALUES (FLOOR(p_salary / 5000) * 5000, GREATEST(p_delta, 0))
+        ON DUPLICATE KEY UPDATE `employee_count` = `employee_count` + p_delta;
+    END IF;
+END$$
+DELIMITER ;
@@ -1,14 +1,26 @@
 import mysql.connector
 from mysql.connector import Error
 import os
+import re
+import json
+import base64
+from decimal import Decimal
 
 # --- IMPORT from your existing connection file ---
 # We get the DB_NAME from the .env file as well
 try:
-    from .connection import get_db_connection
+    from .connection import get_pooled_connection
+    from .report_cache import cached_report
+    from .metrics import timed_query
+    from .logs import get_logger, log_success
+    from .statements import COMPILED_STATEMENTS, statement_cache, statement_key
 except ImportError:
     # This fallback helps if running the file directly
-    from connection import get_db_connection
+    from connection import get_pooled_connection
+    from report_cache import cached_report
+    from metrics import timed_query
+    from logs import get_logger, log_success
+    from statements import COMPILED_STATEMENTS, statement_cache, statement_key
     
 from dotenv import load_dotenv
 
@@ -22,12 +34,122 @@ if not DB_NAME:
     # Fallback for testing, but .env is preferred
     DB_NAME = 'pet_adoption_db'
 
+log = get_logger('db.queries')
+
+
+# Primary key of every table (keyset pagination isi column par chalti hai)
+TABLE_PRIMARY_KEYS = {
+    "Shelter": "shelter_id",
+    "Customer": "customer_id",
+    "Employee": "employee_id",
+    "Animal": "animal_id",
+    "Adopter": "adopter_id",
+    "Donor": "donor_id",
+    "Adoption": "adoption_id",
+    "Donation": "donation_id",
+    "AuditLog": "log_id",
+    "SalaryChangeLog": "log_id",
+}
+
+
+# --- SCHEMA METADATA (for ?fields= projections) ---
+TABLE_COLUMNS_QUERY = """
+    SELECT COLUMN_NAME
+    FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+    ORDER BY ORDINAL_POSITION
+"""
+
+# table -> tuple of column names. Process bhar ke liye cache (schema badle toh restart karo)
+TABLE_COLUMNS_CACHE = {}
+
+@timed_query
+def get_table_columns(table_name):
+    """
+    Column names of a table, read from information_schema once per process.
+    Returns: (tuple, None) on success, (None, str) on error
+    """
+    columns = TABLE_COLUMNS_CACHE.get(table_name)
+    if columns is not None:
+        return (columns, None)
 
+    connection = get_pooled_connection(DB_NAME)
+    if connection is None:
+        return (None, "Failed to connect to database.")
 
+    cursor = connection.cursor()
 
+    try:
+        cursor.execute(TABLE_COLUMNS_QUERY, (table_name,))
+        return store_table_columns(table_name, [row[0] for row in cursor.fetchall()])
 
+    except Error as e:
+        log.error("Error reading columns of %s: %s", table_name, e)
+        return (None, str(e)) # FAILURE
+
+    finally:
+        if connection.is_connected():
+            cursor.close()
+        connection.close() # Pool mein wapas
+
+def store_table_columns(table_name, columns):
+    """Caches the columns read from information_schema (an empty list means no such table)."""
+    if not columns:
+        return (None, f"Unknown table {table_name}.")
+    TABLE_COLUMNS_CACHE[table_name] = tuple(columns)
+    return (TABLE_COLUMNS_CACHE[table_name], None)
+
+def check_fields(table_name, columns, fields):
+    """
+    Validates the requested ?fields= against the table's columns.
+    The primary key is always selected (pagination cursor aur ID lookups ke liye).
+    Returns: (tuple, None) on success, (None, str) if a field is not a column
+    """
+    unknown = [field for field in fields if field not in columns]
+    if unknown:
+        return (None, f"Unknown field(s) for {table_name}: {', '.join(unknown)}")
+
+    id_column = TABLE_PRIMARY_KEYS.get(table_name)
+    if id_column and id_column not in fields:
+        fields = (id_column,) + tuple(fields)
+    return (tuple(fields), None)
+
+def resolve_fields(table_name, fields):
+    """
+    Validated column tuple for a projection, or None when no fields were asked for (SELECT *).
+    Returns: (tuple or None, None) on success, (None, str) on error
+    """
+    if not fields:
+        return (None, None)
+    columns, error = get_table_columns(table_name)
+    if error:
+        return (None, error)
+    return check_fields(table_name, columns, fields)
+
+def select_list(fields):
+    """'*' or the backticked column list of already validated `fields`."""
+    return '`' + '`, `'.join(fields) + '`' if fields else '*'
+
+def get_statement(operation, table_name, columns=(), key_column=None):
+    """
+    Compiled SQL for a generic CRUD statement (db/statements.py). Identifiers are checked
+    against the table's columns the first time a key is seen, later calls are one dict lookup.
+    Call it BEFORE borrowing a connection (first use reads information_schema).
+    Placeholders follow `columns` in the given order, then `key_column`.
+    Returns: (str, None) on success, (None, str) on error (unknown table / column)
+    """
+    # Hit: sirf nested dict lookups (statements.py)
+    try:
+        return (COMPILED_STATEMENTS[operation][table_name][key_column][tuple(columns)], None)
+    except KeyError:
+        pass
+    table_columns, error = get_table_columns(table_name)
+    if error:
+        return (None, error)
+    return statement_cache.compile(statement_key(operation, table_name, columns, key_column), table_columns)
 
 # --- GENERIC SELECT ALL FUNCTION ---
+@timed_query
 def select_all_records(table_name):
     """
     Fetches all records from a table.
@@ -35,7 +157,7 @@ def select_all_records(table_name):
         (list, None) on success
         (None, str) on error
     """
-    connection = get_db_connection(DB_NAME)
+    connection = get_pooled_connection(DB_NAME)
     if connection is None:
         return (None, "Failed to connect to database.")
 
@@ -47,17 +169,17 @@ def select_all_records(table_name):
         query = f"SELECT * FROM `{table_name}`"
         cursor.execute(query)
         results = cursor.fetchall()
-        print(f"Successfully fetched {len(results)} records from {table_name}.")
+        log_success(log, "Successfully fetched %s records from %s.", len(results), table_name)
         return (results, None) # SUCCESS
         
     except Error as e:
-        print(f"Error while fetching records: {e}")
+        log.error("Error while fetching records: %s", e)
         return (None, str(e)) # FAILURE
         
     finally:
         if connection.is_connected():
             cursor.close()
-            connection.close()
+        connection.close() # Pool mein wapas
 
 
 
@@ -66,48 +188,62 @@ def select_all_records(table_name):
 
 
 # --- GENERIC SELECT BY ID FUNCTION ---
-def select_record_by_id(table_name, id_column, id_value):
+@timed_query
+def select_record_by_id(table_name, id_column, id_value, fields=None):
     """
     Fetches a single record by its ID.
+    `fields` (optional) limits the SELECT to those columns (validated against the schema).
     Returns:
         (dict, None) on success
         (None, str) on error
     """
-    connection = get_db_connection(DB_NAME)
+    fields, error = resolve_fields(table_name, fields)
+    if error:
+        return (None, error)
+    # Cache hit sirf dict lookups hai; KeyError (miss) par get_statement() validate + compile karta hai
+    try:
+        query = COMPILED_STATEMENTS["select_by_id"][table_name][id_column][fields or ()]
+    except KeyError:
+        query, error = get_statement("select_by_id", table_name, fields or (), id_column)
+        if error:
+            return (None, error)
+
+    connection = get_pooled_connection(DB_NAME)
     if connection is None:
         return (None, "Failed to connect to database.")
 
-    cursor = connection.cursor(dictionary=True)
+    cursor = connection.statement_cursor(query, dictionary=True)
     result = None
     
     try:
-        # Use backticks for table and column names
-        query = f"SELECT * FROM `{table_name}` WHERE `{id_column}` = %s"
         cursor.execute(query, (id_value,))
-        result = cursor.fetchone()
+        # fetchall: primary key par ek hi row, aur prepared cursor mein kuch unread nahi bachta
+        rows = cursor.fetchall()
+        result = rows[0] if rows else None
         
         if result:
-            print(f"Successfully fetched record {id_value} from {table_name}.")
+            log_success(log, "Successfully fetched record %s from %s.", id_value, table_name)
             return (result, None) # SUCCESS
         else:
-            print(f"No record found with ID {id_value} in {table_name}.")
+            log_success(log, "No record found with ID %s in %s.", id_value, table_name)
             # This is not a DB error, but a "not found" error
             return (None, f"No record found with ID {id_value} in {table_name}.") # FAILURE (Not found)
             
     except Error as e:
-        print(f"Error while fetching record: {e}")
+        log.error("Error while fetching record: %s", e)
         return (None, str(e)) # FAILURE
         
     finally:
         if connection.is_connected():
             cursor.close()
-            connection.close()
+        connection.close() # Pool mein wapas
 
 
 
 
 
 # --- GENERIC SELECT BY CRITERIA ---
+@timed_query
 def select_records_by_criteria(table_name, criteria):
     """
     Fetches records based on a dictionary of criteria.
@@ -115,40 +251,381 @@ def select_records_by_criteria(table_name, criteria):
         (list, None) on success
         (None, str) on error
     """
-    connection = get_db_connection(DB_NAME)
+    try:
+        query = COMPILED_STATEMENTS["select_by_criteria"][table_name][None][tuple(criteria)]
+    except KeyError:
+        query, error = get_statement("select_by_criteria", table_name, criteria.keys())
+        if error:
+            return (None, error)
+
+    connection = get_pooled_connection(DB_NAME)
     if connection is None:
         return (None, "Failed to connect to database.")
 
-    cursor = connection.cursor(dictionary=True)
+    cursor = connection.statement_cursor(query, dictionary=True)
     results = None
     
     try:
-        # Build the WHERE clause dynamically
-        where_parts = [f"`{column}` = %s" for column in criteria.keys()]
-        where_clause = " AND ".join(where_parts)
-        values = list(criteria.values())
-        
-        query = f"SELECT * FROM `{table_name}` WHERE {where_clause}"
-        
-        cursor.execute(query, tuple(values))
+        cursor.execute(query, tuple(criteria.values()))
         results = cursor.fetchall()
-        print(f"Successfully fetched {len(results)} records from {table_name} matching criteria.")
+        log_success(log, "Successfully fetched %s records from %s matching criteria.", len(results), table_name)
         return (results, None) # SUCCESS
         
     except Error as e:
-        print(f"Error while fetching records: {e}")
+        log.error("Error while fetching records: %s", e)
         return (None, str(e)) # FAILURE
         
     finally:
         if connection.is_connected():
             cursor.close()
-            connection.close()
+        connection.close() # Pool mein wapas
+
+
 
 
 
 
+# --- GENERIC KEYSET PAGINATION ---
+def build_page_query(table_name, id_column, limit, after=None, criteria=None, fields=None):
+    """Returns (query, values) for one keyset page (asks for limit + 1 rows)."""
+    where_parts = [f"`{column}` = %s" for column in (criteria or {}).keys()]
+    values = list((criteria or {}).values())
+    if after is not None:
+        where_parts.append(f"`{id_column}` > %s")
+        values.append(after)
+
+    query = f"SELECT {select_list(fields)} FROM `{table_name}`"
+    if where_parts:
+        query += " WHERE " + " AND ".join(where_parts)
+    # Ek extra row maango, taaki pata chale ki agla page hai ya nahi
+    query += f" ORDER BY `{id_column}` LIMIT %s"
+    values.append(limit + 1)
+    return query, tuple(values)
+
+def split_page(results, limit, id_column):
+    """Trims the extra row and returns {"data": list, "next_cursor": int or None}."""
+    next_cursor = None
+    if len(results) > limit:
+        results = results[:limit]
+        next_cursor = results[-1][id_column]
+    return {"data": results, "next_cursor": next_cursor}
+
+@timed_query
+def select_records_page(table_name, limit, after=None, criteria=None, fields=None):
+    """
+    Fetches one page of records ordered by the table's primary key.
+    Uses keyset pagination (WHERE pk > after) instead of OFFSET, so every
+    page costs the same no matter how deep into the table it is.
+    `fields` (optional) limits the SELECT to those columns plus the primary key.
+    Returns:
+        ({"data": list, "next_cursor": int or None}, None) on success
+        (None, str) on error
+    """
+    id_column = TABLE_PRIMARY_KEYS.get(table_name)
+    if id_column is None:
+        return (None, f"Pagination not supported for table {table_name}.")
+
+    fields, error = resolve_fields(table_name, fields)
+    if error:
+        return (None, error)
+
+    connection = get_pooled_connection(DB_NAME)
+    if connection is None:
+        return (None, "Failed to connect to database.")
+
+    cursor = connection.cursor(dictionary=True)
+
+    try:
+        query, values = build_page_query(table_name, id_column, limit, after, criteria, fields)
+        cursor.execute(query, values)
+        page = split_page(cursor.fetchall(), limit, id_column)
+
+        log_success(log, "Successfully fetched page of %s records from %s.", len(page['data']), table_name)
+        return (page, None) # SUCCESS
+
+    except Error as e:
+        log.error("Error while fetching page: %s", e)
+        return (None, str(e)) # FAILURE
+
+    finally:
+        if connection.is_connected():
+            cursor.close()
+        connection.close() # Pool mein wapas
+
+
+
+
+
+
+# --- ANIMAL SEARCH (filters + sort + full-text, keyset paginated) ---
+# Sort ke liye allowed columns (har ek par index hai, migration 006). '-age' = descending.
+ANIMAL_SEARCH_SORTS = ("animal_id", "name", "age", "dob")
+ANIMAL_SEARCH_LIST_FILTERS = ("species", "breed", "status", "gender", "shelter_id")
+FULLTEXT_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+def fulltext_prefix_query(text):
+    """
+    'gold ret' -> '+gold* +ret*' (BOOLEAN MODE: every word must match as a prefix).
+    User ke operators (+ - " * ...) hata diye jaate hain. Returns None if no words are left.
+    """
+    tokens = FULLTEXT_TOKEN_RE.findall(text or '')
+    return ' '.join(f"+{token}*" for token in tokens) or None
+
+def encode_search_cursor(sort, row):
+    """Opaque next-page cursor: the sort key and the last row's (sort value, animal_id)."""
+    column, descending = sort
+    state = [('-' if descending else '') + column, row[column], row["animal_id"]]
+    return base64.urlsafe_b64encode(json.dumps(state, default=str).encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_search_cursor(token, sort):
+    """
+    Reverse of encode_search_cursor(). The cursor only works with the sort it was made for.
+    Returns: ((sort value, animal_id), None) on success, (None, str) on a bad cursor
+    """
+    column, descending = sort
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        sort_key, value, animal_id = json.loads(raw)
+    except (ValueError, TypeError):
+        return (None, "Invalid search cursor")
+    if sort_key != ('-' if descending else '') + column or not isinstance(animal_id, int):
+        return (None, "Search cursor does not match the sort order")
+    return ((value, animal_id), None)
+
+def _keyset_condition(column, descending, after):
+    """WHERE part for rows after (value, animal_id) in ORDER BY column, animal_id (NULLs first ascending)."""
+    value, last_id = after
+    if column == "animal_id":
+        return (f"`animal_id` {'<' if descending else '>'} %s", [last_id])
+    if descending:
+        # DESC order: values high -> low, fir NULLs
+        if value is None:
+            return (f"(`{column}` IS NULL AND `animal_id` < %s)", [last_id])
+        return (f"(`{column}` < %s OR (`{column}` = %s AND `animal_id` < %s) OR `{column}` IS NULL)",
+                [value, value, last_id])
+    # ASC order: pehle NULLs, fir values low -> high
+    if value is None:
+        return (f"((`{column}` IS NULL AND `animal_id` > %s) OR `{column}` IS NOT NULL)", [last_id])
+    return (f"(`{column}` > %s OR (`{column}` = %s AND `animal_id` > %s))", [value, value, last_id])
+
+def build_animal_search_query(filters, sort, limit, after=None, fields=None):
+    """
+    Returns (query, values) for one page of an animal search (asks for limit + 1 rows).
+    filters: lists for ANIMAL_SEARCH_LIST_FILTERS (IN), min_age / max_age, dob_from / dob_to,
+             and q (full-text prefix match on name + breed)
+    sort: (column, descending); after: (sort value, animal_id) from the previous page
+    """
+    where_parts, values = [], []
+    for column in ANIMAL_SEARCH_LIST_FILTERS:
+        items = filters.get(column)
+        if items:
+            where_parts.append(f"`{column}` IN ({', '.join(['%s'] * len(items))})")
+            values.extend(items)
+
+    for key, condition in (("min_age", "`age` >= %s"), ("max_age", "`age` <= %s"),
+                           ("dob_from", "`dob` >= %s"), ("dob_to", "`dob` <= %s")):
+        if filters.get(key) is not None:
+            where_parts.append(condition)
+            values.append(filters[key])
+
+    fulltext = fulltext_prefix_query(filters.get("q"))
+    if fulltext:
+        # ft_animal_name_breed (FULLTEXT) index use hota hai
+        where_parts.append("MATCH(`name`, `breed`) AGAINST (%s IN BOOLEAN MODE)")
+        values.append(fulltext)
+
+    column, descending = sort
+    if after is not None:
+        condition, after_values = _keyset_condition(column, descending, after)
+        where_parts.append(condition)
+        values.extend(after_values)
+
+    query = f"SELECT {select_list(fields)} FROM `Animal`"
+    if where_parts:
+        query += " WHERE " + " AND ".join(where_parts)
+    direction = " DESC" if descending else ""
+    order = [f"`{column}`{direction}"] if column == "animal_id" else [f"`{column}`{direction}", f"`animal_id`{direction}"]
+    query += " ORDER BY " + ", ".join(order) + " LIMIT %s"
+    values.append(limit + 1)
+    return query, tuple(values)
+
+def split_search_page(results, limit, sort):
+    """Like split_page(), but the next cursor is an encode_search_cursor() token."""
+    next_cursor = None
+    if len(results) > limit:
+        results = results[:limit]
+        next_cursor = encode_search_cursor(sort, results[-1])
+    return {"data": results, "next_cursor": next_cursor}
+
+def search_fields(fields, sort):
+    """Projection for a search: the sort column is needed for the cursor, so it is always selected."""
+    if fields and sort[0] not in fields:
+        fields = fields + (sort[0],)
+    return fields
+
+@timed_query
+def search_animals(filters, sort=("animal_id", False), limit=100, after=None, fields=None):
+    """
+    Server-side animal search, one keyset page at a time (see build_animal_search_query).
+    Returns:
+        ({"data": list, "next_cursor": str or None}, None) on success
+        (None, str) on error
+    """
+    fields, error = resolve_fields("Animal", fields)
+    if error:
+        return (None, error)
+
+    connection = get_pooled_connection(DB_NAME)
+    if connection is None:
+        return (None, "Failed to connect to database.")
+
+    cursor = connection.cursor(dictionary=True)
+
+    try:
+        query, values = build_animal_search_query(filters, sort, limit, after, search_fields(fields, sort))
+        cursor.execute(query, values)
+        page = split_search_page(cursor.fetchall(), limit, sort)
+
+        log_success(log, "Animal search returned %s records.", len(page['data']))
+        return (page, None) # SUCCESS
+
+    except Error as e:
+        log.error("Error while searching animals: %s", e)
+        return (None, str(e)) # FAILURE
+
+    finally:
+        if connection.is_connected():
+            cursor.close()
+        connection.close() # Pool mein wapas
 
 
+
+
+
+
+# --- STREAMING SELECT (for exports) ---
+@timed_query
+def stream_all_records(table_name, chunk_size=1000):
+    """
+    Opens an unbuffered cursor over a whole table and returns a generator
+    that yields lists of row tuples, `chunk_size` rows at a time.
+    Rows are pulled from the server as the generator is consumed, so memory
+    stays constant no matter how big the table is.
+    The caller must call `close()` once the response is done (e.g. response.call_on_close):
+    a generator that is never iterated (HEAD, client gone before the first chunk) never
+    reaches its own cleanup, and the pooled connection would stay borrowed.
+    Returns:
+        ({"columns": list, "chunks": generator, "close": callable}, None) on success
+        (None, str) on error
+    """
+    id_column = TABLE_PRIMARY_KEYS.get(table_name)
+    if id_column is None:
+        return (None, f"Export not supported for table {table_name}.")
+
+    connection = get_pooled_connection(DB_NAME)
+    if connection is None:
+        return (None, "Failed to connect to database.")
+
+    # buffered=False: rows socket se tabhi padhe jaate hain jab fetchmany() bole
+    cursor = connection.cursor(buffered=False)
+    try:
+        cursor.execute(f"SELECT * FROM `{table_name}` ORDER BY `{id_column}`")
+        columns = list(cursor.column_names)
+    except Error as e:
+        log.error("Error while starting export: %s", e)
+        connection.discard()
+        return (None, str(e)) # FAILURE
+
+    def generate_chunks():
+        total = 0
+        finished = False
+        try:
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                total += len(rows)
+                yield rows
+            finished = True
+            log_success(log, "Successfully streamed %s records from %s.", total, table_name)
+        except Error as e:
+            log.error("Error while streaming records: %s", e)
+        finally:
+            if finished:
+                cursor.close()
+                connection.close() # Pool mein wapas
+            else:
+                # Client beech mein chala gaya, unread rows waali connection reuse nahi hogi
+                connection.discard()
+
+    chunks = generate_chunks()
+
+    def close():
+        # Shuru hua generator apne finally mein connection lauta deta hai;
+        # kabhi shuru nahi hua toh yahan discard (pehle hi lauta diya ho toh no-op)
+        chunks.close()
+        connection.discard()
+
+    return ({"columns": columns, "chunks": chunks, "close": close}, None) # SUCCESS
+
+
+# --- TABLE CHANGE COUNTERS (for ETags) ---
+def check_table_versions(tables, versions):
+    """(versions, None) if every table has a counter, else (None, str)."""
+    missing = [table for table in tables if table not in versions]
+    if missing:
+        return (None, f"No change counter for: {', '.join(missing)}")
+    return (versions, None) # SUCCESS
+
+@timed_query
+def get_table_versions(tables):
+    """
+    Reads the change counters of the given tables from `TableVersion`
+    (bumped once per transaction by the write paths). One primary-key lookup.
+    Returns:
+        (dict, None) on success, e.g. {"Animal": 42}
+        (None, str) on error (or if a table has no counter)
+    """
+    connection = get_pooled_connection(DB_NAME)
+    if connection is None:
+        return (None, "Failed to connect to database.")
+
+    cursor = connection.cursor()
+    
+    try:
+        placeholders = ', '.join(['%s'] * len(tables))
+        query = f"SELECT `table_name`, `version` FROM `TableVersion` WHERE `table_name` IN ({placeholders})"
+        cursor.execute(query, tuple(tables))
+        return check_table_versions(tables, dict(cursor.fetchall()))
+
+    except Error as e:
+        log.error("Error reading table versions: %s", e)
+        return (None, str(e)) # FAILURE
+
+    finally:
+        if connection.is_connected():
+            cursor.close()
+        connection.close() # Pool mein wapas
+
+
+
+
+
+
+# Yeh JOIN query hai jo DBMS project ke liye important hai
+ADOPTER_DETAILS_QUERY = """
+    SELECT 
+        a.adopter_id,
+        c.customer_id,
+        c.first_name,
+        c.last_name,
+        c.phone
+    FROM Customer c
+    JOIN Adopter a ON c.customer_id = a.customer_id
+    ORDER BY c.first_name;
+"""
+
+@timed_query
 def get_all_adopter_details():
     """
     Fetches all adopters by joining Customer and Adopter tables.
@@ -156,7 +633,7 @@ def get_all_adopter_details():
         (list, None) on success
         (None, str) on error
     """
-    connection = get_db_connection(DB_NAME)
+    connection = get_pooled_connection(DB_NAME)
     if connection is None:
         return (None, "Failed to connect to database.")
 
@@ -164,31 +641,19 @@ def get_all_adopter_details():
     results = None
     
     try:
-        # Yeh JOIN query hai jo DBMS project ke liye important hai
-        query = """
-            SELECT 
-                a.adopter_id,
-                c.customer_id,
-                c.first_name,
-                c.last_name,
-                c.phone
-            FROM Customer c
-            JOIN Adopter a ON c.customer_id = a.customer_id
-            ORDER BY c.first_name;
-        """
-        cursor.execute(query)
+        cursor.execute(ADOPTER_DETAILS_QUERY)
         results = cursor.fetchall()
-        print(f"Successfully fetched {len(results)} adopter detail records.")
+        log_success(log, "Successfully fetched %s adopter detail records.", len(results))
         return (results, None) # SUCCESS
         
     except Error as e:
-        print(f"Error fetching adopter details: {e}")
+        log.error("Error fetching adopter details: %s", e)
         return (None, str(e)) # FAILURE
         
     finally:
         if connection.is_connected():
             cursor.close()
-            connection.close()
+        connection.close() # Pool mein wapas
 
 
 
@@ -196,6 +661,21 @@ def get_all_adopter_details():
 
 
 # --- *** NEW FUNCTION *** ---
+# Yeh JOIN query hai
+DONOR_DETAILS_QUERY = """
+    SELECT 
+        d.donor_id,
+        c.customer_id,
+        c.first_name,
+        c.last_name,
+        c.phone,
+        d.amount
+    FROM Customer c
+    JOIN Donor d ON c.customer_id = d.customer_id
+    ORDER BY c.first_name;
+"""
+
+@timed_query
 def get_all_donor_details():
     """
     Fetches all donors by joining Customer and Donor tables.
@@ -203,7 +683,7 @@ def get_all_donor_details():
         (list, None) on success
         (None, str) on error
     """
-    connection = get_db_connection(DB_NAME)
+    connection = get_pooled_connection(DB_NAME)
     if connection is None:
         return (None, "Failed to connect to database.")
 
@@ -211,131 +691,345 @@ def get_all_donor_details():
     results = None
     
     try:
-        # Yeh JOIN query hai
-        query = """
-            SELECT 
-                d.donor_id,
-                c.customer_id,
-                c.first_name,
-                c.last_name,
-                c.phone,
-                d.amount
-            FROM Customer c
-            JOIN Donor d ON c.customer_id = d.customer_id
-            ORDER BY c.first_name;
-        """
-        cursor.execute(query)
+        cursor.execute(DONOR_DETAILS_QUERY)
         results = cursor.fetchall()
-        print(f"Successfully fetched {len(results)} donor detail records.")
+        log_success(log, "Successfully fetched %s donor detail records.", len(results))
         return (results, None) # SUCCESS
         
     except Error as e:
-        print(f"Error fetching donor details: {e}")
+        log.error("Error fetching donor details: %s", e)
         return (None, str(e)) # FAILURE
         
     finally:
         if connection.is_connected():
             cursor.close()
-            connection.close()
+        connection.close() # Pool mein wapas
+
 
 
 
+# LEFT JOIN zaroori hai taaki bina summary row waale shelters bhi '0' ke saath aayein
+SHELTER_OCCUPANCY_QUERY = """
+    SELECT 
+        s.shelter_id,
+        s.name,
+        s.capacity,
+        s.current_occupancy,
+        COALESCE(sm.available_count, 0) AS calculated_animal_count
+    FROM Shelter s
+    LEFT JOIN ShelterAnimalSummary sm ON sm.shelter_id = s.shelter_id
+    ORDER BY s.name;
+"""
 
+@cached_report(depends_on=["Shelter", "Animal"])
+@timed_query
 def get_report_shelter_occupancy():
     """
-    REPORT 1 (LEFT JOIN + GROUP BY):
-    Fetches animal count per shelter, including empty shelters.
+    REPORT 1 (LEFT JOIN on the summary table):
+    Fetches available-animal count per shelter, including empty shelters.
+    Counts come from ShelterAnimalSummary (kept current by the Animal triggers),
+    so this reads one row per shelter instead of scanning Animal.
     """
-    connection = get_db_connection(DB_NAME)
+    connection = get_pooled_connection(DB_NAME)
     if connection is None: return (None, "Failed to connect to database.")
     cursor = connection.cursor(dictionary=True)
     try:
-        # LEFT JOIN zaroori hai taaki '0' count waale shelters bhi aayein
-        query = """
-            SELECT 
-                s.shelter_id,
-                s.name,
-                s.capacity,
-                s.current_occupancy,
-                COUNT(a.animal_id) AS calculated_animal_count
-            FROM Shelter s
-            LEFT JOIN Animal a ON s.shelter_id = a.shelter_id AND a.status = 'Available'
-            GROUP BY s.shelter_id, s.name, s.capacity, s.current_occupancy
-            ORDER BY s.name;
-        """
-        cursor.execute(query)
+        cursor.execute(SHELTER_OCCUPANCY_QUERY)
         results = cursor.fetchall()
-        print(f"Successfully fetched shelter occupancy report.")
+        log_success(log, "Successfully fetched shelter occupancy report.")
         return (results, None)
     except Error as e:
-        print(f"Error fetching shelter occupancy report: {e}")
+        log.error("Error fetching shelter occupancy report: %s", e)
         return (None, str(e))
     finally:
-        if connection.is_connected(): cursor.close(); connection.close()
-
-
+        if connection.is_connected(): cursor.close()
+        connection.close()
+
+
+AVERAGE_SALARY_QUERY = """
+    SELECT salary_sum / salary_count AS average_salary
+    FROM SalaryStats
+    WHERE scope = 'all' AND scope_key = '' AND salary_count > 0
+"""
+ABOVE_AVERAGE_QUERY = """
+    SELECT 
+        employee_id, 
+        name, 
+        role, 
+        salary
+    FROM Employee
+    WHERE salary > %s
+    ORDER BY salary DESC;
+"""
+
+@cached_report(depends_on=["Employee"])
+@timed_query
 def get_report_employees_above_average():
     """
-    REPORT 2 (Subquery):
+    REPORT 2 (stored average + range scan):
     Fetches employees earning more than the average salary.
+    The average comes from SalaryStats (kept current by the Employee triggers),
+    then `salary > avg` is a range scan on idx_employee_salary_cover.
     """
-    connection = get_db_connection(DB_NAME)
+    connection = get_pooled_connection(DB_NAME)
     if connection is None: return (None, "Failed to connect to database.")
     cursor = connection.cursor(dictionary=True)
     try:
-        query = """
-            SELECT 
-                employee_id, 
-                name, 
-                role, 
-                salary
-            FROM Employee
-            WHERE salary > (SELECT AVG(salary) FROM Employee)
-            ORDER BY salary DESC;
-        """
-        cursor.execute(query)
+        cursor.execute(AVERAGE_SALARY_QUERY)
+        row = cursor.fetchone()
+        if row is None:
+            # Kisi employee ki salary nahi hai
+            return ([], None)
+
+        cursor.execute(ABOVE_AVERAGE_QUERY, (row["average_salary"],))
+        results = cursor.fetchall()
+        log_success(log, "Successfully fetched above-average employees report.")
+        return (results, None)
+    except Error as e:
+        log.error("Error fetching above-average employees report: %s", e)
+        return (None, str(e))
+    finally:
+        if connection.is_connected(): cursor.close()
+        connection.close()
+
+
+# --- SALARY STATISTICS (from SalaryStats / SalaryHistogram) ---
+# procedures.sql ke AdjustSalaryStats mein bhi yahi width hai
+SALARY_BUCKET_WIDTH = Decimal('5000')
+
+SALARY_STATS_QUERY = """
+    SELECT scope, scope_key, salary_count, salary_sum
+    FROM SalaryStats
+    WHERE salary_count > 0
+    ORDER BY scope, scope_key
+"""
+SALARY_HISTOGRAM_QUERY = """
+    SELECT bucket_start, employee_count
+    FROM SalaryHistogram
+    WHERE employee_count > 0
+    ORDER BY bucket_start
+"""
+
+def _with_average(row):
+    count, total = row["salary_count"], row["salary_sum"]
+    row["average_salary"] = (total / count).quantize(Decimal('0.01')) if count else None
+    return row
+
+def build_salary_stats(rows):
+    """SalaryStats rows -> {"overall": {...}, "by_role": [...], "by_shelter": [...]}"""
+    stats = {"overall": _with_average({"salary_count": 0, "salary_sum": Decimal('0.00')}),
+             "by_role": [], "by_shelter": []}
+    for row in rows:
+        scope, key = row.pop("scope"), row.pop("scope_key")
+        if scope == 'all':
+            stats["overall"] = _with_average(row)
+        elif scope == 'role':
+            stats["by_role"].append(dict(role=key or None, **_with_average(row)))
+        elif scope == 'shelter':
+            stats["by_shelter"].append(dict(shelter_id=int(key) if key else None, **_with_average(row)))
+    return stats
+
+def build_salary_histogram(rows):
+    for row in rows:
+        row["bucket_end"] = row["bucket_start"] + SALARY_BUCKET_WIDTH
+    return rows
+
+@cached_report(depends_on=["Employee"])
+@timed_query
+def get_salary_stats():
+    """
+    Running salary aggregates: overall, per role and per shelter.
+    Returns:
+        ({"overall": {...}, "by_role": [...], "by_shelter": [...]}, None) on success
+        (None, str) on error
+    """
+    connection = get_pooled_connection(DB_NAME)
+    if connection is None: return (None, "Failed to connect to database.")
+    cursor = connection.cursor(dictionary=True)
+    try:
+        cursor.execute(SALARY_STATS_QUERY)
+        return (build_salary_stats(cursor.fetchall()), None)
+    except Error as e:
+        log.error("Error fetching salary stats: %s", e)
+        return (None, str(e))
+    finally:
+        if connection.is_connected(): cursor.close()
+        connection.close()
+
+@cached_report(depends_on=["Employee"])
+@timed_query
+def get_salary_histogram():
+    """
+    Salary histogram with SALARY_BUCKET_WIDTH-wide buckets (empty buckets skipped).
+    Returns: (list, None) on success, (None, str) on error
+    """
+    connection = get_pooled_connection(DB_NAME)
+    if connection is None: return (None, "Failed to connect to database.")
+    cursor = connection.cursor(dictionary=True)
+    try:
+        cursor.execute(SALARY_HISTOGRAM_QUERY)
+        return (build_salary_histogram(cursor.fetchall()), None)
+    except Error as e:
+        log.error("Error fetching salary histogram: %s", e)
+        return (None, str(e))
+    finally:
+        if connection.is_connected(): cursor.close()
+        connection.close()
+
+def approximate_percentiles(histogram, percentiles):
+    """
+    Estimates salary percentiles from histogram buckets, assuming salaries are
+    spread evenly inside each bucket (error is at most one bucket width).
+    Returns {percentile: Decimal or None}
+    """
+    total = sum(row["employee_count"] for row in histogram)
+    results = {}
+    for percentile in percentiles:
+        if total == 0:
+            results[percentile] = None
+            continue
+        rank = Decimal(str(percentile)) / 100 * total
+        seen = 0
+        for row in histogram:
+            count = row["employee_count"]
+            if seen + count >= rank:
+                fraction = (rank - seen) / count
+                results[percentile] = (row["bucket_start"] + fraction * SALARY_BUCKET_WIDTH).quantize(Decimal('0.01'))
+                break
+            seen += count
+    return results
+
+def get_report_salary_percentiles(percentiles=(25, 50, 75, 90)):
+    """
+    Approximate salary percentiles computed from the cached histogram.
+    Returns: ({"employee_count", "bucket_width", "percentiles": {"p50": ...}}, None) on success
+    """
+    histogram, error = get_salary_histogram()
+    if error:
+        return (None, error)
+    return (build_percentile_report(histogram, percentiles), None)
+
+def build_percentile_report(histogram, percentiles):
+    values = approximate_percentiles(histogram, percentiles)
+    return {
+        "employee_count": sum(row["employee_count"] for row in histogram),
+        "bucket_width": SALARY_BUCKET_WIDTH,
+        "approximate": True,
+        "percentiles": {f"p{p:g}": values[p] for p in percentiles},
+    }
+
+
+def build_adopters_by_count_query(min_adoptions, limit=None):
+    """Returns (query, params) for adopters with at least `min_adoptions` adoptions."""
+    # adopter_id DESC bhi index order hai (InnoDB secondary index mein PK hota hai)
+    query = """
+        SELECT 
+            c.customer_id,
+            c.first_name,
+            c.last_name,
+            c.phone,
+            ac.adoption_count AS total_adoptions
+        FROM AdopterAdoptionCount ac
+        JOIN Adopter ad ON ac.adopter_id = ad.adopter_id
+        JOIN Customer c ON ad.customer_id = c.customer_id
+        WHERE ac.adoption_count >= %s
+        ORDER BY ac.adoption_count DESC, ac.adopter_id DESC
+    """
+    params = [min_adoptions]
+    if limit is not None:
+        query += " LIMIT %s"
+        params.append(limit)
+    return query, tuple(params)
+
+def _select_adopters_by_count(min_adoptions, limit=None):
+    """
+    Adopters with at least `min_adoptions` adoptions, most adoptions first.
+    Reads AdopterAdoptionCount (kept current by the Adoption triggers), so this is
+    a backward range scan on idx_adoption_count instead of a GROUP BY over Adoption.
+    """
+    connection = get_pooled_connection(DB_NAME)
+    if connection is None: return (None, "Failed to connect to database.")
+    cursor = connection.cursor(dictionary=True)
+    try:
+        cursor.execute(*build_adopters_by_count_query(min_adoptions, limit))
         results = cursor.fetchall()
-        print(f"Successfully fetched above-average employees report.")
         return (results, None)
     except Error as e:
-        print(f"Error fetching above-average employees report: {e}")
         return (None, str(e))
     finally:
-        if connection.is_connected(): cursor.close(); connection.close()
+        if connection.is_connected(): cursor.close()
+        connection.close()
 
 
+@cached_report(depends_on=["Adoption", "Adopter", "Customer"])
+@timed_query
 def get_report_multi_adopters():
     """
-    REPORT 3 (Multi-JOIN + GROUP BY + HAVING):
+    REPORT 3 (precomputed counts + JOIN):
     Fetches adopters who have adopted more than one animal.
     """
-    connection = get_db_connection(DB_NAME)
+    results, error = _select_adopters_by_count(min_adoptions=2)
+    if error:
+        log.error("Error fetching multi-adopters report: %s", error)
+        return (None, error)
+    log_success(log, "Successfully fetched multi-adopters report.")
+    return (results, None)
+
+
+@cached_report(depends_on=["Adoption", "Adopter", "Customer"])
+@timed_query
+def get_report_top_adopters(limit=10, min_adoptions=1):
+    """
+    REPORT 3b: the `limit` most frequent adopters with at least `min_adoptions` adoptions.
+    """
+    results, error = _select_adopters_by_count(min_adoptions=min_adoptions, limit=limit)
+    if error:
+        log.error("Error fetching top adopters report: %s", error)
+        return (None, error)
+    log_success(log, "Successfully fetched top adopters report.")
+    return (results, None)
+
+
+# --- Dashboard headline numbers ---
+# Ek hi round-trip mein saari ginti (report cache mein rehti hai, writes par invalidate)
+# Animal counts ShelterAnimalSummary se (har shelter ki ek row), Animal table scan nahi hoti.
+# chk_status sirf teen statuses allow karta hai, isliye total = teeno ka sum.
+HEADLINE_COUNTS_QUERY = """
+    SELECT
+        CAST(COALESCE(SUM(sm.available_count + sm.pending_count + sm.adopted_count), 0) AS SIGNED) AS total_animals,
+        CAST(COALESCE(SUM(sm.available_count), 0) AS SIGNED) AS available_animals,
+        CAST(COALESCE(SUM(sm.pending_count), 0) AS SIGNED) AS pending_animals,
+        CAST(COALESCE(SUM(sm.adopted_count), 0) AS SIGNED) AS adopted_animals,
+        (SELECT COUNT(*) FROM Shelter) AS shelters,
+        (SELECT COUNT(*) FROM Employee) AS employees,
+        (SELECT COUNT(*) FROM Adopter) AS adopters
+    FROM ShelterAnimalSummary sm;
+"""
+
+@cached_report(depends_on=["Animal", "Shelter", "Employee", "Adopter"])
+@timed_query
+def get_headline_counts():
+    """
+    Animal (by status), shelter, employee and adopter counts for the dashboard.
+    Animal counts are summed from ShelterAnimalSummary (one row per shelter).
+    Returns:
+        (dict, None) on success, e.g. {"total_animals": 120, "available_animals": 80, ...}
+        (None, str) on error
+    """
+    connection = get_pooled_connection(DB_NAME)
     if connection is None: return (None, "Failed to connect to database.")
     cursor = connection.cursor(dictionary=True)
     try:
-        query = """
-            SELECT 
-                c.customer_id,
-                c.first_name,
-                c.last_name,
-                c.phone,
-                COUNT(a.adoption_id) AS total_adoptions
-            FROM Adoption a
-            JOIN Adopter ad ON a.adopter_id = ad.adopter_id
-            JOIN Customer c ON ad.customer_id = c.customer_id
-            GROUP BY c.customer_id, c.first_name, c.last_name, c.phone
-            HAVING total_adoptions > 1
-            ORDER BY total_adoptions DESC;
-        """
-        cursor.execute(query)
-        results = cursor.fetchall()
-        print(f"Successfully fetched multi-adopters report.")
-        return (results, None)
+        cursor.execute(HEADLINE_COUNTS_QUERY)
+        counts = cursor.fetchone()
+        log_success(log, "Successfully fetched headline counts.")
+        return (counts, None)
     except Error as e:
-        print(f"Error fetching multi-adopters report: {e}")
+        log.error("Error fetching headline counts: %s", e)
         return (None, str(e))
     finally:
-        if connection.is_connected(): cursor.close(); connection.close()
+        if connection.is_connected(): cursor.close()
+        connection.close()
 
 
 
@@ -0,0 +1,365 @@
+# backend/db/reconcile.py
+# Triggers se maintain hone waali summary tables ko full recount se compare karna.
+# Agar kabhi trigger ke bina data badla (manual SQL, FK cascade, migration ke beech ke writes),
+# toh summary aur asli data alag ho sakte hain. Yeh script woh drift dhoondhta hai aur theek karta hai.
+#
+# Usage (backend folder se):
+#   python db/reconcile.py                            # sirf drift report (drift mile toh exit code 1)
+#   python db/reconcile.py --repair                   # drift waali rows recount karke theek karo
+#   python db/reconcile.py --repair --fix-occupancy   # Shelter.current_occupancy bhi theek karo
+#   python db/reconcile.py --only shelter-summary --only adopter-counts
+
+import argparse
+import os
+
+from mysql.connector import Error
+from connection import get_db_connection
+from update_delete import bump_table_versions
+
+# Animal.status -> ShelterAnimalSummary column
+STATUS_COLUMNS = {
+    "Available": "available_count",
+    "Pending": "pending_count",
+    "Adopted": "adopted_count",
+}
+SUMMARY_COLUMNS = tuple(STATUS_COLUMNS.values())
+
+
+# --- Shelter animal summary ---
+
+def recount_shelter_animals(cursor, shelter_id=None):
+    """
+    Counts animals per shelter and status straight from Animal.
+    Returns {shelter_id: {"available_count": n, "pending_count": n, "adopted_count": n}}
+    """
+    query = """
+        SELECT s.shelter_id, a.status, COUNT(a.animal_id)
+        FROM Shelter s
+        LEFT JOIN Animal a ON a.shelter_id = s.shelter_id
+    """
+    params = ()
+    if shelter_id is not None:
+        query += " WHERE s.shelter_id = %s"
+        params = (shelter_id,)
+    query += " GROUP BY s.shelter_id, a.status"
+    cursor.execute(query, params)
+
+    counts = {}
+    for sid, status, count in cursor.fetchall():
+        row = counts.setdefault(sid, dict.fromkeys(SUMMARY_COLUMNS, 0))
+        # Collation case-insensitive hai ('AdoptED' == 'Adopted'), toh yahan bhi waise hi milao
+        for name, column in STATUS_COLUMNS.items():
+            if status is not None and status.lower() == name.lower():
+                row[column] += count
+    return counts
+
+
+def stored_shelter_summary(cursor):
+    """Returns {shelter_id: (summary dict or None, current_occupancy, capacity)}"""
+    cursor.execute("""
+        SELECT s.shelter_id, s.current_occupancy, s.capacity,
+               sm.shelter_id, sm.available_count, sm.pending_count, sm.adopted_count
+        FROM Shelter s
+        LEFT JOIN ShelterAnimalSummary sm ON sm.shelter_id = s.shelter_id
+    """)
+    stored = {}
+    for sid, occupancy, capacity, summary_id, *values in cursor.fetchall():
+        summary = dict(zip(SUMMARY_COLUMNS, values)) if summary_id is not None else None
+        stored[sid] = (summary, occupancy, capacity)
+    return stored
+
+
+def repair_shelter_summary(connection, shelter_id, fix_occupancy=False):
+    """
+    Recounts one shelter and overwrites its summary row (and optionally current_occupancy).
+    The summary row is locked first: a concurrent Animal write waits on it in its trigger,
+    so its +1/-1 lands after our recount and nothing is lost.
+    Returns: (counts, None) on success, (None, str) on error
+    """
+    cursor = connection.cursor()
+    try:
+        connection.start_transaction(isolation_level='READ COMMITTED')
+        cursor.execute("INSERT IGNORE INTO ShelterAnimalSummary (shelter_id) VALUES (%s)", (shelter_id,))
+        cursor.execute("SELECT shelter_id FROM ShelterAnimalSummary WHERE shelter_id = %s FOR UPDATE", (shelter_id,))
+        cursor.fetchall()
+
+        counts = recount_shelter_animals(cursor, shelter_id).get(shelter_id, dict.fromkeys(SUMMARY_COLUMNS, 0))
+        set_clause = ", ".join(f"`{column}` = %s" for column in SUMMARY_COLUMNS)
+        cursor.execute(
+            f"UPDATE ShelterAnimalSummary SET {set_clause} WHERE shelter_id = %s",
+            tuple(counts[column] for column in SUMMARY_COLUMNS) + (shelter_id,)
+        )
+        if fix_occupancy:
+            # chk_occupancy: capacity se zyada nahi ho sakta, aise shelters sirf report hote hain
+            cursor.execute(
+                "UPDATE Shelter SET current_occupancy = %s WHERE shelter_id = %s AND capacity >= %s",
+                (counts["available_count"], shelter_id, counts["available_count"])
+            )
+        # Report ka ETag Animal (aur occupancy theek hui toh Shelter) ke counter se banta hai
+        bump_table_versions(cursor, ["Animal", "Shelter"] if fix_occupancy else ["Animal"])
+        connection.commit()
+        return (counts, None)
+
+    except Error as e:
+        connection.rollback()
+        return (None, str(e))
+    finally:
+        cursor.close()
+
+
+def check_shelter_summary(connection, repair=False, fix_occupancy=False, **_):
+    """
+    Compares ShelterAnimalSummary and Shelter.current_occupancy with a full recount.
+    Returns: (drift_count, repaired_count)
+    """
+    cursor = connection.cursor()
+    try:
+        actual = recount_shelter_animals(cursor)
+        stored = stored_shelter_summary(cursor)
+    finally:
+        cursor.close()
+    connection.commit()
+
+    drift, repaired = 0, 0
+    for shelter_id in sorted(stored):
+        summary, occupancy, capacity = stored[shelter_id]
+        counts = actual.get(shelter_id, dict.fromkeys(SUMMARY_COLUMNS, 0))
+        problems = []
+
+        if summary is None:
+            problems.append("summary row missing")
+        else:
+            for column in SUMMARY_COLUMNS:
+                if summary[column] != counts[column]:
+                    problems.append(f"{column} {summary[column]} != {counts[column]}")
+        if occupancy != counts["available_count"]:
+            note = " (over capacity)" if counts["available_count"] > capacity else ""
+            problems.append(f"current_occupancy {occupancy} != available {counts['available_count']}{note}")
+
+        if not problems:
+            continue
+        drift += 1
+        print(f"  shelter {shelter_id}: " + "; ".join(problems))
+
+        occupancy_only = summary is not None and all(summary[c] == counts[c] for c in SUMMARY_COLUMNS)
+        if repair and not (occupancy_only and not fix_occupancy):
+            _, error = repair_shelter_summary(connection, shelter_id, fix_occupancy=fix_occupancy)
+            if error:
+                print(f"    repair failed: {error}")
+            else:
+                repaired += 1
+                print("    repaired")
+    return drift, repaired
+
+
+# --- Adopter adoption counts ---
+
+def repair_adopter_count(connection, adopter_id):
+    """
+    Recounts one adopter's adoptions and overwrites its AdopterAdoptionCount row
+    (locked first, same reasoning as repair_shelter_summary).
+    Returns: (count, None) on success, (None, str) on error
+    """
+    cursor = connection.cursor()
+    try:
+        connection.start_transaction(isolation_level='READ COMMITTED')
+        cursor.execute("INSERT IGNORE INTO AdopterAdoptionCount (adopter_id) VALUES (%s)", (adopter_id,))
+        cursor.execute("SELECT adopter_id FROM AdopterAdoptionCount WHERE adopter_id = %s FOR UPDATE", (adopter_id,))
+        cursor.fetchall()
+
+        cursor.execute("SELECT COUNT(*) FROM Adoption WHERE adopter_id = %s", (adopter_id,))
+        (count,) = cursor.fetchone()
+        cursor.execute("UPDATE AdopterAdoptionCount SET adoption_count = %s WHERE adopter_id = %s", (count, adopter_id))
+        bump_table_versions(cursor, ["Adoption"])
+        connection.commit()
+        return (count, None)
+
+    except Error as e:
+        connection.rollback()
+        return (None, str(e))
+    finally:
+        cursor.close()
+
+
+def check_adopter_counts(connection, repair=False, **_):
+    """
+    Compares AdopterAdoptionCount with COUNT(*) over Adoption per adopter.
+    Returns: (drift_count, repaired_count)
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT adopter_id, COUNT(*) FROM Adoption GROUP BY adopter_id")
+        actual = dict(cursor.fetchall())
+        cursor.execute("SELECT adopter_id, adoption_count FROM AdopterAdoptionCount")
+        stored = dict(cursor.fetchall())
+    finally:
+        cursor.close()
+    connection.commit()
+
+    drift, repaired = 0, 0
+    for adopter_id in sorted(set(actual) | set(stored)):
+        # Row na hona aur 0 count ek hi baat hai
+        if stored.get(adopter_id, 0) == actual.get(adopter_id, 0):
+            continue
+        drift += 1
+        stored_text = stored[adopter_id] if adopter_id in stored else "missing"
+        print(f"  adopter {adopter_id}: adoption_count {stored_text} != {actual.get(adopter_id, 0)}")
+
+        if repair:
+            _, error = repair_adopter_count(connection, adopter_id)
+            if error:
+                print(f"    repair failed: {error}")
+            else:
+                repaired += 1
+                print("    repaired")
+    return drift, repaired
+
+
+# --- Salary statistics ---
+
+SALARY_STATS_RECOUNT = """
+    SELECT 'all', '', COUNT(salary), COALESCE(SUM(salary), 0) FROM Employee
+    UNION ALL
+    SELECT 'role', COALESCE(role, ''), COUNT(*), SUM(salary)
+    FROM Employee WHERE salary IS NOT NULL GROUP BY COALESCE(role, '')
+    UNION ALL
+    SELECT 'shelter', COALESCE(CAST(shelter_id AS CHAR), ''), COUNT(*), SUM(salary)
+    FROM Employee WHERE salary IS NOT NULL GROUP BY COALESCE(CAST(shelter_id AS CHAR), '')
+"""
+SALARY_HISTOGRAM_RECOUNT = """
+    SELECT FLOOR(salary / 5000) * 5000, COUNT(*)
+    FROM Employee WHERE salary IS NOT NULL
+    GROUP BY FLOOR(salary / 5000) * 5000
+"""
+
+
+def _salary_state(cursor):
+    """Returns (actual stats, stored stats, actual histogram, stored histogram), zero rows dropped."""
+    def rows(query):
+        cursor.execute(query)
+        return cursor.fetchall()
+
+    # role collation case-insensitive hai, isliye keys ko lower() karke milao
+    actual = {(scope, key.lower()): (count, total) for scope, key, count, total in rows(SALARY_STATS_RECOUNT)
+              if count}
+    stored = {(scope, key.lower()): (count, total) for scope, key, count, total in rows(
+        "SELECT scope, scope_key, salary_count, salary_sum FROM SalaryStats") if count or total}
+    actual_hist = dict(rows(SALARY_HISTOGRAM_RECOUNT))
+    stored_hist = {bucket: count for bucket, count in rows(
+        "SELECT bucket_start, employee_count FROM SalaryHistogram") if count}
+    return actual, stored, actual_hist, stored_hist
+
+
+def repair_salary_stats(connection):
+    """
+    Rebuilds SalaryStats and SalaryHistogram from Employee in one transaction.
+    Every Employee trigger updates the 'all' row first, so locking it holds off all writers.
+    Returns: (True, None) on success, (None, str) on error
+    """
+    cursor = connection.cursor()
+    try:
+        connection.start_transaction(isolation_level='READ COMMITTED')
+        cursor.execute("INSERT IGNORE INTO SalaryStats (scope, scope_key) VALUES ('all', '')")
+        cursor.execute("SELECT scope FROM SalaryStats WHERE scope = 'all' AND scope_key = '' FOR UPDATE")
+        cursor.fetchall()
+
+        cursor.execute("DELETE FROM SalaryStats")
+        cursor.execute("INSERT INTO SalaryStats (scope, scope_key, salary_count, salary_sum) " + SALARY_STATS_RECOUNT)
+        cursor.execute("DELETE FROM SalaryHistogram")
+        cursor.execute("INSERT INTO SalaryHistogram (bucket_start, employee_count) " + SALARY_HISTOGRAM_RECOUNT)
+        bump_table_versions(cursor, ["Employee"])
+        connection.commit()
+        return (True, None)
+
+    except Error as e:
+        connection.rollback()
+        return (None, str(e))
+    finally:
+        cursor.close()
+
+
+def check_salary_stats(connection, repair=False, **_):
+    """
+    Compares SalaryStats / SalaryHistogram with a recount over Employee.
+    Any drift rebuilds both tables, so repaired is all-or-nothing.
+    Returns: (drift_count, repaired_count)
+    """
+    cursor = connection.cursor()
+    try:
+        actual, stored, actual_hist, stored_hist = _salary_state(cursor)
+    finally:
+        cursor.close()
+    connection.commit()
+
+    drift = 0
+    for key in sorted(set(actual) | set(stored)):
+        if actual.get(key, (0, 0)) != stored.get(key, (0, 0)):
+            drift += 1
+            print(f"  {key[0]} '{key[1]}': stored (count, sum) {stored.get(key, (0, 0))} != {actual.get(key, (0, 0))}")
+    for bucket in sorted(set(actual_hist) | set(stored_hist)):
+        if actual_hist.get(bucket, 0) != stored_hist.get(bucket, 0):
+            drift += 1
+            print(f"  bucket {bucket}: stored {stored_hist.get(bucket, 0)} != {actual_hist.get(bucket, 0)}")
+
+    if not drift or not repair:
+        return drift, 0
+    _, error = repair_salary_stats(connection)
+    if error:
+        print(f"    repair failed: {error}")
+        return drift, 0
+    print("    rebuilt SalaryStats and SalaryHistogram")
+    return drift, drift
+
+
+# name -> check function (connection, repair, **options) -> (drift, repaired)
+CHECKS = {
+    "shelter-summary": check_shelter_summary,
+    "adopter-counts": check_adopter_counts,
+    "salary-stats": check_salary_stats,
+}
+
+
+def run_reconcile(db_name, repair=False, fix_occupancy=False, only=None):
+    """
+    Runs every check (or just `only`). Returns True if no drift is left.
+    """
+    connection = get_db_connection(db_name)
+    clean = True
+    try:
+        for name, check in CHECKS.items():
+            if only and name not in only:
+                continue
+            print(f"\n--- {name} ---")
+            try:
+                drift, repaired = check(connection, repair=repair, fix_occupancy=fix_occupancy)
+            except Error as e:
+                print(f"Error during {name} check: {e}")
+                clean = False
+                continue
+            print(f"{drift} row(s) with drift, {repaired} repaired.")
+            if drift > repaired:
+                clean = False
+    finally:
+        connection.close()
+    return clean
+
+
+def main():
+    dotenv_path = os.path.join(os.path.dirname(__file__), '..', '.env')
+    from dotenv import load_dotenv
+    load_dotenv(dotenv_path=dotenv_path)
+
+    parser = argparse.ArgumentParser(description="Detect and repair drift in trigger-maintained summary tables.")
+    parser.add_argument("--repair", action="store_true", help="recount and overwrite drifted rows")
+    parser.add_argument("--fix-occupancy", action="store_true",
+                        help="with --repair, also set Shelter.current_occupancy to the available count")
+    parser.add_argument("--only", action="append", choices=sorted(CHECKS), help="run only this check (repeatable)")
+    args = parser.parse_args()
+
+    db_name = os.environ.get('DB_NAME', 'pet_adoption_db')
+    if not run_reconcile(db_name, repair=args.repair, fix_occupancy=args.fix_occupancy, only=args.only):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+# backend/db/report_cache.py
+# In-process read-through cache for the report queries.
+# Reports mehenge JOIN/GROUP BY queries hain, par data kam badalta hai.
+# Isliye result ko cache karte hain aur jab bhi koi dependent table badle, entry hata dete hain.
+#
+# invalidate_tables() sirf isi process ke writes dekhta hai. Doosre gunicorn worker, scripts ya
+# reconcile.py ke writes TableVersion counters badhate hain: conditional_get() jo counters padhta hai
+# woh db_table_versions mein rakhta hai, aur purane counters waali entry dobara compute hoti hai.
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+try:
+    from .metrics import register_collector
+except ImportError:
+    from metrics import register_collector
+
+REPORT_CACHE_TTL = float(os.environ.get('REPORT_CACHE_TTL', 60))               # seconds
+REPORT_CACHE_MAX_ENTRIES = int(os.environ.get('REPORT_CACHE_MAX_ENTRIES', 64))
+REPORT_CACHE_SERVE_STALE = os.environ.get('REPORT_CACHE_SERVE_STALE', '0').lower() in ('1', 'true', 'yes')
+
+# Is request ke liye TableVersion se padhe gaye counters (table -> version), conditional_get() set karta hai
+db_table_versions = contextvars.ContextVar('db_table_versions', default=None)
+
+# Ek table badalne par FK cascade / SET NULL se yeh tables bhi badal sakti hain
+TABLE_CASCADES = {
+    "Shelter": ("Animal", "Employee", "Donation"),
+    "Customer": ("Adopter", "Donor"),
+    "Employee": ("Adoption", "SalaryChangeLog"),
+}
+
+
+class ReportCache:
+    """
+    TTL + LRU cache for report results, keyed by (report name, args).
+    Every entry remembers which tables it was computed from; invalidate_tables()
+    drops exactly the entries that depend on the changed tables.
+
+    With serve_stale=True an expired (but not invalidated) entry is returned
+    immediately while one background thread recomputes it.
+
+    Entries also remember the DB change counters (db_table_versions) they were computed at.
+    A lookup that knows newer counters for any of the entry's tables treats it as a miss,
+    even within the TTL, so writes from other processes are never served from here.
+    """
+
+    def __init__(self, ttl=REPORT_CACHE_TTL, max_entries=REPORT_CACHE_MAX_ENTRIES,
+                 serve_stale=REPORT_CACHE_SERVE_STALE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.serve_stale = serve_stale
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # key -> (value, stored_at, tables, db_versions)
+        self._refreshing = set()
+        self._tasks = set()             # async refresh tasks (reference rakhna zaroori hai)
+        self._table_versions = {}       # table -> int, bumped on every invalidation
+        self._counters = {"hits": 0, "misses": 0, "stale_hits": 0,
+                          "invalidations": 0, "evictions": 0, "db_version_misses": 0}
+
+    def _versions(self, tables):
+        return tuple(self._table_versions.get(t, 0) for t in tables)
+
+    @staticmethod
+    def _db_versions(tables):
+        """This request's DB counters for `tables`, or None if conditional_get() did not read all of them."""
+        versions = db_table_versions.get()
+        if versions is None or any(t not in versions for t in tables):
+            return None
+        return tuple(versions[t] for t in tables)
+
+    def _store(self, key, value, tables, versions, db_versions):
+        with self._lock:
+            # Compute ke dauraan koi write hua? Toh yeh result purana hai, store mat karo
+            if self._versions(tables) != versions:
+                return
+            self._entries[key] = (value, time.monotonic(), tables, db_versions)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def _refresh_in_background(self, key, loader, tables, db_versions):
+        def run():
+            try:
+                with self._lock:
+                    versions = self._versions(tables)
+                data, error = loader()
+                if not error:
+                    self._store(key, data, tables, versions, db_versions)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def _refresh_in_task(self, key, loader, tables, db_versions):
+        async def run():
+            try:
+                with self._lock:
+                    versions = self._versions(tables)
+                data, error = await loader()
+                if not error:
+                    self._store(key, data, tables, versions, db_versions)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        task = asyncio.get_running_loop().create_task(run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _lookup(self, key, tables, db_versions, refresh):
+        """
+        Looks `key` up. Returns (True, value) on a hit; a stale entry starts refresh()
+        in the background. On a miss returns (False, table versions before loading).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored_at, _, stored_db_versions = entry
+                if db_versions is not None and (
+                        stored_db_versions is None
+                        or any(stored < current for stored, current in zip(stored_db_versions, db_versions))):
+                    # Kisi aur process ne likha (counter aage badh gaya): purana result kabhi mat do
+                    del self._entries[key]
+                    self._counters["db_version_misses"] += 1
+                elif time.monotonic() - stored_at <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self._counters["hits"] += 1
+                    return (True, value)
+                elif self.serve_stale:
+                    self._counters["stale_hits"] += 1
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        refresh()
+                    return (True, value)
+                else:
+                    del self._entries[key]
+            self._counters["misses"] += 1
+            return (False, self._versions(tables))
+
+    def get_or_load(self, key, tables, loader):
+        """
+        Returns loader()'s (data, error) result, from cache when possible.
+        Errors are never cached.
+        """
+        db_versions = self._db_versions(tables)
+        hit, result = self._lookup(key, tables, db_versions,
+                                   lambda: self._refresh_in_background(key, loader, tables, db_versions))
+        if hit:
+            return (result, None)
+
+        data, error = loader()
+        if not error:
+            self._store(key, data, tables, result, db_versions)
+        return (data, error)
+
+    async def get_or_load_async(self, key, tables, loader):
+        """
+        Same as get_or_load(), for an async loader. Sync and async reports with the
+        same name and arguments share one cache entry.
+        """
+        db_versions = self._db_versions(tables)
+        hit, result = self._lookup(key, tables, db_versions,
+                                   lambda: self._refresh_in_task(key, loader, tables, db_versions))
+        if hit:
+            return (result, None)
+
+        data, error = await loader()
+        if not error:
+            self._store(key, data, tables, result, db_versions)
+        return (data, error)
+
+    def invalidate_tables(self, tables):
+        """Drops every cached report that reads from any of `tables`."""
+        changed = set(tables)
+        for table in tables:
+            changed.update(TABLE_CASCADES.get(table, ()))
+
+        with self._lock:
+            for table in changed:
+                self._table_versions[table] = self._table_versions.get(table, 0) + 1
+            stale_keys = [key for key, (_, _, deps, _) in self._entries.items() if changed.intersection(deps)]
+            for key in stale_keys:
+                del self._entries[key]
+            self._counters["invalidations"] += len(stale_keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["stale_hits"] + self._counters["misses"]
+            hits = self._counters["hits"] + self._counters["stale_hits"]
+            return dict(self._counters,
+                        entries=len(self._entries),
+                        max_entries=self.max_entries,
+                        ttl=self.ttl,
+                        serve_stale=self.serve_stale,
+                        hit_ratio=round(hits / lookups, 3) if lookups else 0.0)
+
+
+report_cache = ReportCache()
+
+
+def cached_report(depends_on):
+    """
+    Decorator for report functions that return (data, error).
+    `depends_on` is the list of tables the report reads from.
+    """
+    def decorator(func):
+        tables = tuple(depends_on)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            return report_cache.get_or_load(key, tables, lambda: func(*args, **kwargs))
+
+        wrapper.uncached = func
+        wrapper.depends_on = tables
+        return wrapper
+    return decorator
+
+
+def async_cached_report(depends_on):
+    """
+    cached_report() for async report functions (db/async_queries.py).
+    Key mein sirf function ka naam hai, isliye sync aur async version ek hi entry padhte hain.
+    """
+    def decorator(func):
+        tables = tuple(depends_on)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            return await report_cache.get_or_load_async(key, tables, lambda: func(*args, **kwargs))
+
+        wrapper.uncached = func
+        wrapper.depends_on = tables
+        return wrapper
+    return decorator
+
+
+def invalidate_tables(tables):
+    """Called by the write paths after a successful commit."""
+    report_cache.invalidate_tables(tables)
+
+
+def get_report_cache_stats():
+    return report_cache.stats()
+
+
+def _cache_metric_lines():
+    stats = report_cache.stats()
+    return [
+        ("report_cache_lookups", "Report cache lookups by result (since start).", ("result",),
+         [(("hit",), stats["hits"]), (("stale_hit",), stats["stale_hits"]), (("miss",), stats["misses"])]),
+        ("report_cache_entries", "Cached report results.", (), [((), stats["entries"])]),
+    ]
+
+
+register_collector(_cache_metric_lines)
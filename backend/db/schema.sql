@@ -5,7 +5,9 @@ DROP TABLE IF EXISTS `Donation`;
 DROP TABLE IF EXISTS `Adoption`;
 DROP TABLE IF EXISTS `SalaryChangeLog`; 
 DROP TABLE IF EXISTS `Donor`;
+DROP TABLE IF EXISTS `AdopterAdoptionCount`;
 DROP TABLE IF EXISTS `Adopter`;
+DROP TABLE IF EXISTS `ShelterAnimalSummary`;
 DROP TABLE IF EXISTS `Animal`;
 DROP TABLE IF EXISTS `Employee`; 
 
@@ -15,6 +17,18 @@ DROP TABLE IF EXISTS `Shelter`;
 
 /* Independent tables */
 DROP TABLE IF EXISTS `AuditLog`;
+DROP TABLE IF EXISTS `SalaryStats`;
+DROP TABLE IF EXISTS `SalaryHistogram`;
+
+/* Migration history bhi reset (naye schema par saari migrations dobara chalengi) */
+DROP TABLE IF EXISTS `SchemaMigration`;
+
+/* TableVersion ko DROP NAHI karte: counters kabhi peeche nahi jaane chahiye, */
+/* warna purane ETag naye (alag) data se match ho sakte hain. */
+CREATE TABLE IF NOT EXISTS `TableVersion` (
+  `table_name` VARCHAR(64) PRIMARY KEY,
+  `version` BIGINT UNSIGNED NOT NULL DEFAULT 0
+);
 
 
 /* Ab tables create karo  */
@@ -61,6 +75,16 @@ CREATE TABLE `Animal` (
   CONSTRAINT `chk_status` CHECK (`status` IN ('Available', 'Adopted', 'Pending'))
 );
 
+/* Har shelter ke animals ki ginti, status ke hisaab se. Animal triggers isko */
+/* usi transaction mein update karte hain (occupancy report isi ko padhta hai). */
+CREATE TABLE `ShelterAnimalSummary` (
+  `shelter_id` INT PRIMARY KEY,
+  `available_count` INT NOT NULL DEFAULT 0,
+  `pending_count` INT NOT NULL DEFAULT 0,
+  `adopted_count` INT NOT NULL DEFAULT 0,
+  FOREIGN KEY (`shelter_id`) REFERENCES `Shelter`(`shelter_id`) ON DELETE CASCADE
+);
+
 CREATE TABLE `Adopter` (
   `adopter_id` INT AUTO_INCREMENT PRIMARY KEY,
   `customer_id` INT NOT NULL UNIQUE,
@@ -85,6 +109,15 @@ CREATE TABLE `Adoption` (
   FOREIGN KEY (`employee_id`) REFERENCES `Employee`(`employee_id`) ON DELETE SET NULL
 );
 
+/* Har adopter ne kitne adoptions kiye (Adoption triggers maintain karte hain). */
+/* Index se multi-adopters / top adopters report ek range scan ban jaata hai. */
+CREATE TABLE `AdopterAdoptionCount` (
+  `adopter_id` INT PRIMARY KEY,
+  `adoption_count` INT NOT NULL DEFAULT 0,
+  INDEX `idx_adoption_count` (`adoption_count`),
+  FOREIGN KEY (`adopter_id`) REFERENCES `Adopter`(`adopter_id`) ON DELETE CASCADE
+);
+
 CREATE TABLE `Donation` (
   `donation_id` INT AUTO_INCREMENT PRIMARY KEY,
   `donor_id` INT NOT NULL,
@@ -112,4 +145,25 @@ CREATE TABLE `SalaryChangeLog` (
   `new_salary` DECIMAL(10, 2),
   `changed_at` TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   FOREIGN KEY (`employee_id`) REFERENCES `Employee`(`employee_id`) ON DELETE CASCADE
-);
\ No newline at end of file
+);
+
+/* Salary ke running aggregates (Employee triggers maintain karte hain). */
+/* scope: 'all' (scope_key ''), 'role' (role ka naam), 'shelter' (shelter_id). NULL salary gini nahi jaati. */
+CREATE TABLE `SalaryStats` (
+  `scope` VARCHAR(10) NOT NULL,
+  `scope_key` VARCHAR(50) NOT NULL,
+  `salary_count` INT NOT NULL DEFAULT 0,
+  `salary_sum` DECIMAL(20, 2) NOT NULL DEFAULT 0,
+  PRIMARY KEY (`scope`, `scope_key`)
+);
+
+/* Salary histogram: fixed-width buckets (AdjustSalaryStats mein width 5000) */
+CREATE TABLE `SalaryHistogram` (
+  `bucket_start` DECIMAL(10, 2) PRIMARY KEY,
+  `employee_count` INT NOT NULL DEFAULT 0
+);
+
+/* Tables naye bane hain: har counter badha do (saare purane ETag invalid) */
+INSERT INTO `TableVersion` (`table_name`, `version`)
+VALUES ('Shelter', 1), ('Animal', 1), ('Employee', 1), ('Customer', 1), ('Adopter', 1), ('Adoption', 1)
+ON DUPLICATE KEY UPDATE `version` = `version` + 1;
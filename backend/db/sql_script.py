@@ -0,0 +1,324 @@
+# backend/db/sql_script.py
+# .sql scripts ko stream karke statements mein todna aur execute karna.
+# creation.py aur migrate.py dono isko use karte hain.
+#
+# Tokenizer file ko chunks mein padhta hai (poori file memory mein nahi aati) aur
+# quotes, comments aur DELIMITER ko sahi handle karta hai, taaki string ke andar ';'
+# ya comment ke andar DELIMITER statement ko galat jagah se na tode.
+
+import io
+import re
+import time
+
+from mysql.connector import Error
+
+READ_CHUNK_SIZE = 1 << 16
+
+_NORMAL, _QUOTE, _LINE_COMMENT, _BLOCK_COMMENT = range(4)
+_DELIMITER_LINE_RE = re.compile(r'[ \t]*DELIMITER[ \t]+(\S+)[^\n]*(\n|$)', re.IGNORECASE)
+
+
+# Quote ke andar sirf closing quote (aur ' / " mein backslash escape) dhoondna hai
+_QUOTE_PATTERNS = {
+    "'": re.compile(r"['\\]"),
+    '"': re.compile(r'["\\]'),
+    '`': re.compile(r'`'),
+}
+
+
+def _normal_pattern(delimiter):
+    # complete quoted string | lone quote | '-- ' comment | '#' comment | block comment | newline | delimiter
+    return re.compile(
+        r"""'(?:[^'\\]|\\.|'')*'|"(?:[^"\\]|\\.|"")*"|`[^`]*`|"""
+        r"""['"`]|--(?=[ \t\r\n])|--$|\#|/\*|\n|""" + re.escape(delimiter),
+        re.DOTALL
+    )
+
+
+def iter_sql_statements(stream, chunk_size=READ_CHUNK_SIZE):
+    """
+    Streams SQL statements out of a text file object.
+    Yields (statement, is_compound): is_compound is True for statements written
+    inside a 'DELIMITER $$' block (triggers, procedures), which must be sent alone.
+
+    - ';' inside '...', "...", `...` and comments does not end a statement
+    - '-- ', '#' and plain /* */ comments are dropped; /*! */ and /*+ */ are kept
+    - DELIMITER is only recognised at the start of a statement, like the mysql client
+    """
+    delimiter = ';'
+    pattern = _normal_pattern(delimiter)
+    lookahead = 3
+
+    buf = ''
+    pos = 0
+    eof = False
+    state = _NORMAL
+    quote = None
+    keep_comment = False
+    at_line_start = True
+
+    parts = []          # current statement ke tukde (string concat se bachne ke liye list)
+    has_content = False
+
+    def refill():
+        nonlocal buf, pos, eof
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            eof = True
+        buf = buf[pos:] + chunk
+        pos = 0
+
+    def append(text):
+        nonlocal has_content
+        if text:
+            parts.append(text)
+            if not has_content and text.strip():
+                has_content = True
+
+    def take_statement():
+        nonlocal parts, has_content
+        statement = ''.join(parts).strip()
+        parts = []
+        has_content = False
+        return statement
+
+    refill()
+    while True:
+        if state == _NORMAL:
+            if at_line_start and not has_content:
+                # Naye statement ki shuruaat: kya yeh DELIMITER line hai?
+                while not eof and '\n' not in buf[pos:pos + 200] and len(buf) - pos < 200:
+                    refill()
+                match = _DELIMITER_LINE_RE.match(buf, pos)
+                if match:
+                    delimiter = match.group(1)
+                    pattern = _normal_pattern(delimiter)
+                    lookahead = max(3, len(delimiter) + 1)
+                    parts = []
+                    pos = match.end()
+                    continue
+            at_line_start = False
+
+            # Poore quoted strings ko bina copy kiye skip karo; pos..scan ka text baad mein ek saath append hota hai
+            scan = pos
+            while True:
+                match = pattern.search(buf, scan)
+                if match is None or len(match.group(0)) < 2 or match.group(0)[0] not in '\'"`':
+                    break
+                if match.end() >= len(buf) and not eof:
+                    break   # '' escape agle chunk mein ho sakta hai
+                scan = match.end()
+
+            if match is None:
+                if eof:
+                    append(buf[pos:])
+                    pos = len(buf)
+                    break
+                # Aakhri kuch characters token ka hissa ho sakte hain, unhe rakh lo
+                keep_from = max(scan, len(buf) - lookahead)
+                append(buf[pos:keep_from])
+                pos = keep_from
+                refill()
+                continue
+            if match.end() + lookahead > len(buf) and not eof:
+                # Token chunk boundary par kat sakta hai, pehle aur padho
+                append(buf[pos:match.start()])
+                pos = match.start()
+                refill()
+                continue
+
+            token = match.group(0)
+            if len(token) > 1 and token[0] in '\'"`':
+                # Poora string (EOF par aakhri token)
+                append(buf[pos:match.end()])
+            elif token in ("'", '"', '`'):
+                append(buf[pos:match.end()])
+                state, quote = _QUOTE, token
+            elif token in ('--', '#'):
+                append(buf[pos:match.start()])
+                state = _LINE_COMMENT
+            elif token == '/*':
+                keep_comment = buf[match.end():match.end() + 1] in ('!', '+')
+                if keep_comment:
+                    append(buf[pos:match.end()])
+                else:
+                    append(buf[pos:match.start()] + ' ')
+                state = _BLOCK_COMMENT
+            elif token == '\n':
+                append(buf[pos:match.end()])
+                at_line_start = True
+            else:
+                # Delimiter mila: statement poora hua
+                append(buf[pos:match.start()])
+                statement = take_statement()
+                if statement:
+                    yield statement, delimiter != ';'
+            pos = match.end()
+
+        elif state == _QUOTE:
+            match = _QUOTE_PATTERNS[quote].search(buf, pos)
+            if match is None or (match.end() + 1 > len(buf) and not eof):
+                if eof:
+                    append(buf[pos:])
+                    pos = len(buf)
+                    break
+                refill()
+                continue
+            if match.group(0) == '\\':
+                # Backslash escape: agla character bhi string ka hissa hai
+                append(buf[pos:match.end() + 1])
+                pos = match.end() + 1
+            elif buf[match.end():match.end() + 1] == quote:
+                # '' ya "" = escaped quote
+                append(buf[pos:match.end() + 1])
+                pos = match.end() + 1
+            else:
+                append(buf[pos:match.end()])
+                pos = match.end()
+                state = _NORMAL
+
+        elif state == _LINE_COMMENT:
+            index = buf.find('\n', pos)
+            if index == -1:
+                if eof:
+                    pos = len(buf)
+                    break
+                pos = len(buf)
+                refill()
+                continue
+            # Newline NORMAL state ko milega (DELIMITER detection ke liye)
+            pos = index
+            state = _NORMAL
+
+        elif state == _BLOCK_COMMENT:
+            index = buf.find('*/', pos)
+            if index == -1:
+                if eof:
+                    if keep_comment:
+                        append(buf[pos:])
+                    pos = len(buf)
+                    break
+                # '*' aakhri character ho sakta hai, usko rakh lo
+                keep_to = max(pos, len(buf) - 1)
+                if keep_comment:
+                    append(buf[pos:keep_to])
+                pos = keep_to
+                refill()
+                continue
+            if keep_comment:
+                append(buf[pos:index + 2])
+            pos = index + 2
+            state = _NORMAL
+
+    statement = take_statement()
+    if statement:
+        yield statement, delimiter != ';'
+
+
+def split_sql_commands(sql_script):
+    """
+    Splits a SQL script string into individual commands (without delimiters).
+    Small-script convenience wrapper around iter_sql_statements().
+    """
+    for statement, _ in iter_sql_statements(io.StringIO(sql_script)):
+        yield statement
+
+
+def _preview(sql, width=80):
+    text = ' '.join(sql.split())
+    return text if len(text) <= width else text[:width - 3] + '...'
+
+
+class SqlScriptExecutor:
+    """
+    Runs .sql files over ONE connection.
+    Plain statements are grouped into multi-statement round-trips
+    (up to batch_statements / batch_bytes); DELIMITER blocks are sent alone.
+    Every statement's server time is recorded for the final report.
+    """
+
+    def __init__(self, connection, batch_statements=50, batch_bytes=1 << 20):
+        self.connection = connection
+        self.batch_statements = batch_statements
+        self.batch_bytes = batch_bytes
+        self.timings = []   # (file_name, statement_no, ms, preview)
+        self._batch = []    # (statement_no, sql)
+        self._batch_size = 0
+        self._file_name = None
+
+    def _flush(self):
+        """Sends the pending batch. Returns True on success."""
+        if not self._batch:
+            return True
+        batch, self._batch, self._batch_size = self._batch, [], 0
+
+        sql = ';\n'.join(statement for _, statement in batch)
+        received = 0
+        last = time.perf_counter()
+        try:
+            # Har result aane par agla statement ka time shuru
+            for result in self.connection.cmd_query_iter(sql):
+                if 'columns' in result:
+                    self.connection.get_rows()
+                now = time.perf_counter()
+                number, statement = batch[received]
+                self.timings.append((self._file_name, number, (now - last) * 1000, _preview(statement)))
+                last = now
+                received += 1
+        except Error as e:
+            number, statement = batch[min(received, len(batch) - 1)]
+            print("\n--- ERROR ---")
+            print(f"Error executing command #{number} in {self._file_name}: {e}")
+            print(f"Failed Command: {_preview(statement, 300)}")
+            print("--- END ERROR ---")
+            self.connection.rollback()
+            return False
+        return True
+
+    def execute_file(self, file_path):
+        """Streams and executes one .sql file. Returns True on success."""
+        self._file_name = file_path.replace('\\', '/').rsplit('/', 1)[-1]
+        print(f"Executing SQL file: {file_path}")
+        start = time.perf_counter()
+        count = 0
+
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for statement, is_compound in iter_sql_statements(f):
+                    count += 1
+                    if is_compound:
+                        # Trigger / procedure: akela bhejo
+                        if not self._flush():
+                            return False
+                        self._batch.append((count, statement))
+                        if not self._flush():
+                            return False
+                        continue
+
+                    self._batch.append((count, statement))
+                    self._batch_size += len(statement)
+                    if len(self._batch) >= self.batch_statements or self._batch_size >= self.batch_bytes:
+                        if not self._flush():
+                            return False
+        except FileNotFoundError:
+            print(f"Error: SQL file not found at {file_path}")
+            return False
+        except Exception as e:
+            print(f"Error reading file: {e}")
+            return False
+
+        if not self._flush():
+            return False
+        self.connection.commit()
+        print(f"Successfully executed SQL file: {file_path} ({count} statements, "
+              f"{(time.perf_counter() - start) * 1000:.0f} ms)")
+        return True
+
+    def print_report(self, top=10):
+        """Prints total time and the slowest statements."""
+        if not self.timings:
+            return
+        total = sum(ms for _, _, ms, _ in self.timings)
+        print(f"\n--- SQL TIMING: {len(self.timings)} statements, {total:.0f} ms total ---")
+        for file_name, number, ms, preview in sorted(self.timings, key=lambda t: -t[2])[:top]:
+            print(f"  {ms:9.1f} ms  {file_name}#{number}: {preview}")
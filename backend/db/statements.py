@@ -0,0 +1,146 @@
+# backend/db/statements.py
+# Generic CRUD functions (insert / update / delete_record, select_record_by_id,
+# select_records_by_criteria) ka compiled-SQL cache.
+# Pehle har call par f-strings + join se SQL banta tha; ab key
+#   (operation, table, columns, key column)
+# ke liye SQL ek hi baar banta hai. Table aur column naam us waqt information_schema
+# (get_table_columns) se check hote hain, isliye cache mein sirf validated SQL hota hai.
+#
+# Wahi str object har baar milta hai, isliye connection.py ka prepared cursor use pehchan kar
+# dobara PREPARE nahi karta (sirf COM_STMT_EXECUTE, binary protocol).
+#
+# - STATEMENT_CACHE_SIZE=512     compiled statements (process bhar mein; bhar jaaye toh sabse purana nikalta hai)
+#
+# Hit path sirf nested dict lookups hai, koi lock / LRU / counter / function call nahi:
+#   COMPILED_STATEMENTS[operation][table_name][key_column][columns]
+# (sab str keys + columns ka tuple, flat 4-tuple key banane aur hash karne se sasta). CRUD functions
+# yeh lookup khud inline karte hain aur KeyError par hi get_statement() bulaate hain; warna yeh
+# cache un f-strings se bhi dheema tha jinki jagah aaya hai. Key space chhota hai
+# (operations x tables x column sets), isliye eviction / counters sirf compile (miss) par hote hain.
+
+import os
+import threading
+
+try:
+    from .metrics import register_collector
+except ImportError:
+    # This fallback helps if running the file directly
+    from metrics import register_collector
+
+STATEMENT_CACHE_SIZE = int(os.environ.get('STATEMENT_CACHE_SIZE', 512))
+
+def statement_key(operation, table_name, columns=(), key_column=None):
+    """Cache key. Column order is kept: placeholders follow it, so values can be bound as given."""
+    return (operation, table_name, tuple(columns), key_column)
+
+
+def _backticked(columns):
+    return '`' + '`, `'.join(columns) + '`'
+
+
+def build_statement(operation, table_name, columns, key_column):
+    """SQL text for one (already validated) statement key. Placeholders follow `columns`, then `key_column`."""
+    if operation == "insert":
+        placeholders = ', '.join(['%s'] * len(columns))
+        return f"INSERT INTO `{table_name}` ({_backticked(columns)}) VALUES ({placeholders})"
+    if operation == "update":
+        set_clause = ", ".join(f"`{column}` = %s" for column in columns)
+        return f"UPDATE `{table_name}` SET {set_clause} WHERE `{key_column}` = %s"
+    if operation == "delete":
+        return f"DELETE FROM `{table_name}` WHERE `{key_column}` = %s"
+    if operation == "select_by_id":
+        select_list = _backticked(columns) if columns else '*'
+        return f"SELECT {select_list} FROM `{table_name}` WHERE `{key_column}` = %s"
+    if operation == "select_by_criteria":
+        where_clause = " AND ".join(f"`{column}` = %s" for column in columns)
+        return f"SELECT * FROM `{table_name}` WHERE {where_clause}"
+    raise ValueError(f"Unknown statement operation: {operation}")
+
+
+class StatementCache:
+    """
+    Compiled statements: entries[operation][table_name][key_column][columns] -> SQL str
+    (the same object on every hit). `entries` is plain nested dicts that callers read directly
+    (lock-free, GIL-safe); it is only written by compile(), which evicts the oldest compiled
+    key once max_entries is reached.
+    """
+
+    def __init__(self, max_entries=STATEMENT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.entries = {}
+        self._compiled = {} # key -> None, compile order (eviction ke liye)
+        self._counters = {"compiles": 0, "evictions": 0}
+
+    def get(self, key):
+        operation, table_name, columns, key_column = key
+        try:
+            return self.entries[operation][table_name][key_column][columns]
+        except KeyError:
+            return None
+
+    def _evict_oldest(self):
+        key = next(iter(self._compiled))
+        del self._compiled[key]
+        operation, table_name, columns, key_column = key
+        by_table = self.entries[operation]
+        by_key_column = by_table[table_name]
+        by_columns = by_key_column[key_column]
+        del by_columns[columns]
+        # Khaali levels bhi hatao, warna purane tables ke dicts pade rehte hain
+        if not by_columns:
+            del by_key_column[key_column]
+            if not by_key_column:
+                del by_table[table_name]
+                if not by_table:
+                    del self.entries[operation]
+
+    def compile(self, key, table_columns):
+        """
+        Validates the key's identifiers against `table_columns` and caches its SQL.
+        Returns: (str, None) on success, (None, str) if a column is not in the table
+        """
+        operation, table_name, columns, key_column = key
+        unknown = [column for column in columns + (key_column,) if column and column not in table_columns]
+        if unknown:
+            return (None, f"Unknown field(s) for {table_name}: {', '.join(unknown)}")
+
+        sql = build_statement(operation, table_name, columns, key_column)
+        with self._lock:
+            # Doosre thread ne beech mein bana diya? Wahi object rakho
+            if key not in self._compiled:
+                self._counters["compiles"] += 1
+                while self._compiled and len(self._compiled) >= self.max_entries:
+                    # dict insertion order = compile order: sabse purana nikaalo
+                    self._evict_oldest()
+                    self._counters["evictions"] += 1
+                self._compiled[key] = None
+            by_columns = (self.entries.setdefault(operation, {})
+                                      .setdefault(table_name, {})
+                                      .setdefault(key_column, {}))
+            sql = by_columns.setdefault(columns, sql)
+        return (sql, None)
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counters, size=len(self._compiled), max_entries=self.max_entries)
+
+
+statement_cache = StatementCache()
+# CRUD functions / get_statement() ka hit path isi ko seedha padhta hai
+COMPILED_STATEMENTS = statement_cache.entries
+
+
+def get_statement_cache_stats():
+    return statement_cache.stats()
+
+
+def _statement_metric_lines():
+    stats = statement_cache.stats()
+    return [("statement_cache_compiles", "CRUD statements compiled (cache misses) since start.", (),
+             [((), stats["compiles"])]),
+            ("statement_cache_size", "Compiled CRUD statements in the cache.", (),
+             [((), stats["size"])])]
+
+
+register_collector(_statement_metric_lines)
@@ -0,0 +1,407 @@
+# backend/db/suggest_index.py
+# /api/suggest (type-ahead) ke liye in-process prefix index.
+# Har kind (animal / customer / employee) ke liye ek sorted array of (key, id) hai;
+# prefix lookup do bisect hai, isliye jawab DB ke bina, microseconds mein aata hai.
+#
+# - Startup par ek background thread poora index banata hai (start_suggest_index()).
+# - update_delete.py / async_update_delete.py ke writes commit ke baad index ko
+#   seedha update karte hain (suggest_upsert / suggest_update / suggest_delete).
+# - Doosre processes (gunicorn workers, scripts) ke writes yahan nahi dikhte, isliye
+#   har SUGGEST_REBUILD_INTERVAL seconds par index dobara banta hai.
+# - SUGGEST_MAX_RECORDS se zyada records (per kind) index nahi hote: memory bounded hai.
+
+import os
+import threading
+import time
+from bisect import bisect_left, insort
+
+from mysql.connector import Error
+
+try:
+    from .connection import get_pooled_connection
+    from .queries import DB_NAME
+    from .metrics import register_collector, timed_query
+    from .logs import get_logger
+except ImportError:
+    # This fallback helps if running the file directly
+    from connection import get_pooled_connection
+    from queries import DB_NAME
+    from metrics import register_collector, timed_query
+    from logs import get_logger
+
+SUGGEST_INDEX_ENABLED = os.environ.get('SUGGEST_INDEX_ENABLED', '1').lower() in ('1', 'true', 'yes')
+SUGGEST_MAX_RECORDS = int(os.environ.get('SUGGEST_MAX_RECORDS', 200000))          # per kind
+SUGGEST_REBUILD_INTERVAL = float(os.environ.get('SUGGEST_REBUILD_INTERVAL', 600))  # seconds, 0 = never
+
+log = get_logger('db.suggest_index')
+
+# kind -> source table, primary key, columns kept per record, searchable columns
+SUGGEST_KINDS = {
+    "animal": {
+        "table": "Animal", "id": "animal_id",
+        "columns": ("animal_id", "name", "species", "breed", "status", "shelter_id"),
+        "keys": ("name",),
+    },
+    "customer": {
+        "table": "Customer", "id": "customer_id",
+        "columns": ("customer_id", "first_name", "last_name", "phone", "adopter_id"),
+        "keys": ("first_name", "last_name", "phone"),
+    },
+    "employee": {
+        "table": "Employee", "id": "employee_id",
+        "columns": ("employee_id", "name", "role", "shelter_id"),
+        "keys": ("name",),
+    },
+}
+TABLE_KINDS = {spec["table"]: kind for kind, spec in SUGGEST_KINDS.items()}
+
+SUGGEST_LOAD_QUERIES = {
+    "animal": "SELECT `animal_id`, `name`, `species`, `breed`, `status`, `shelter_id` FROM `Animal`",
+    # adopter_id: adoption form ko customer ka adopter ID chahiye (donor-only customers ke liye NULL)
+    "customer": """
+        SELECT c.customer_id, c.first_name, c.last_name, c.phone, a.adopter_id
+        FROM Customer c
+        LEFT JOIN Adopter a ON a.customer_id = c.customer_id
+    """,
+    "employee": "SELECT `employee_id`, `name`, `role`, `shelter_id` FROM `Employee`",
+}
+
+
+def normalize(text):
+    """Lookup form of a name: case-folded, single spaces."""
+    return ' '.join(str(text).casefold().split())
+
+
+def _digits(text):
+    return ''.join(ch for ch in str(text) if ch.isdigit())
+
+
+def record_keys(kind, record):
+    """
+    Index keys of one record: the full value and every word suffix of each searchable
+    column ('amit sharma' -> 'amit sharma', 'sharma'), so any word can be typed first.
+    Phones are indexed as digits only.
+    """
+    keys = set()
+    for column in SUGGEST_KINDS[kind]["keys"]:
+        value = record.get(column)
+        if value in (None, ''):
+            continue
+        if column == "phone":
+            digits = _digits(value)
+            if digits:
+                keys.add(digits)
+            continue
+        words = normalize(value).split(' ')
+        for start in range(len(words)):
+            keys.add(' '.join(words[start:]))
+    return keys
+
+
+def record_label(kind, record):
+    if kind == "animal":
+        details = ', '.join(str(v) for v in (record.get("species"), record.get("breed")) if v)
+        return f"{record['name']} ({details})" if details else str(record["name"])
+    if kind == "customer":
+        name = f"{record.get('first_name') or ''} {record.get('last_name') or ''}".strip()
+        return f"{name} ({record['phone']})" if record.get("phone") else name
+    return f"{record['name']} ({record['role']})" if record.get("role") else str(record["name"])
+
+
+class PrefixIndex:
+    """
+    Sorted (key, id) arrays + id -> record dicts, one pair per kind, behind one lock.
+    Writes are O(log n) search + list insert/delete; lookups are two bisects + `limit` steps.
+    While a rebuild is loading, writes are also queued and replayed on the new data,
+    so nothing committed during the rebuild is lost.
+    """
+
+    def __init__(self, max_records=SUGGEST_MAX_RECORDS):
+        self.max_records = max_records
+        self._lock = threading.Lock()
+        self._keys = {kind: [] for kind in SUGGEST_KINDS}
+        self._records = {kind: {} for kind in SUGGEST_KINDS}
+        self._pending = None            # list of queued writes while rebuild() loads
+        self.ready = False
+        self.truncated = set()          # kinds that hit max_records
+        self.built_at = None
+
+    # --- internal (lock held) ---
+    def _add(self, keys, records, kind, record):
+        record_id = record[SUGGEST_KINDS[kind]["id"]]
+        if record_id not in records and len(records) >= self.max_records:
+            self.truncated.add(kind)
+            return
+        self._discard(keys, records, kind, record_id)
+        records[record_id] = record
+        for key in record_keys(kind, record):
+            insort(keys, (key, record_id))
+
+    def _discard(self, keys, records, kind, record_id):
+        record = records.pop(record_id, None)
+        if record is None:
+            return
+        for key in record_keys(kind, record):
+            position = bisect_left(keys, (key, record_id))
+            if position < len(keys) and keys[position] == (key, record_id):
+                del keys[position]
+
+    def _apply(self, keys, records, operation):
+        action, kind, args = operation
+        if action == "upsert":
+            self._add(keys[kind], records[kind], kind, args[0])
+        elif action == "update":
+            record_id, changes = args
+            record = records[kind].get(record_id)
+            if record is not None:
+                self._add(keys[kind], records[kind], kind, dict(record, **changes))
+        elif action == "remove":
+            self._discard(keys[kind], records[kind], kind, args[0])
+        elif action == "update_where":
+            column, value, changes = args
+            # Rare (shelter / adopter delete): poora scan theek hai
+            for record_id, record in list(records[kind].items()):
+                if record.get(column) == value:
+                    if changes is None:
+                        self._discard(keys[kind], records[kind], kind, record_id)
+                    else:
+                        self._add(keys[kind], records[kind], kind, dict(record, **changes))
+
+    def _write(self, action, kind, *args):
+        operation = (action, kind, args)
+        with self._lock:
+            self._apply(self._keys, self._records, operation)
+            if self._pending is not None:
+                self._pending.append(operation)
+
+    # --- writes ---
+    def upsert(self, kind, record):
+        columns = SUGGEST_KINDS[kind]["columns"]
+        self._write("upsert", kind, {column: record.get(column) for column in columns})
+
+    def update(self, kind, record_id, changes):
+        columns = SUGGEST_KINDS[kind]["columns"]
+        changes = {column: value for column, value in changes.items() if column in columns}
+        if changes:
+            self._write("update", kind, record_id, changes)
+
+    def remove(self, kind, record_id):
+        self._write("remove", kind, record_id)
+
+    def update_where(self, kind, column, value, changes):
+        """Patches (or removes, changes=None) every record whose `column` equals `value`."""
+        self._write("update_where", kind, column, value, changes)
+
+    def rebuild(self, load_rows):
+        """
+        Reloads everything from `load_rows(kind)` -> (rows, error).
+        The old data keeps answering lookups until the new arrays are swapped in.
+        Returns: (dict of record counts, None) on success, (None, str) on error
+        """
+        with self._lock:
+            self._pending = []
+        try:
+            keys = {kind: [] for kind in SUGGEST_KINDS}
+            records = {kind: {} for kind in SUGGEST_KINDS}
+            truncated = set()
+            for kind in SUGGEST_KINDS:
+                rows, error = load_rows(kind)
+                if error:
+                    return (None, error)
+                if len(rows) > self.max_records:
+                    truncated.add(kind)
+                    rows = rows[:self.max_records]
+                records[kind] = {row[SUGGEST_KINDS[kind]["id"]]: row for row in rows}
+                # Ek hi sort() baar-baar insort se kaafi tez hai
+                keys[kind] = sorted((key, record_id) for record_id, row in records[kind].items()
+                                    for key in record_keys(kind, row))
+
+            with self._lock:
+                self.truncated = truncated
+                for operation in self._pending:
+                    self._apply(keys, records, operation)
+                self._keys, self._records = keys, records
+                self.ready = True
+                self.built_at = time.time()
+                return ({kind: len(records[kind]) for kind in SUGGEST_KINDS}, None)
+        finally:
+            with self._lock:
+                self._pending = None
+
+    # --- reads ---
+    def search(self, text, kinds, limit, status=None):
+        """
+        Records whose indexed words start with `text`, per kind, at most `limit` each.
+        `status` (optional) only applies to animals (e.g. 'Available' for the adoption form).
+        """
+        prefix = normalize(text)
+        digits = _digits(text)
+        results = {}
+        with self._lock:
+            for kind in kinds:
+                keys, records = self._keys[kind], self._records[kind]
+                found = []
+                seen = set()
+                prefixes = [prefix]
+                if kind == "customer" and digits and digits != prefix:
+                    prefixes.append(digits)     # '98-765' -> phone digits '98765'
+                for current in prefixes:
+                    position = bisect_left(keys, (current,))
+                    while position < len(keys) and len(found) < limit:
+                        key, record_id = keys[position]
+                        if not key.startswith(current):
+                            break
+                        position += 1
+                        if record_id in seen:
+                            continue
+                        seen.add(record_id)
+                        record = records[record_id]
+                        if status and kind == "animal" and record.get("status") != status:
+                            continue
+                        found.append(dict(record, label=record_label(kind, record)))
+                results[kind] = found
+        return results
+
+    def stats(self):
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "built_at": self.built_at,
+                "records": {kind: len(records) for kind, records in self._records.items()},
+                "keys": {kind: len(keys) for kind, keys in self._keys.items()},
+                "max_records": self.max_records,
+                "truncated": sorted(self.truncated),
+            }
+
+
+suggest_index = PrefixIndex()
+
+
+# --- loading from MySQL ---
+@timed_query
+def load_suggest_rows(kind):
+    """
+    Narrow rows for one kind of the suggest index (at most SUGGEST_MAX_RECORDS + 1).
+    Returns: (list, None) on success, (None, str) on error
+    """
+    connection = get_pooled_connection(DB_NAME)
+    if connection is None:
+        return (None, "Failed to connect to database.")
+
+    cursor = connection.cursor(dictionary=True)
+
+    try:
+        cursor.execute(SUGGEST_LOAD_QUERIES[kind] + " LIMIT %s", (SUGGEST_MAX_RECORDS + 1,))
+        return (cursor.fetchall(), None) # SUCCESS
+
+    except Error as e:
+        log.error("Error loading %s rows for the suggest index: %s", kind, e)
+        return (None, str(e)) # FAILURE
+
+    finally:
+        if connection.is_connected():
+            cursor.close()
+        connection.close() # Pool mein wapas
+
+
+def build_suggest_index():
+    """Full (re)build from the database. Returns (dict of record counts, None) or (None, str)."""
+    start = time.perf_counter()
+    counts, error = suggest_index.rebuild(load_suggest_rows)
+    if error:
+        log.error("Suggest index build failed: %s", error)
+        return (None, error)
+    log.info("Suggest index built in %.0f ms: %s", (time.perf_counter() - start) * 1000, counts)
+    return (counts, None)
+
+
+_started_pid = None
+_start_lock = threading.Lock()
+
+
+def _build_loop():
+    while True:
+        _, error = build_suggest_index()
+        if error and not suggest_index.ready:
+            time.sleep(5)   # DB abhi ready nahi, jaldi retry karo
+            continue
+        if SUGGEST_REBUILD_INTERVAL <= 0:
+            return
+        time.sleep(SUGGEST_REBUILD_INTERVAL)
+
+
+def start_suggest_index():
+    """Starts the background build (once per process; a forked worker starts its own)."""
+    global _started_pid
+    if not SUGGEST_INDEX_ENABLED:
+        return
+    with _start_lock:
+        if _started_pid == os.getpid():
+            return
+        _started_pid = os.getpid()
+    threading.Thread(target=_build_loop, name='suggest-index', daemon=True).start()
+
+
+# --- write hooks (called after a successful commit) ---
+def suggest_upsert(table_name, record_id, data):
+    """A row was inserted into `table_name` with primary key `record_id`."""
+    kind = TABLE_KINDS.get(table_name)
+    if kind is not None:
+        record = dict(data, **{SUGGEST_KINDS[kind]["id"]: record_id})
+        if kind == "animal":
+            record.setdefault("status", "Available")    # column DEFAULT
+        suggest_index.upsert(kind, record)
+    elif table_name == "Adopter" and data.get("customer_id") is not None:
+        suggest_index.update("customer", data["customer_id"], {"adopter_id": record_id})
+
+
+def suggest_update(table_name, id_column, record_id, changes):
+    """Columns of one row changed (only primary-key updates are tracked)."""
+    kind = TABLE_KINDS.get(table_name)
+    if kind is not None and id_column == SUGGEST_KINDS[kind]["id"]:
+        suggest_index.update(kind, record_id, changes)
+
+
+def suggest_delete(table_name, record_id):
+    """A row was deleted; FK cascades (Shelter -> Animal, Employee) are mirrored too."""
+    kind = TABLE_KINDS.get(table_name)
+    if kind is not None:
+        suggest_index.remove(kind, record_id)
+    elif table_name == "Shelter":
+        suggest_index.update_where("animal", "shelter_id", record_id, None)                     # ON DELETE CASCADE
+        suggest_index.update_where("employee", "shelter_id", record_id, {"shelter_id": None})   # ON DELETE SET NULL
+    elif table_name == "Adopter":
+        suggest_index.update_where("customer", "adopter_id", record_id, {"adopter_id": None})
+
+
+def search_suggestions(text, kinds=tuple(SUGGEST_KINDS), limit=10, status=None):
+    """
+    Prefix lookup for /api/suggest.
+    Returns: (dict kind -> list, None) on success, (None, str) while the index is still loading
+    """
+    if not suggest_index.ready:
+        return (None, "Suggest index is still loading.")
+    return (suggest_index.search(text, kinds, limit, status=status), None)
+
+
+def get_suggest_index_stats():
+    return suggest_index.stats()
+
+
+def _suggest_metric_lines():
+    stats = suggest_index.stats()
+    return [("suggest_index_records", "Records in the /api/suggest prefix index.", ("kind",),
+             [((kind,), count) for kind, count in stats["records"].items()])]
+
+
+register_collector(_suggest_metric_lines)
+
+
+def _restart_after_fork():
+    # Build thread fork ke baad child mein nahi hota
+    if _started_pid is not None and _started_pid != os.getpid():
+        start_suggest_index()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_after_fork)
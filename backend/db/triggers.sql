@@ -2,6 +2,10 @@
 /*  Redundant 'after_adoption_insert' trigger hata diya hai) */
 USE `pet_adoption_db`;
 
+/* @animal_bulk_insert: insert_animals_bulk() (update_delete.py) capacity ek baar per shelter check */
+/* karta hai aur occupancy / summary ek statement per shelter badhata hai. Sirf usi transaction mein */
+/* set hota hai (finally mein NULL); tab tak triggers 1, 3 aur 9 ka per-row kaam skip hota hai. */
+
 /* --- Trigger 1: Shelter capacity ko update karo (NEW ANIMAL) --- */
 /* Yeh trigger tab chalta hai jab naya animal 'Available' status ke saath add hota hai */
 DROP TRIGGER IF EXISTS `after_animal_insert`;
@@ -10,7 +14,7 @@ CREATE TRIGGER `after_animal_insert`
 AFTER INSERT ON `Animal`
 FOR EACH ROW
 BEGIN
-    IF NEW.`status` = 'Available' THEN
+    IF NEW.`status` = 'Available' AND @animal_bulk_insert IS NULL THEN
         UPDATE `Shelter`
         SET `current_occupancy` = `current_occupancy` + 1
         WHERE `shelter_id` = NEW.`shelter_id`;
@@ -65,14 +69,17 @@ BEGIN
     DECLARE v_current_occupancy INT;
     DECLARE v_capacity INT;
     
-    SELECT `current_occupancy`, `capacity`
-    INTO v_current_occupancy, v_capacity
-    FROM `Shelter`
-    WHERE `shelter_id` = NEW.`shelter_id`;
-    
-    IF v_current_occupancy >= v_capacity THEN
-        SIGNAL SQLSTATE '45000'
-        SET MESSAGE_TEXT = 'Error: Shelter is full. Cannot add new animal.';
+    /* Bulk insert ne poore batch ke liye pehle hi check kar liya (FOR UPDATE) */
+    IF @animal_bulk_insert IS NULL THEN
+        SELECT `current_occupancy`, `capacity`
+        INTO v_current_occupancy, v_capacity
+        FROM `Shelter`
+        WHERE `shelter_id` = NEW.`shelter_id`;
+        
+        IF v_current_occupancy >= v_capacity THEN
+            SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = 'Error: Shelter is full. Cannot add new animal.';
+        END IF;
     END IF;
 END$$
 DELIMITER ;
@@ -139,4 +146,169 @@ BEGIN
         SET MESSAGE_TEXT = 'Error: Date of Birth (dob) cannot be in the future.';
     END IF;
 END$$
-DELIMITER ;
\ No newline at end of file
+DELIMITER ;
+
+
+/* --- Trigger 8 (hata diya): Har table ka change counter (TableVersion) --- */
+/* Pehle har row par ek trigger TableVersion ki usi ek row ko UPDATE karta tha: us table ke saare */
+/* writers ek hi row ke X-lock par commit tak line mein lagte the (bulk intake, adoption batch bhi). */
+/* Ab write paths (update_delete.py, async_update_delete.py, procedures, reconcile.py, scripts) */
+/* counter ek baar per transaction, commit se theek pehle badhate hain (bump_table_versions). */
+/* App ke bahar se likhne waale (manual SQL, LOAD DATA) ko bhi yahi karna hoga: */
+/*   UPDATE TableVersion SET version = version + 1 WHERE table_name IN (...);  */
+DROP TRIGGER IF EXISTS `trg_shelter_version_insert`;
+DROP TRIGGER IF EXISTS `trg_shelter_version_update`;
+DROP TRIGGER IF EXISTS `trg_shelter_version_delete`;
+DROP TRIGGER IF EXISTS `trg_animal_version_insert`;
+DROP TRIGGER IF EXISTS `trg_animal_version_update`;
+DROP TRIGGER IF EXISTS `trg_animal_version_delete`;
+DROP TRIGGER IF EXISTS `trg_employee_version_insert`;
+DROP TRIGGER IF EXISTS `trg_employee_version_update`;
+DROP TRIGGER IF EXISTS `trg_employee_version_delete`;
+DROP TRIGGER IF EXISTS `trg_customer_version_insert`;
+DROP TRIGGER IF EXISTS `trg_customer_version_update`;
+DROP TRIGGER IF EXISTS `trg_customer_version_delete`;
+DROP TRIGGER IF EXISTS `trg_adopter_version_insert`;
+DROP TRIGGER IF EXISTS `trg_adopter_version_update`;
+DROP TRIGGER IF EXISTS `trg_adopter_version_delete`;
+DROP TRIGGER IF EXISTS `trg_adoption_version_insert`;
+DROP TRIGGER IF EXISTS `trg_adoption_version_update`;
+DROP TRIGGER IF EXISTS `trg_adoption_version_delete`;
+
+
+/* --- Trigger 9: ShelterAnimalSummary ko update karo --- */
+/* Insert, status change, shelter move aur delete: sab usi transaction mein. */
+/* Shelter delete par Animal rows FK cascade se jaati hain (triggers nahi chalte), */
+/* par summary row bhi FK cascade se hi hat jaati hai. */
+DROP TRIGGER IF EXISTS `trg_shelter_summary_insert`;
+DELIMITER $$
+CREATE TRIGGER `trg_shelter_summary_insert`
+AFTER INSERT ON `Shelter`
+FOR EACH ROW
+BEGIN
+    INSERT IGNORE INTO `ShelterAnimalSummary` (`shelter_id`) VALUES (NEW.`shelter_id`);
+END$$
+DELIMITER ;
+
+DROP TRIGGER IF EXISTS `trg_animal_summary_insert`;
+DELIMITER $$
+CREATE TRIGGER `trg_animal_summary_insert`
+AFTER INSERT ON `Animal`
+FOR EACH ROW
+BEGIN
+    /* Bulk insert commit se pehle ek CALL per (shelter, status) karta hai */
+    IF @animal_bulk_insert IS NULL THEN
+        CALL `AdjustShelterSummary`(NEW.`shelter_id`, NEW.`status`, 1);
+    END IF;
+END$$
+DELIMITER ;
+
+DROP TRIGGER IF EXISTS `trg_animal_summary_update`;
+DELIMITER $$
+CREATE TRIGGER `trg_animal_summary_update`
+AFTER UPDATE ON `Animal`
+FOR EACH ROW
+BEGIN
+    /* Sirf tab jab status ya shelter badla ho */
+    IF NOT (OLD.`status` <=> NEW.`status`) OR NOT (OLD.`shelter_id` <=> NEW.`shelter_id`) THEN
+        CALL `AdjustShelterSummary`(OLD.`shelter_id`, OLD.`status`, -1);
+        CALL `AdjustShelterSummary`(NEW.`shelter_id`, NEW.`status`, 1);
+    END IF;
+END$$
+DELIMITER ;
+
+DROP TRIGGER IF EXISTS `trg_animal_summary_delete`;
+DELIMITER $$
+CREATE TRIGGER `trg_animal_summary_delete`
+AFTER DELETE ON `Animal`
+FOR EACH ROW
+BEGIN
+    CALL `AdjustShelterSummary`(OLD.`shelter_id`, OLD.`status`, -1);
+END$$
+DELIMITER ;
+
+
+/* --- Trigger 10: AdopterAdoptionCount ko update karo --- */
+/* CreateAdoption / CreateAdoptionInBatch ka INSERT aur kisi bhi adoption ka delete. */
+/* Pehle adoption par adopter ki row ban jaati hai. */
+DROP TRIGGER IF EXISTS `trg_adoption_count_insert`;
+DELIMITER $$
+CREATE TRIGGER `trg_adoption_count_insert`
+AFTER INSERT ON `Adoption`
+FOR EACH ROW
+BEGIN
+    INSERT INTO `AdopterAdoptionCount` (`adopter_id`, `adoption_count`)
+    VALUES (NEW.`adopter_id`, 1)
+    ON DUPLICATE KEY UPDATE `adoption_count` = `adoption_count` + 1;
+END$$
+DELIMITER ;
+
+DROP TRIGGER IF EXISTS `trg_adoption_count_update`;
+DELIMITER $$
+CREATE TRIGGER `trg_adoption_count_update`
+AFTER UPDATE ON `Adoption`
+FOR EACH ROW
+BEGIN
+    /* Adoption kisi aur adopter ke naam ho gaya */
+    IF OLD.`adopter_id` != NEW.`adopter_id` THEN
+        UPDATE `AdopterAdoptionCount`
+        SET `adoption_count` = `adoption_count` - 1
+        WHERE `adopter_id` = OLD.`adopter_id`;
+
+        INSERT INTO `AdopterAdoptionCount` (`adopter_id`, `adoption_count`)
+        VALUES (NEW.`adopter_id`, 1)
+        ON DUPLICATE KEY UPDATE `adoption_count` = `adoption_count` + 1;
+    END IF;
+END$$
+DELIMITER ;
+
+DROP TRIGGER IF EXISTS `trg_adoption_count_delete`;
+DELIMITER $$
+CREATE TRIGGER `trg_adoption_count_delete`
+AFTER DELETE ON `Adoption`
+FOR EACH ROW
+BEGIN
+    UPDATE `AdopterAdoptionCount`
+    SET `adoption_count` = `adoption_count` - 1
+    WHERE `adopter_id` = OLD.`adopter_id`;
+END$$
+DELIMITER ;
+
+
+/* --- Trigger 11: SalaryStats / SalaryHistogram ko update karo --- */
+/* Salary, role ya shelter badalne par purani value hatao aur nayi jodo */
+/* (salary change ka log 'after_employee_salary_update' alag se likhta hai). */
+DROP TRIGGER IF EXISTS `trg_employee_salary_stats_insert`;
+DELIMITER $$
+CREATE TRIGGER `trg_employee_salary_stats_insert`
+AFTER INSERT ON `Employee`
+FOR EACH ROW
+BEGIN
+    CALL `AdjustSalaryStats`(NEW.`role`, NEW.`shelter_id`, NEW.`salary`, 1);
+END$$
+DELIMITER ;
+
+DROP TRIGGER IF EXISTS `trg_employee_salary_stats_update`;
+DELIMITER $$
+CREATE TRIGGER `trg_employee_salary_stats_update`
+AFTER UPDATE ON `Employee`
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.`salary` <=> NEW.`salary`)
+       OR NOT (OLD.`role` <=> NEW.`role`)
+       OR NOT (OLD.`shelter_id` <=> NEW.`shelter_id`) THEN
+        CALL `AdjustSalaryStats`(OLD.`role`, OLD.`shelter_id`, OLD.`salary`, -1);
+        CALL `AdjustSalaryStats`(NEW.`role`, NEW.`shelter_id`, NEW.`salary`, 1);
+    END IF;
+END$$
+DELIMITER ;
+
+DROP TRIGGER IF EXISTS `trg_employee_salary_stats_delete`;
+DELIMITER $$
+CREATE TRIGGER `trg_employee_salary_stats_delete`
+AFTER DELETE ON `Employee`
+FOR EACH ROW
+BEGIN
+    CALL `AdjustSalaryStats`(OLD.`role`, OLD.`shelter_id`, OLD.`salary`, -1);
+END$$
+DELIMITER ;
@@ -1,13 +1,25 @@
 import mysql.connector
 from mysql.connector import Error
 import os
+from collections import Counter
+from datetime import date
 
 # --- IMPORT from your existing connection file ---
 try:
-    from .connection import get_db_connection
+    from .connection import get_pooled_connection
+    from .queries import COMPILED_STATEMENTS, get_statement
+    from .report_cache import invalidate_tables, TABLE_CASCADES
+    from .suggest_index import suggest_upsert, suggest_update, suggest_delete
+    from .metrics import timed_query
+    from .logs import get_logger, log_success
 except ImportError:
     # This fallback helps if running the file directly
-    from connection import get_db_connection
+    from connection import get_pooled_connection
+    from queries import COMPILED_STATEMENTS, get_statement
+    from report_cache import invalidate_tables, TABLE_CASCADES
+    from suggest_index import suggest_upsert, suggest_update, suggest_delete
+    from metrics import timed_query
+    from logs import get_logger, log_success
 
 from dotenv import load_dotenv
 
@@ -20,35 +32,81 @@ if not DB_NAME:
     print("Error: DB_NAME not found in .env file. Make sure .env is in the 'backend' folder.")
     DB_NAME = 'pet_adoption_db' # Fallback
 
+log = get_logger('db.update_delete')
+
+
+# --- TABLE CHANGE COUNTERS ---
+# Animal ke triggers Shelter.current_occupancy bhi badalte hain, isliye Shelter ka counter bhi
+TRIGGER_SIDE_EFFECTS = {
+    "Animal": ("Shelter",),
+}
+
+def changed_tables(table_name, deleted=False):
+    """Tables whose counters a write to `table_name` changes (FK cascades only matter for deletes)."""
+    tables = [table_name, *TRIGGER_SIDE_EFFECTS.get(table_name, ())]
+    if deleted:
+        tables.extend(TABLE_CASCADES.get(table_name, ()))
+    return sorted(set(tables))
+
+def bump_table_versions(cursor, tables):
+    """
+    Increments the `TableVersion` counters of `tables` inside the caller's transaction.
+    Call it once per transaction, after the data change and right before commit: the counter
+    rows stay X-locked until commit, so every writer to the same table queues on them.
+    """
+    placeholders = ', '.join(['%s'] * len(tables))
+    try:
+        cursor.execute(
+            f"UPDATE `TableVersion` SET `version` = `version` + 1 WHERE `table_name` IN ({placeholders})",
+            tuple(tables)
+        )
+    except Error as e:
+        if e.errno != 1146: # Table doesn't exist (migration 002 abhi nahi chali)
+            raise
+
+def bump_versions_before_commit(connection, tables):
+    """bump_table_versions() on its own cursor (the CRUD functions' prepared cursor runs one statement only)."""
+    cursor = connection.cursor()
+    try:
+        bump_table_versions(cursor, tables)
+    finally:
+        cursor.close()
+
 
 # --- GENERIC INSERT FUNCTION ---
+@timed_query
 def insert_record(table_name, insert_data):
     """
     Inserts a new record into any table.
     Returns: (int, None) on success, (None, str) on error
     """
-    connection = get_db_connection(DB_NAME)
+    # Cache hit sirf dict lookups hai; KeyError (miss) par get_statement() validate + compile karta hai
+    try:
+        insert_query = COMPILED_STATEMENTS["insert"][table_name][None][tuple(insert_data)]
+    except KeyError:
+        insert_query, error = get_statement("insert", table_name, insert_data.keys())
+        if error:
+            return (None, error)
+
+    connection = get_pooled_connection(DB_NAME)
     if connection is None:
         return (None, "Failed to connect to database.")
 
-    cursor = connection.cursor()
+    cursor = connection.statement_cursor(insert_query)
     
     try:
-        columns = '`' + '`, `'.join(insert_data.keys()) + '`'
-        placeholders = ', '.join(['%s'] * len(insert_data))
-        values = list(insert_data.values())
-        
-        insert_query = f"INSERT INTO `{table_name}` ({columns}) VALUES ({placeholders})"
-        
-        cursor.execute(insert_query, tuple(values))
+        cursor.execute(insert_query, tuple(insert_data.values()))
+        bump_versions_before_commit(connection, changed_tables(table_name))
         connection.commit()
+        invalidate_tables([table_name])
         
         new_record_id = cursor.lastrowid
-        print(f"Record inserted successfully into {table_name} with ID: {new_record_id}")
+        suggest_upsert(table_name, new_record_id, insert_data)
+        log_success(log, "Record inserted successfully into %s with ID: %s", table_name, new_record_id)
         return (new_record_id, None) # SUCCESS
 
     except Error as e:
-        print(f"Error while inserting record: {e}")
+        log.error("Error while inserting record: %s", e)
         connection.rollback()
         if e.errno == 1644: # MySQL error code for SIGNAL SQLSTATE '45000'
             return (None, e.msg) # Return the custom error message from the trigger
@@ -57,37 +115,48 @@ def insert_record(table_name, insert_data):
     finally:
         if connection.is_connected():
             cursor.close()
-            connection.close()
+        connection.close() # Pool mein wapas
 
 
 # --- GENERIC DELETE FUNCTION ---
+@timed_query
 def delete_record(table_name, id_column, id_value):
     """
     Deletes a record from any table based on its ID.
     Returns: (int, None) on success, (None, str) on error
     """
-    connection = get_db_connection(DB_NAME)
+    try:
+        delete_query = COMPILED_STATEMENTS["delete"][table_name][id_column][()]
+    except KeyError:
+        delete_query, error = get_statement("delete", table_name, key_column=id_column)
+        if error:
+            return (None, error)
+
+    connection = get_pooled_connection(DB_NAME)
     if connection is None:
         return (None, "Failed to connect to database.")
 
-    cursor = connection.cursor()
+    cursor = connection.statement_cursor(delete_query)
     
     try:
-        delete_query = f"DELETE FROM `{table_name}` WHERE `{id_column}` = %s"
-        
         cursor.execute(delete_query, (id_value,))
+        rows_affected = cursor.rowcount
+        if rows_affected:
+            # FK cascade se badli child tables ke counters bhi
+            bump_versions_before_commit(connection, changed_tables(table_name, deleted=True))
         connection.commit()
+        invalidate_tables([table_name])
         
-        rows_affected = cursor.rowcount
         if rows_affected == 0:
-            print(f"No record found with ID {id_value} in table {table_name}. Nothing deleted.")
+            log_success(log, "No record found with ID %s in table %s. Nothing deleted.", id_value, table_name)
             return (None, f"No record found with ID {id_value} in {table_name}.") # FAILURE (Not found)
         
-        print(f"Record {id_value} deleted successfully from table {table_name}")
+        suggest_delete(table_name, id_value)
+        log_success(log, "Record %s deleted successfully from table %s", id_value, table_name)
         return (rows_affected, None) # SUCCESS
         
     except Error as e:
-        print(f"Error while deleting record: {e}")
+        log.error("Error while deleting record: %s", e)
         connection.rollback()
         if e.errno == 1644:
             return (None, e.msg)
@@ -96,42 +165,49 @@ def delete_record(table_name, id_column, id_value):
     finally:
         if connection.is_connected():
             cursor.close()
-            connection.close()
+        connection.close() # Pool mein wapas
 
 
 # --- GENERIC UPDATE FUNCTION ---
+@timed_query
 def update_record(table_name, id_column, id_value, update_data):
     """
     Updates one or more columns for a record in any table.
     Returns: (int, None) on success, (None, str) on error
     """
-    connection = get_db_connection(DB_NAME)
+    try:
+        update_query = COMPILED_STATEMENTS["update"][table_name][id_column][tuple(update_data)]
+    except KeyError:
+        update_query, error = get_statement("update", table_name, update_data.keys(), id_column)
+        if error:
+            return (None, error)
+
+    connection = get_pooled_connection(DB_NAME)
     if connection is None:
         return (None, "Failed to connect to database.")
 
-    cursor = connection.cursor()
+    cursor = connection.statement_cursor(update_query)
     
     try:
-        set_parts = [f"`{column}` = %s" for column in update_data.keys()]
-        set_clause = ", ".join(set_parts)
         values = list(update_data.values())
         values.append(id_value) # Add the ID value for the WHERE clause
-        
-        update_query = f"UPDATE `{table_name}` SET {set_clause} WHERE `{id_column}` = %s"
-        
         cursor.execute(update_query, tuple(values))
+        rows_affected = cursor.rowcount
+        if rows_affected:
+            bump_versions_before_commit(connection, changed_tables(table_name))
         connection.commit()
+        invalidate_tables([table_name])
         
-        rows_affected = cursor.rowcount
         if rows_affected == 0:
-            print(f"No record found with ID {id_value} in table {table_name}. Nothing updated.")
+            log_success(log, "No record found with ID %s in table %s. Nothing updated.", id_value, table_name)
             return (0, None) # SUCCESS (but no rows changed)
 
-        print(f"Record {id_value} in table {table_name} updated successfully. Rows: {rows_affected}")
+        suggest_update(table_name, id_column, id_value, update_data)
+        log_success(log, "Record %s in table %s updated successfully. Rows: %s", id_value, table_name, rows_affected)
         return (rows_affected, None) # SUCCESS
         
     except Error as e:
-        print(f"Error while updating record: {e}")
+        log.error("Error while updating record: %s", e)
         connection.rollback()
         if e.errno == 1644:
             return (None, e.msg)
@@ -140,16 +216,17 @@ def update_record(table_name, id_column, id_value, update_data):
     finally:
         if connection.is_connected():
             cursor.close()
-            connection.close()
+        connection.close() # Pool mein wapas
 
 
 # --- SPECIFIC FUNCTION: EXECUTE ADOPTION ---
+@timed_query
 def execute_adoption_procedure(animal_id, adopter_id, employee_id):
     """
     Calls the 'CreateAdoption' stored procedure.
     Returns: (dict, None) on success, (None, str) on error
     """
-    connection = get_db_connection(DB_NAME)
+    connection = get_pooled_connection(DB_NAME)
     if connection is None:
         return (None, "Failed to connect to database.")
     
@@ -163,15 +240,17 @@ def execute_adoption_procedure(animal_id, adopter_id, employee_id):
             result = res.fetchone()
             
         connection.commit()
+        invalidate_tables(["Adoption", "Animal", "Shelter"])
         
         if result:
-            print(f"Successfully executed CreateAdoption procedure for animal {animal_id}")
+            suggest_update("Animal", "animal_id", animal_id, {"status": "Adopted"})
+            log_success(log, "Successfully executed CreateAdoption procedure for animal %s", animal_id)
             return (result, None) # SUCCESS
         else:
             return (None, "Adoption procedure ran but did not return details.")
 
     except Error as e:
-        print(f"Error executing adoption procedure: {e}")
+        log.error("Error executing adoption procedure: %s", e)
         connection.rollback()
         if e.errno == 1644: # Check for 'Animal already adopted' error
             return (None, e.msg)
@@ -180,11 +259,314 @@ def execute_adoption_procedure(animal_id, adopter_id, employee_id):
     finally:
         if connection.is_connected():
             cursor.close()
-            connection.close()
+        connection.close() # Pool mein wapas
+
+
+
+# --- SPECIFIC FUNCTION: EXECUTE ADOPTION BATCH ---
+@timed_query
+def execute_adoption_batch(adoptions, all_or_nothing=True):
+    """
+    Runs many adoptions over ONE connection and ONE transaction,
+    using the 'CreateAdoptionInBatch' procedure for each item.
+
+    all_or_nothing=True : first failure rolls back the whole batch.
+    all_or_nothing=False: each item runs under its own SAVEPOINT, failed items
+                          are rolled back individually and the rest are committed.
+
+    `adoptions` is a list of dicts with animal_id, adopter_id, employee_id.
+    Returns:
+        ({"committed": bool, "succeeded": int, "failed": int, "results": list}, None) on success
+        (None, str) on error (e.g. no connection)
+    """
+    connection = get_pooled_connection(DB_NAME)
+    if connection is None:
+        return (None, "Failed to connect to database.")
+
+    cursor = connection.cursor(dictionary=True)
+    results = []
+    succeeded = 0
+    failed = 0
+
+    try:
+        connection.start_transaction()
+
+        for index, item in enumerate(adoptions):
+            args = [item['animal_id'], item['adopter_id'], item['employee_id']]
+            if not all_or_nothing:
+                cursor.execute("SAVEPOINT adoption_item")
+
+            try:
+                cursor.callproc('CreateAdoptionInBatch', args)
+                details = None
+                for res in cursor.stored_results():
+                    details = res.fetchone()
+                results.append({"index": index, "status": "success", "adoption_details": details})
+                succeeded += 1
+
+            except Error as e:
+                failed += 1
+                message = e.msg if e.errno == 1644 else str(e)
+                results.append({"index": index, "status": "error", "error": message})
+
+                if all_or_nothing:
+                    connection.rollback()
+                    # Baaki items chalaye hi nahi gaye
+                    for skipped in range(index + 1, len(adoptions)):
+                        results.append({"index": skipped, "status": "skipped"})
+                    log.warning("Adoption batch rolled back at item %s: %s", index, message)
+                    return ({"committed": False, "succeeded": 0, "failed": failed, "results": results}, None)
+
+                cursor.execute("ROLLBACK TO SAVEPOINT adoption_item")
+
+        if succeeded:
+            # Poore batch ke liye ek hi baar (CreateAdoptionInBatch counters nahi chhoota)
+            bump_table_versions(cursor, ["Adoption", "Animal", "Shelter"])
+        connection.commit()
+        if succeeded:
+            invalidate_tables(["Adoption", "Animal", "Shelter"])
+            for item in results:
+                if item["status"] == "success":
+                    suggest_update("Animal", "animal_id", adoptions[item["index"]]["animal_id"], {"status": "Adopted"})
+        log_success(log, "Adoption batch committed: %s succeeded, %s failed.", succeeded, failed)
+        return ({"committed": True, "succeeded": succeeded, "failed": failed, "results": results}, None) # SUCCESS
+
+    except Error as e:
+        log.error("Error executing adoption batch: %s", e)
+        connection.rollback()
+        return (None, str(e)) # FAILURE
+
+    finally:
+        if connection.is_connected():
+            cursor.close()
+        connection.close() # Pool mein wapas
+
+
+
+# --- BULK ANIMAL INTAKE ---
+ANIMAL_BULK_COLUMNS = ["shelter_id", "name", "species", "breed", "age", "gender", "dob", "status"]
+ANIMAL_STATUSES = ("Available", "Adopted", "Pending")
+ANIMAL_GENDERS = ("M", "F", "N")
+
+def _validate_animal_row(row):
+    """
+    Checks one animal row against the schema constraints / triggers.
+    Returns: (clean_dict, None) or (None, error message)
+    """
+    if not isinstance(row, dict):
+        return (None, "Row must be an object.")
+
+    unknown = set(row.keys()) - set(ANIMAL_BULK_COLUMNS)
+    if unknown:
+        return (None, f"Unknown column(s): {', '.join(sorted(unknown))}")
+
+    clean = {column: row.get(column) for column in ANIMAL_BULK_COLUMNS}
+    clean = {k: (None if v == '' else v) for k, v in clean.items()}
+
+    if not clean["name"]:
+        return (None, "'name' is required.")
+    try:
+        clean["shelter_id"] = int(clean["shelter_id"])
+    except (TypeError, ValueError):
+        return (None, "'shelter_id' must be an integer.")
+
+    if clean["age"] is not None:
+        try:
+            clean["age"] = int(clean["age"])
+        except (TypeError, ValueError):
+            return (None, "'age' must be an integer.")
+        if clean["age"] < 0:
+            return (None, "'age' cannot be negative.")
+
+    if clean["gender"] is not None and clean["gender"] not in ANIMAL_GENDERS:
+        return (None, "'gender' must be one of M, F, N.")
+
+    clean["status"] = clean["status"] or "Available"
+    if clean["status"] not in ANIMAL_STATUSES:
+        return (None, "'status' must be one of Available, Adopted, Pending.")
+
+    if clean["dob"] is not None:
+        try:
+            clean["dob"] = date.fromisoformat(str(clean["dob"]))
+        except ValueError:
+            return (None, "'dob' must be a YYYY-MM-DD date.")
+        # Same check as 'trg_check_animal_dob_before_insert'
+        if clean["dob"] > date.today():
+            return (None, "Error: Date of Birth (dob) cannot be in the future.")
+
+    return (clean, None)
+
+
+@timed_query
+def insert_animals_bulk(rows, strict=False, chunk_size=500):
+    """
+    Inserts many animals with chunked multi-row INSERTs.
+
+    1. Every row is validated up front.
+    2. Shelter capacity is checked ONCE per shelter for the whole batch
+       (rows locked with SELECT ... FOR UPDATE), mirroring the
+       'before_animal_insert_check_capacity' trigger.
+    3. Valid rows are written `chunk_size` at a time. If a chunk fails, it is
+       retried row by row so only the bad rows are reported.
+    4. Shelter occupancy and ShelterAnimalSummary are bumped once per shelter before commit.
+
+    While the transaction runs, the session variable @animal_bulk_insert tells the capacity,
+    occupancy and summary triggers to skip their per-row work (see triggers.sql).
+    It is cleared before the connection goes back to the pool.
+
+    strict=True: any failure aborts the whole upload (nothing is written).
+
+    Returns:
+        ({"committed": bool, "inserted": int, "failed": int, "results": list}, None) on success
+        (None, str) on error
+    """
+    results = [None] * len(rows)
+    valid = []  # list of (row_index, clean_row)
+
+    for index, row in enumerate(rows):
+        clean, error = _validate_animal_row(row)
+        if error:
+            results[index] = {"row": index, "status": "error", "error": error}
+        else:
+            valid.append((index, clean))
+
+    def summary(committed):
+        inserted = sum(1 for r in results if r and r["status"] == "success")
+        failed = sum(1 for r in results if r and r["status"] == "error")
+        for index, r in enumerate(results):
+            if r is None:
+                results[index] = {"row": index, "status": "skipped"}
+        return {"committed": committed, "inserted": inserted if committed else 0,
+                "failed": failed, "results": results}
+
+    if strict and len(valid) != len(rows):
+        return (summary(False), None)
+    if not valid:
+        return (summary(True), None)
+
+    connection = get_pooled_connection(DB_NAME)
+    if connection is None:
+        return (None, "Failed to connect to database.")
+
+    cursor = connection.cursor()
+
+    try:
+        connection.start_transaction()
+
+        # --- Capacity pre-check (ek baar per shelter) ---
+        shelter_ids = sorted({clean["shelter_id"] for _, clean in valid})
+        placeholders = ', '.join(['%s'] * len(shelter_ids))
+        cursor.execute(
+            f"SELECT `shelter_id`, `capacity`, `current_occupancy` FROM `Shelter` "
+            f"WHERE `shelter_id` IN ({placeholders}) FOR UPDATE",
+            tuple(shelter_ids)
+        )
+        occupancy = {sid: [cap, occ] for sid, cap, occ in cursor.fetchall()}
+
+        accepted = []
+        for index, clean in valid:
+            shelter = occupancy.get(clean["shelter_id"])
+            if shelter is None:
+                results[index] = {"row": index, "status": "error", "error": f"Shelter {clean['shelter_id']} does not exist."}
+                continue
+            capacity, current = shelter
+            if current >= capacity:
+                results[index] = {"row": index, "status": "error", "error": "Error: Shelter is full. Cannot add new animal."}
+                continue
+            if clean["status"] == "Available":
+                shelter[1] += 1
+            accepted.append((index, clean))
+
+        if strict and len(accepted) != len(valid):
+            connection.rollback()
+            return (summary(False), None)
+
+        # Capacity ho gaya: ab triggers per row capacity / occupancy / summary nahi chhuenge
+        cursor.execute("SET @animal_bulk_insert = 1")
+
+        # --- Chunked multi-row inserts ---
+        columns = '`' + '`, `'.join(ANIMAL_BULK_COLUMNS) + '`'
+        row_placeholder = '(' + ', '.join(['%s'] * len(ANIMAL_BULK_COLUMNS)) + ')'
+        single_query = f"INSERT INTO `Animal` ({columns}) VALUES {row_placeholder}"
+
+        for start in range(0, len(accepted), chunk_size):
+            chunk = accepted[start:start + chunk_size]
+            values = [clean[column] for _, clean in chunk for column in ANIMAL_BULK_COLUMNS]
+            chunk_query = f"INSERT INTO `Animal` ({columns}) VALUES " + ', '.join([row_placeholder] * len(chunk))
+
+            cursor.execute("SAVEPOINT animal_chunk")
+            try:
+                cursor.execute(chunk_query, tuple(values))
+                # Multi-row INSERT ke auto-increment IDs consecutive hote hain
+                first_id = cursor.lastrowid
+                for offset, (index, _) in enumerate(chunk):
+                    results[index] = {"row": index, "status": "success", "new_animal_id": first_id + offset}
+                continue
+            except Error:
+                cursor.execute("ROLLBACK TO SAVEPOINT animal_chunk")
+
+            # Chunk fail hua, ab ek-ek row daal ke dekho kaunsi kharab hai
+            for index, clean in chunk:
+                cursor.execute("SAVEPOINT animal_row")
+                try:
+                    cursor.execute(single_query, tuple(clean[column] for column in ANIMAL_BULK_COLUMNS))
+                    results[index] = {"row": index, "status": "success", "new_animal_id": cursor.lastrowid}
+                except Error as e:
+                    cursor.execute("ROLLBACK TO SAVEPOINT animal_row")
+                    message = e.msg if e.errno == 1644 else str(e)
+                    results[index] = {"row": index, "status": "error", "error": message}
+
+            if strict and any(results[index]["status"] == "error" for index, _ in chunk):
+                # Strict mode: kharab row mil gayi, poora upload cancel
+                connection.rollback()
+                return (summary(False), None)
+
+        # Triggers ka skip kiya hua kaam: ek UPDATE / CALL per (shelter, status)
+        inserted = Counter((clean["shelter_id"], clean["status"])
+                           for index, clean in accepted if results[index]["status"] == "success")
+        for (shelter_id, status), count in sorted(inserted.items()):
+            if status == "Available":
+                cursor.execute(
+                    "UPDATE `Shelter` SET `current_occupancy` = `current_occupancy` + %s WHERE `shelter_id` = %s",
+                    (count, shelter_id)
+                )
+            cursor.callproc('AdjustShelterSummary', [shelter_id, status, count])
+        if inserted:
+            bump_table_versions(cursor, ["Animal", "Shelter"])
+
+        connection.commit()
+        invalidate_tables(["Animal", "Shelter"])
+        for index, clean in accepted:
+            if results[index]["status"] == "success":
+                suggest_upsert("Animal", results[index]["new_animal_id"], clean)
+        result = summary(True)
+        log_success(log, "Bulk animal insert committed: %s inserted, %s failed.", result['inserted'], result['failed'])
+        return (result, None) # SUCCESS
+
+    except Error as e:
+        log.error("Error during bulk animal insert: %s", e)
+        connection.rollback()
+        return (None, str(e)) # FAILURE
+
+    finally:
+        flag_cleared = False
+        if connection.is_connected():
+            try:
+                cursor.execute("SET @animal_bulk_insert = NULL")
+                flag_cleared = True
+            except Error:
+                pass
+            cursor.close()
+        if flag_cleared:
+            connection.close() # Pool mein wapas
+        else:
+            # Flag set waali connection reuse hui toh agle insert ke triggers capacity check skip kar denge
+            connection.discard()
 
 
 
 # --- SPECIFIC FUNCTION: EXECUTE CREATE ADOPTER ---
+@timed_query
 def execute_create_adopter(first_name, last_name, phone):
     """
     Calls the 'CreateAdopter' stored procedure.
@@ -194,7 +576,7 @@ def execute_create_adopter(first_name, last_name, phone):
         (dict, None) on success (returns new adopter details)
         (None, str) on error
     """
-    connection = get_db_connection(DB_NAME)
+    connection = get_pooled_connection(DB_NAME)
     if connection is None:
         return (None, "Failed to connect to database.")
     
@@ -210,15 +592,17 @@ def execute_create_adopter(first_name, last_name, phone):
             result = res.fetchone()
             
         connection.commit()
+        invalidate_tables(["Customer", "Adopter"])
         
         if result:
-            print(f"Successfully executed CreateAdopter procedure for {first_name}")
+            suggest_upsert("Customer", result["customer_id"], result)
+            log_success(log, "Successfully executed CreateAdopter procedure for %s", first_name)
             return (result, None) # SUCCESS
         else:
             return (None, "CreateAdopter procedure ran but did not return details.")
 
     except Error as e:
-        print(f"Error executing create adopter procedure: {e}")
+        log.error("Error executing create adopter procedure: %s", e)
         connection.rollback()
         if e.errno == 1644: # Check for our custom error
             return (None, e.msg)
@@ -227,10 +611,11 @@ def execute_create_adopter(first_name, last_name, phone):
     finally:
         if connection.is_connected():
             cursor.close()
-            connection.close()
+        connection.close() # Pool mein wapas
 
 
 # --- SPECIFIC FUNCTION: EXECUTE CREATE DONOR ---
+@timed_query
 def execute_create_donor(first_name, last_name, phone, amount):
     """
     Calls the 'CreateDonor' stored procedure.
@@ -240,7 +625,7 @@ def execute_create_donor(first_name, last_name, phone, amount):
         (dict, None) on success (returns new donor details)
         (None, str) on error
     """
-    connection = get_db_connection(DB_NAME)
+    connection = get_pooled_connection(DB_NAME)
     if connection is None:
         return (None, "Failed to connect to database.")
     
@@ -256,15 +641,17 @@ def execute_create_donor(first_name, last_name, phone, amount):
             result = res.fetchone()
             
         connection.commit()
+        invalidate_tables(["Customer", "Donor"])
         
         if result:
-            print(f"Successfully executed CreateDonor procedure for {first_name}")
+            suggest_upsert("Customer", result["customer_id"], result)
+            log_success(log, "Successfully executed CreateDonor procedure for %s", first_name)
             return (result, None) # SUCCESS
         else:
             return (None, "CreateDonor procedure ran but did not return details.")
 
     except Error as e:
-        print(f"Error executing create donor procedure: {e}")
+        log.error("Error executing create donor procedure: %s", e)
         connection.rollback()
         if e.errno == 1644: # Check for our custom error
             return (None, e.msg)
@@ -273,7 +660,7 @@ def execute_create_donor(first_name, last_name, phone, amount):
     finally:
         if connection.is_connected():
             cursor.close()
-            connection.close()
+        connection.close() # Pool mein wapas
 
 
 
@@ -0,0 +1,110 @@
+# backend/json_provider.py
+# jsonify() / handle_query_result() ke liye pluggable JSON encoder.
+# orjson install ho toh compact responses orjson se bante hain (C mein, kaafi tez);
+# output Flask ke DefaultJSONProvider jaisa hi rehta hai, byte for byte:
+#   - sort_keys, separators (",", ":"), aakhir mein "\n"
+#   - Decimal -> "123.45" (str), date / datetime -> HTTP date ("Wed, 01 Jan 2020 00:00:00 GMT")
+#   - ensure_ascii: non-ASCII text waale payloads stdlib se jaate hain (\uXXXX escapes)
+#
+# - JSON_ENCODER=auto     'auto' (orjson agar hai), 'orjson' ya 'stdlib'
+#
+# Install: pip install orjson
+
+import os
+from datetime import date
+from decimal import Decimal
+from functools import lru_cache
+
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import http_date
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from .db.logs import get_logger
+except ImportError:
+    from db.logs import get_logger
+
+JSON_ENCODER = os.environ.get('JSON_ENCODER', 'auto').lower()
+COMPACT_SEPARATORS = (",", ":")
+
+log = get_logger('json')
+
+
+@lru_cache(maxsize=8192)
+def _http_date(value):
+    # dob / adoption_date mein distinct values kam hote hain, aur http_date() mehenga hai
+    return http_date(value)
+
+
+def fast_default(o):
+    """Flask's default() for DB values, with HTTP dates of plain `date`s memoised."""
+    if type(o) is date:
+        return _http_date(o)
+    if type(o) is Decimal:
+        return str(o)
+    return DefaultJSONProvider.default(o)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    DefaultJSONProvider whose compact output is produced by orjson.
+
+    Dates are passed through to `default` (so they become HTTP dates, not orjson's ISO
+    strings), Decimal goes through `default` too. Anything orjson cannot
+    encode identically -- non-ASCII text, ints beyond 64 bits, non-string keys, debug
+    indentation, custom json.dumps() arguments -- is sent to the stdlib encoder instead.
+    Floats are not special-cased: orjson writes 1e-5 where json writes 1e-05 (and null for
+    NaN), but the DB only returns DECIMAL columns, so API payloads never hit that case.
+    """
+
+    default = staticmethod(fast_default)
+    options = orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if orjson else 0
+
+    def fast_dumps(self, obj):
+        """Compact UTF-8 bytes from orjson, or None when the stdlib encoder must be used."""
+        if not (self.sort_keys and self.ensure_ascii):
+            return None
+        try:
+            data = orjson.dumps(obj, default=self.default, option=self.options)
+        except (orjson.JSONEncodeError, TypeError):
+            # Stdlib bhi wahi TypeError dega (ya big int / non-str key sahi se likhega)
+            return None
+        return data if data.isascii() else None
+
+    def dumps(self, obj, **kwargs):
+        if kwargs == {"separators": COMPACT_SEPARATORS}:
+            data = self.fast_dumps(obj)
+            if data is not None:
+                return data.decode('ascii')
+        return super().dumps(obj, **kwargs)
+
+    def response(self, *args, **kwargs):
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)   # indented output: stdlib
+
+        data = self.fast_dumps(self._prepare_response_obj(args, kwargs))
+        if data is None:
+            return super().response(*args, **kwargs)
+        # bytes body: str -> bytes encode ka ek aur pass nahi
+        return self._app.response_class(data + b"\n", mimetype=self.mimetype)
+
+
+def json_provider_class(name=JSON_ENCODER):
+    """Provider class for JSON_ENCODER ('auto', 'orjson' or 'stdlib')."""
+    if name == 'stdlib':
+        return DefaultJSONProvider
+    if orjson is None:
+        if name == 'orjson':
+            log.warning("JSON_ENCODER=orjson but orjson is not installed, using the stdlib encoder.")
+        return DefaultJSONProvider
+    return OrjsonProvider
+
+
+def install_json_provider(app, name=JSON_ENCODER):
+    """Makes jsonify() on `app` use the configured encoder."""
+    app.json = json_provider_class(name)(app)
+    return app.json
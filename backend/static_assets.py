@@ -0,0 +1,135 @@
+# backend/static_assets.py
+# static/ ki files content-hashed URLs se serve hoti hain:
+#   {{ asset_url('js/main.js') }}  ->  /static/js/main.3f2a9c1b04de.js
+# Hash file ke content se banta hai, isliye ek hashed URL ka content kabhi nahi badalta aur
+# browser use saal bhar bina poochhe cache kar sakta hai (Cache-Control: immutable).
+# File badli -> naya hash -> naya URL, stale JS / CSS ka sawaal hi nahi.
+#
+# Startup par har file ek hi baar padhi jaati hai: hash, gzip (level 9) aur brotli (quality 11,
+# agar installed hai) sab memory mein. Request par sirf Accept-Encoding dekh kar bytes bhejte hain.
+#
+# - STATIC_MAX_AGE=31536000     hashed URLs ka max-age (seconds)
+#
+# Plain URLs (/static/js/main.js) bhi chalte hain, par no-cache + ETag ke saath.
+# Debug mode mein sab Flask ke normal static handler se jaata hai, taaki edit karke refresh karte hi dikhe.
+
+import hashlib
+import mimetypes
+import os
+
+from flask import current_app, request, url_for
+
+try:
+    from .compression import COMPRESS_MIN_SIZE, ENCODINGS, compress, is_compressible, negotiate_encoding
+    from .db.logs import get_logger, log_success
+except ImportError:
+    # This fallback helps if running the file directly
+    from compression import COMPRESS_MIN_SIZE, ENCODINGS, compress, is_compressible, negotiate_encoding
+    from db.logs import get_logger, log_success
+
+STATIC_MAX_AGE = int(os.environ.get('STATIC_MAX_AGE', 31536000))
+ASSET_HASH_LENGTH = 12
+# Ek hi baar compress hota hai, isliye sabse zyada level
+STATIC_COMPRESS_LEVELS = {'gzip': 9, 'br': 11}
+
+ASSETS = {}         # 'js/main.js' -> asset
+HASHED_ASSETS = {}  # 'js/main.3f2a9c1b04de.js' -> wahi asset
+
+log = get_logger('static')
+
+
+def hashed_filename(filename, digest):
+    """'js/main.js' -> 'js/main.<digest>.js'"""
+    root, ext = os.path.splitext(filename)
+    return f"{root}.{digest}{ext}"
+
+
+def load_asset(static_folder, filename):
+    """Reads one static file and returns its asset dict (digest, hashed name, precompressed bodies)."""
+    with open(os.path.join(static_folder, filename), 'rb') as f:
+        data = f.read()
+
+    digest = hashlib.sha256(data).hexdigest()[:ASSET_HASH_LENGTH]
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    bodies = {None: data}   # None = identity
+    if is_compressible(mimetype) and len(data) >= COMPRESS_MIN_SIZE:
+        for encoding in ENCODINGS:
+            compressed = compress(data, encoding, level=STATIC_COMPRESS_LEVELS[encoding])
+            if len(compressed) < len(data):
+                bodies[encoding] = compressed
+
+    return {
+        "filename": filename,
+        "hashed": hashed_filename(filename, digest),
+        "digest": digest,
+        "mimetype": mimetype,
+        "bodies": bodies,
+    }
+
+
+def build_asset_manifest(static_folder):
+    """
+    Hashes and precompresses every file under `static_folder`.
+    Returns: ({filename: asset}, {hashed filename: asset})
+    """
+    assets = {}
+    for root, _, files in os.walk(static_folder):
+        for name in sorted(files):
+            # URL mein hamesha '/' (Windows par bhi)
+            filename = os.path.relpath(os.path.join(root, name), static_folder).replace(os.sep, '/')
+            assets[filename] = load_asset(static_folder, filename)
+    return assets, {asset["hashed"]: asset for asset in assets.values()}
+
+
+def asset_url(filename):
+    """Template helper: content-hashed /static URL for `filename` (plain URL in debug mode)."""
+    asset = ASSETS.get(filename)
+    if asset is None or current_app.debug:
+        return url_for('static', filename=filename)
+    return url_for('static', filename=asset["hashed"])
+
+
+def serve_static(filename):
+    """
+    /static/<path:filename> view. Hashed names get immutable caching, plain names no-cache;
+    both are sent from memory in the best encoding the client accepts, with 304 on If-None-Match.
+    """
+    asset = HASHED_ASSETS.get(filename)
+    immutable = asset is not None
+    if asset is None:
+        asset = ASSETS.get(filename)
+    if asset is None or current_app.debug:
+        # Startup ke baad bani file, ya debug mode: Flask ka normal handler
+        return current_app.send_static_file(filename)
+
+    bodies = asset["bodies"]
+    encoding = negotiate_encoding(tuple(e for e in ENCODINGS if e in bodies))
+    response = current_app.response_class(bodies[encoding], mimetype=asset["mimetype"])
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    if len(bodies) > 1:
+        response.vary.add('Accept-Encoding')
+
+    # Har encoding ka apna strong ETag (alag bytes, alag representation)
+    response.set_etag(asset["digest"] if encoding is None else f"{asset['digest']}-{encoding}")
+    if immutable:
+        response.headers['Cache-Control'] = f'public, max-age={STATIC_MAX_AGE}, immutable'
+    else:
+        response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
+def install_static_assets(app):
+    """Builds the manifest for app.static_folder, routes /static through serve_static and adds asset_url() to templates."""
+    assets, hashed_assets = build_asset_manifest(app.static_folder)
+    ASSETS.clear()
+    ASSETS.update(assets)
+    HASHED_ASSETS.clear()
+    HASHED_ASSETS.update(hashed_assets)
+
+    app.view_functions['static'] = serve_static
+    app.jinja_env.globals['asset_url'] = asset_url
+
+    compressed = sum(1 for asset in assets.values() if len(asset["bodies"]) > 1)
+    log_success(log, "Static assets ready: %d files, %d precompressed (%s)",
+                len(assets), compressed, ", ".join(ENCODINGS))
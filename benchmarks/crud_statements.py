@@ -0,0 +1,204 @@
+# benchmarks/crud_statements.py
+# Generic CRUD functions ka per-call cost: purana "har call par SQL banao + text protocol" path
+# vs db/statements.py ka compiled-SQL cache + server-side prepared statements.
+#
+# Usage (repo root se):
+#   python benchmarks/crud_statements.py                         # sirf SQL build, DB nahi chahiye
+#   python benchmarks/crud_statements.py --db --calls 5000       # + MySQL round-trips (.env waala DB)
+#   python benchmarks/crud_statements.py --db --out results/statements.json
+#
+# SQL mode: purane f-string/join builders vs CRUD functions ka inline cache lookup (hit), har operation ke liye.
+#   Do tables: sirf SQL banana, aur SQL + connection.py ke prepared-cursor cache ka (sql, dictionary)
+#   lookup jo statement_cursor() turant karta hai (DB_PREPARED_STATEMENTS=1, default). Naya f-string
+#   wahan har baar hash + compare hota hai; cached str ka hash yaad rehta hai aur compare identity se.
+# DB mode: select_record_by_id / select_records_by_criteria, text protocol (DB_PREPARED_STATEMENTS=0)
+# vs prepared statements, ek hi pooled connection par. Sirf reads chalte hain, data nahi badalta.
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+os.environ.setdefault('LOG_SUCCESS_SAMPLE_RATE', '0')   # har call par INFO log nahi
+
+from db import connection
+from db import queries
+from db.queries import (COMPILED_STATEMENTS, TABLE_COLUMNS_CACHE, get_statement, select_list, select_record_by_id,
+                        select_records_by_criteria)
+
+ANIMAL_COLUMNS = ("animal_id", "shelter_id", "name", "species", "breed", "age", "gender", "dob", "status")
+
+
+# --- the builders the CRUD functions used before the cache ---
+def legacy_insert(table_name, data):
+    columns = '`' + '`, `'.join(data.keys()) + '`'
+    placeholders = ', '.join(['%s'] * len(data))
+    return f"INSERT INTO `{table_name}` ({columns}) VALUES ({placeholders})", tuple(data.values())
+
+def legacy_update(table_name, id_column, id_value, data):
+    set_clause = ", ".join([f"`{column}` = %s" for column in data.keys()])
+    values = list(data.values())
+    values.append(id_value)
+    return f"UPDATE `{table_name}` SET {set_clause} WHERE `{id_column}` = %s", tuple(values)
+
+def legacy_delete(table_name, id_column, id_value):
+    return f"DELETE FROM `{table_name}` WHERE `{id_column}` = %s", (id_value,)
+
+def legacy_select_by_id(table_name, id_column, id_value, fields=None):
+    return f"SELECT {select_list(fields)} FROM `{table_name}` WHERE `{id_column}` = %s", (id_value,)
+
+def legacy_select_by_criteria(table_name, criteria):
+    where_clause = " AND ".join([f"`{column}` = %s" for column in criteria.keys()])
+    return f"SELECT * FROM `{table_name}` WHERE {where_clause}", tuple(criteria.values())
+
+
+# --- the same statements through the cache (what the CRUD functions do now) ---
+def cached_insert(table_name, data):
+    try:
+        sql = COMPILED_STATEMENTS["insert"][table_name][None][tuple(data)]
+    except KeyError:
+        sql, _ = get_statement("insert", table_name, data.keys())
+    return sql, tuple(data.values())
+
+def cached_update(table_name, id_column, id_value, data):
+    try:
+        sql = COMPILED_STATEMENTS["update"][table_name][id_column][tuple(data)]
+    except KeyError:
+        sql, _ = get_statement("update", table_name, data.keys(), id_column)
+    values = list(data.values())
+    values.append(id_value)
+    return sql, tuple(values)
+
+def cached_delete(table_name, id_column, id_value):
+    try:
+        sql = COMPILED_STATEMENTS["delete"][table_name][id_column][()]
+    except KeyError:
+        sql, _ = get_statement("delete", table_name, key_column=id_column)
+    return sql, (id_value,)
+
+def cached_select_by_id(table_name, id_column, id_value, fields=None):
+    try:
+        sql = COMPILED_STATEMENTS["select_by_id"][table_name][id_column][fields or ()]
+    except KeyError:
+        sql, _ = get_statement("select_by_id", table_name, fields or (), id_column)
+    return sql, (id_value,)
+
+def cached_select_by_criteria(table_name, criteria):
+    try:
+        sql = COMPILED_STATEMENTS["select_by_criteria"][table_name][None][tuple(criteria)]
+    except KeyError:
+        sql, _ = get_statement("select_by_criteria", table_name, criteria.keys())
+    return sql, tuple(criteria.values())
+
+
+ANIMAL = {"shelter_id": 1, "name": "Charlie", "species": "Dog", "breed": "Beagle", "age": 3, "gender": "M"}
+SQL_CASES = {
+    "insert": (lambda: legacy_insert("Animal", ANIMAL), lambda: cached_insert("Animal", ANIMAL)),
+    "update": (lambda: legacy_update("Animal", "animal_id", 7, {"name": "Max", "age": 4}),
+               lambda: cached_update("Animal", "animal_id", 7, {"name": "Max", "age": 4})),
+    "delete": (lambda: legacy_delete("Animal", "animal_id", 7), lambda: cached_delete("Animal", "animal_id", 7)),
+    "select_by_id": (lambda: legacy_select_by_id("Animal", "animal_id", 7),
+                     lambda: cached_select_by_id("Animal", "animal_id", 7)),
+    "select_by_criteria": (lambda: legacy_select_by_criteria("Animal", {"species": "Dog", "status": "Available"}),
+                           lambda: cached_select_by_criteria("Animal", {"species": "Dog", "status": "Available"})),
+}
+
+
+def per_call_us(func, calls, repeats):
+    """Median microseconds per call over `repeats` runs of `calls` calls."""
+    runs = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        runs.append((time.perf_counter() - start) / calls * 1e6)
+    return round(statistics.median(runs), 3)
+
+
+def with_cursor_lookup(case, prepared):
+    """case() + the (sql, dictionary) lookup connection.py's prepared-cursor cache does with it next."""
+    return lambda: prepared.get((case()[0], False))
+
+
+def bench_sql(calls, repeats):
+    # Schema DB se nahi padhte: Animal ke columns pehle se cache mein daal do
+    TABLE_COLUMNS_CACHE.setdefault("Animal", ANIMAL_COLUMNS)
+    results = {}
+    for name, (legacy, cached) in SQL_CASES.items():
+        if legacy() != cached():
+            raise SystemExit(f"ERROR: {name} statements differ")
+        # Statement pehle se "prepared" hai: dono paths cursor cache mein hit karte hain
+        prepared = {(cached()[0], False): object()}
+        results[name] = {"legacy_us": per_call_us(legacy, calls, repeats),
+                         "cached_us": per_call_us(cached, calls, repeats),
+                         "legacy_cursor_us": per_call_us(with_cursor_lookup(legacy, prepared), calls, repeats),
+                         "cached_cursor_us": per_call_us(with_cursor_lookup(cached, prepared), calls, repeats)}
+    return results
+
+
+def bench_db(calls, repeats):
+    """select_record_by_id / select_records_by_criteria with and without prepared statements."""
+    page, error = queries.select_records_page("Animal", 100)
+    if error or not page["data"]:
+        raise SystemExit(f"ERROR: need some Animal rows in the DB ({error or 'table is empty'})")
+    ids = [row["animal_id"] for row in page["data"]]
+    species = page["data"][0]["species"]
+
+    cases = {
+        "select_by_id": lambda i: select_record_by_id("Animal", "animal_id", ids[i % len(ids)]),
+        "select_by_criteria": lambda i: select_records_by_criteria("Animal", {"animal_id": ids[i % len(ids)],
+                                                                              "species": species}),
+    }
+    # Pool mein ek hi connection rakho: har call usi ke prepared statements reuse kare
+    connection.get_pool(queries.DB_NAME).max_size = 1
+
+    results = {}
+    for name, case in cases.items():
+        results[name] = {}
+        for label, prepared in (("text_us", False), ("prepared_us", True)):
+            connection.PREPARED_STATEMENTS = prepared
+            case(0)   # warm up: schema lookup + PREPARE
+            counter = iter(range(10 ** 9))
+            results[name][label] = per_call_us(lambda: case(next(counter)), calls, repeats)
+    return results
+
+
+def print_table(title, results, before, after):
+    print(f"\n{title}")
+    print(f"{'operation':20} {before:>14} {after:>14} {'saved us':>10} {'speedup':>8}")
+    for name, result in results.items():
+        saved = result[before] - result[after]
+        speedup = result[before] / max(result[after], 0.001)
+        print(f"{name:20} {result[before]:>14} {result[after]:>14} {saved:>10.2f} {speedup:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-call cost of the generic CRUD statement paths.")
+    parser.add_argument("--calls", type=int, default=100000, help="calls per run (SQL mode)")
+    parser.add_argument("--db-calls", type=int, default=2000, help="calls per run (DB mode)")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--db", action="store_true", help="also measure MySQL round-trips")
+    parser.add_argument("--out", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = {"sql": bench_sql(args.calls, args.repeats)}
+    print_table("SQL build per call (no DB)", results["sql"], "legacy_us", "cached_us")
+    print_table("SQL build + prepared-cursor lookup per call (no DB)", results["sql"],
+                "legacy_cursor_us", "cached_cursor_us")
+
+    if args.db:
+        results["db"] = bench_db(args.db_calls, args.repeats)
+        print_table("Full call incl. MySQL round-trip", results["db"], "text_us", "prepared_us")
+        print(f"\npool: {connection.get_pool_stats()}")
+
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
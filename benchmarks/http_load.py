@@ -0,0 +1,299 @@
+# benchmarks/http_load.py
+# HTTP load benchmark for every /api/* route of backend/app.py.
+#
+# Usage (Flask server already running, DB seeded with db/generate_data.py):
+#   python benchmarks/http_load.py --concurrency 16 --requests 500 --out results/run1.json
+#   python benchmarks/http_load.py --compare results/run1.json --threshold 10 --out results/run2.json
+#
+# Sirf standard library use hoti hai (urllib + threads), koi extra install nahi chahiye.
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+# --- HTTP helper ---
+
+def http_request(base_url, method, path, body=None, headers=None, timeout=30):
+    """Returns (status_code, response_bytes). Network errors return status 0."""
+    data = None
+    all_headers = dict(headers or {})
+    if body is not None:
+        if isinstance(body, (bytes, str)):
+            data = body.encode() if isinstance(body, str) else body
+        else:
+            data = json.dumps(body).encode()
+            all_headers.setdefault('Content-Type', 'application/json')
+    req = urllib.request.Request(base_url + path, data=data, method=method, headers=all_headers)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+    except (urllib.error.URLError, OSError):
+        return 0, b''
+
+
+def get_json(base_url, path):
+    status, payload = http_request(base_url, 'GET', path)
+    if status != 200:
+        return []
+    return json.loads(payload)
+
+
+# --- Context: real IDs discover karo taaki requests valid hon ---
+
+class Context:
+    def __init__(self, base_url, run_id):
+        self.base_url = base_url
+        self.run_id = run_id
+        self.lock = threading.Lock()
+        self.counter = 0
+
+        self.animal_ids = [a['animal_id'] for a in get_json(base_url, '/api/animals?limit=1000')]
+        self.available_ids = [a['animal_id'] for a in get_json(base_url, '/api/animals?status=Available&limit=1000')]
+        self.shelter_ids = [s['shelter_id'] for s in get_json(base_url, '/api/shelters?limit=1000')]
+        self.employee_ids = [e['employee_id'] for e in get_json(base_url, '/api/employees?limit=1000')]
+        self.adopter_ids = [a['adopter_id'] for a in get_json(base_url, '/api/adopters?limit=1000')]
+        self.created_animals = []
+        self.created_shelters = []
+
+    def next_number(self):
+        with self.lock:
+            self.counter += 1
+            return self.counter
+
+    def unique_phone(self):
+        # Customer.phone UNIQUE hai
+        return f"B{self.run_id % 10000:04d}{self.next_number():07d}"
+
+    def pop(self, items):
+        with self.lock:
+            return items.pop() if items else None
+
+    def push(self, items, value):
+        with self.lock:
+            items.append(value)
+
+    def pick(self, items, default=1):
+        return random.choice(items) if items else default
+
+    def new_animal(self):
+        return {"name": f"Bench{self.next_number()}", "species": "Dog", "breed": "Indie", "age": 2,
+                "gender": "M", "status": "Available", "shelter_id": self.pick(self.shelter_ids)}
+
+
+# --- Route definitions ---
+# Har route: (name, method, path_fn(ctx), body_fn(ctx) or None, after_fn(ctx, status, payload) or None)
+
+def _remember_new_animal(ctx, status, payload):
+    if status == 201:
+        ctx.push(ctx.created_animals, json.loads(payload)['new_animal_id'])
+
+def _remember_new_shelter(ctx, status, payload):
+    if status == 201:
+        ctx.push(ctx.created_shelters, json.loads(payload)['new_shelter_id'])
+
+def _adoption_body(ctx):
+    animal_id = ctx.pop(ctx.available_ids)
+    return {"animal_id": animal_id or 0, "adopter_id": ctx.pick(ctx.adopter_ids),
+            "employee_id": ctx.pick(ctx.employee_ids)}
+
+ROUTES = [
+    ("GET /api/shelters", 'GET', lambda c: '/api/shelters', None, None),
+    ("GET /api/shelters/<id>", 'GET', lambda c: f'/api/shelters/{c.pick(c.shelter_ids)}', None, None),
+    ("POST /api/shelters", 'POST', lambda c: '/api/shelters',
+     lambda c: {"name": f"Bench Shelter {c.next_number()}", "address": "Bench Rd", "capacity": 50},
+     _remember_new_shelter),
+    ("DELETE /api/shelters/<id>", 'DELETE', lambda c: f'/api/shelters/{c.pop(c.created_shelters) or 0}', None, None),
+    ("GET /api/animals", 'GET', lambda c: '/api/animals', None, None),
+    ("GET /api/animals?status=Available", 'GET', lambda c: '/api/animals?status=Available', None, None),
+    ("GET /api/animals/<id>", 'GET', lambda c: f'/api/animals/{c.pick(c.animal_ids)}', None, None),
+    ("POST /api/animals", 'POST', lambda c: '/api/animals', lambda c: c.new_animal(), _remember_new_animal),
+    ("POST /api/animals/bulk", 'POST', lambda c: '/api/animals/bulk',
+     lambda c: [c.new_animal() for _ in range(20)], None),
+    ("PUT /api/animals/<id>", 'PUT', lambda c: f'/api/animals/{c.pick(c.animal_ids)}',
+     lambda c: {"name": f"Renamed{c.next_number()}"}, None),
+    ("DELETE /api/animals/<id>", 'DELETE', lambda c: f'/api/animals/{c.pop(c.created_animals) or 0}', None, None),
+    ("GET /api/employees", 'GET', lambda c: '/api/employees', None, None),
+    ("POST /api/employees", 'POST', lambda c: '/api/employees',
+     lambda c: {"name": f"Bench Emp {c.next_number()}", "role": "Volunteer", "salary": 30000,
+                "shelter_id": c.pick(c.shelter_ids)}, None),
+    ("PUT /api/employees/<id>/salary", 'PUT', lambda c: f'/api/employees/{c.pick(c.employee_ids)}/salary',
+     lambda c: {"salary": random.randint(30000, 90000)}, None),
+    ("GET /api/customers", 'GET', lambda c: '/api/customers', None, None),
+    ("GET /api/adopters", 'GET', lambda c: '/api/adopters', None, None),
+    ("GET /api/adopters/details", 'GET', lambda c: '/api/adopters/details', None, None),
+    ("POST /api/adopters", 'POST', lambda c: '/api/adopters',
+     lambda c: {"first_name": "Bench", "last_name": "Adopter", "phone": c.unique_phone()}, None),
+    ("GET /api/donors", 'GET', lambda c: '/api/donors', None, None),
+    ("GET /api/donors/details", 'GET', lambda c: '/api/donors/details', None, None),
+    ("POST /api/donors", 'POST', lambda c: '/api/donors',
+     lambda c: {"first_name": "Bench", "last_name": "Donor", "phone": c.unique_phone(), "amount": 100}, None),
+    ("GET /api/adoptions", 'GET', lambda c: '/api/adoptions', None, None),
+    ("GET /api/donations", 'GET', lambda c: '/api/donations', None, None),
+    ("POST /api/adopt", 'POST', lambda c: '/api/adopt', _adoption_body, None),
+    ("POST /api/adopt/batch", 'POST', lambda c: '/api/adopt/batch',
+     lambda c: {"mode": "best_effort", "adoptions": [_adoption_body(c) for _ in range(10)]}, None),
+    ("GET /api/reports/shelter-occupancy", 'GET', lambda c: '/api/reports/shelter-occupancy', None, None),
+    ("GET /api/reports/employees-above-average", 'GET', lambda c: '/api/reports/employees-above-average', None, None),
+    ("GET /api/reports/multi-adopters", 'GET', lambda c: '/api/reports/multi-adopters', None, None),
+    ("GET /api/reports/cache-stats", 'GET', lambda c: '/api/reports/cache-stats', None, None),
+    ("GET /api/db/pool-stats", 'GET', lambda c: '/api/db/pool-stats', None, None),
+]
+
+# Poori table stream karte hain, sirf --include-heavy par chalenge
+HEAVY_ROUTES = [
+    ("GET /api/export/Animal", 'GET', lambda c: '/api/export/Animal', None, None),
+]
+
+
+# --- Runner ---
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def run_route(ctx, route, total_requests, concurrency):
+    name, method, path_fn, body_fn, after_fn = route
+    latencies = []
+    statuses = {}
+    lock = threading.Lock()
+
+    def one_request(_):
+        path = path_fn(ctx)
+        body = body_fn(ctx) if body_fn else None
+        start = time.perf_counter()
+        status, payload = http_request(ctx.base_url, method, path, body)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if after_fn:
+            after_fn(ctx, status, payload)
+        with lock:
+            latencies.append(elapsed_ms)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one_request, range(total_requests)))
+    wall = time.perf_counter() - wall_start
+
+    latencies.sort()
+    errors = sum(count for status, count in statuses.items() if status == 0 or status >= 500)
+    return {
+        "route": name,
+        "requests": total_requests,
+        "concurrency": concurrency,
+        "req_per_sec": round(total_requests / wall, 2) if wall else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+        "errors": errors,
+        "status_counts": {str(k): v for k, v in sorted(statuses.items())},
+    }
+
+
+def compare_runs(baseline, current, threshold_pct):
+    """
+    Compares two result files. A route regresses if its p95 latency grew, or its
+    req/s dropped, by more than threshold_pct percent.
+    """
+    old_by_route = {r["route"]: r for r in baseline["results"]}
+    regressions = []
+    print(f"\n{'route':45} {'p95 old':>10} {'p95 new':>10} {'rps old':>10} {'rps new':>10}")
+    for new in current["results"]:
+        old = old_by_route.get(new["route"])
+        if old is None:
+            continue
+        flag = ""
+        if old["p95_ms"] and (new["p95_ms"] - old["p95_ms"]) / old["p95_ms"] * 100 > threshold_pct:
+            flag = "  <-- p95 REGRESSION"
+        elif old["req_per_sec"] and (old["req_per_sec"] - new["req_per_sec"]) / old["req_per_sec"] * 100 > threshold_pct:
+            flag = "  <-- req/s REGRESSION"
+        if flag:
+            regressions.append(new["route"])
+        print(f"{new['route'][:45]:45} {old['p95_ms']:>10.2f} {new['p95_ms']:>10.2f} "
+              f"{old['req_per_sec']:>10.1f} {new['req_per_sec']:>10.1f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test every /api/* route and report latency percentiles.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:5000")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200, help="requests per route")
+    parser.add_argument("--routes", default=None, help="comma separated substrings; only matching routes run")
+    parser.add_argument("--include-heavy", action="store_true", help="also run whole-table export routes")
+    parser.add_argument("--generate", default=None,
+                        help="seed the DB first, e.g. --generate \"--animals 100000 --customers 50000\"")
+    parser.add_argument("--out", default=None, help="write results JSON here")
+    parser.add_argument("--compare", default=None, help="baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="regression threshold in percent")
+    args = parser.parse_args()
+
+    if args.generate:
+        script = os.path.join(os.path.dirname(__file__), '..', 'backend', 'db', 'generate_data.py')
+        print(f"Seeding database: generate_data.py {args.generate}")
+        subprocess.run([sys.executable, script] + args.generate.split(), check=True,
+                       cwd=os.path.dirname(script))
+
+    # Baseline pehle padh lo (--out aur --compare same file ho sakti hai)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    routes = ROUTES + (HEAVY_ROUTES if args.include_heavy else [])
+    if args.routes:
+        wanted = [w.strip() for w in args.routes.split(",") if w.strip()]
+        routes = [r for r in routes if any(w in r[0] for w in wanted)]
+
+    ctx = Context(args.base_url, run_id=int(time.time()))
+    if not ctx.shelter_ids:
+        print(f"Could not fetch data from {args.base_url}. Is the Flask server running and the DB seeded?")
+        return 2
+
+    results = []
+    print(f"{'route':45} {'req/s':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'errors':>7}")
+    for route in routes:
+        result = run_route(ctx, route, args.requests, args.concurrency)
+        results.append(result)
+        print(f"{result['route'][:45]:45} {result['req_per_sec']:>9.1f} {result['p50_ms']:>9.2f} "
+              f"{result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f} {result['errors']:>7}")
+
+    run = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "base_url": args.base_url,
+        "concurrency": args.concurrency,
+        "requests_per_route": args.requests,
+        "results": results,
+    }
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(run, f, indent=2)
+        print(f"\nResults saved to {args.out}")
+
+    if baseline is not None:
+        regressions = compare_runs(baseline, run, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} route(s) regressed by more than {args.threshold}%.")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold}%.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
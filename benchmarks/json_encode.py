@@ -0,0 +1,121 @@
+# benchmarks/json_encode.py
+# Micro-benchmark: Flask ka stdlib JSON provider vs backend/json_provider.py ka orjson provider,
+# Animal rows jaise payload par (int, str, DATE dob, Decimal bhi ek column mein).
+#
+# Usage (repo root se, DB ki zaroorat nahi):
+#   python benchmarks/json_encode.py                      # 100k rows, 5 repeats
+#   python benchmarks/json_encode.py --rows 10000 --repeats 20 --out results/json.json
+#
+# Har provider ke liye: best / median encode time (jsonify() jaisa poora response body)
+# aur tracemalloc se peak memory + allocation count. Pehle outputs byte-for-byte compare hote hain.
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from json_provider import OrjsonProvider, orjson
+
+SPECIES = {"Dog": ["Labrador", "Beagle", "Pug", None], "Cat": ["Persian", "Siamese", None],
+           "Rabbit": ["Lop", None], "Parrot": ["Macaw", None]}
+NAMES = ["Charlie", "Bella", "Max", "Luna", "Rocky", "Coco", "Simba", "Daisy", "Bruno", "Milo"]
+
+
+def animal_rows(count, seed=42):
+    """`count` dicts shaped like cursor(dictionary=True) rows from `Animal` (+ a Decimal fee column)."""
+    rng = random.Random(seed)
+    today = date(2024, 1, 1)
+    rows = []
+    for animal_id in range(1, count + 1):
+        species = rng.choice(list(SPECIES))
+        rows.append({
+            "animal_id": animal_id,
+            "shelter_id": rng.randint(1, 50),
+            "name": f"{rng.choice(NAMES)} {animal_id}",
+            "species": species,
+            "breed": rng.choice(SPECIES[species]),
+            "age": rng.randint(0, 15),
+            "gender": rng.choice("MFN"),
+            "dob": today - timedelta(days=rng.randint(0, 5000)) if rng.random() > 0.1 else None,
+            "status": rng.choice(["Available", "Adopted", "Pending"]),
+            "adoption_fee": Decimal(rng.randint(0, 50000)) / 100,
+        })
+    return rows
+
+
+def measure(app, rows, repeats):
+    """Times app.json.response(rows) (what jsonify() does) and records allocations of one run."""
+    with app.app_context():
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            app.json.response(rows).get_data()
+            timings.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        body = app.json.response(rows).get_data()
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    allocations = sum(stat.count_diff for stat in after.compare_to(before, 'filename') if stat.count_diff > 0)
+    return body, {
+        "best_ms": round(min(timings) * 1000, 2),
+        "median_ms": round(statistics.median(timings) * 1000, 2),
+        "peak_mb": round(peak / 1048576, 2),
+        "allocated_blocks": allocations,
+        "body_bytes": len(body),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the stdlib and orjson JSON providers.")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--out", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    if orjson is None:
+        print("orjson is not installed (pip install orjson); nothing to compare.")
+        raise SystemExit(1)
+
+    rows = animal_rows(args.rows)
+    results = {}
+    bodies = {}
+    for name, provider in (("stdlib", DefaultJSONProvider), ("orjson", OrjsonProvider)):
+        app = Flask(__name__)
+        app.json = provider(app)
+        bodies[name], results[name] = measure(app, rows, args.repeats)
+
+    if bodies["stdlib"] != bodies["orjson"]:
+        print("ERROR: outputs differ!")
+        raise SystemExit(1)
+
+    print(f"{args.rows:,} Animal rows, {results['stdlib']['body_bytes']:,} bytes, outputs identical\n")
+    print(f"{'provider':10} {'best ms':>10} {'median ms':>10} {'peak MB':>10} {'alloc blocks':>14}")
+    for name, result in results.items():
+        print(f"{name:10} {result['best_ms']:>10} {result['median_ms']:>10} "
+              f"{result['peak_mb']:>10} {result['allocated_blocks']:>14,}")
+    speedup = results["stdlib"]["median_ms"] / max(results["orjson"]["median_ms"], 0.001)
+    print(f"\norjson is {speedup:.1f}x faster (median)")
+
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, 'w') as f:
+            json.dump({"rows": args.rows, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
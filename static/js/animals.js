@@ -22,21 +22,53 @@ document.addEventListener('DOMContentLoaded', () => {
     }
 
     // --- 1. Load All Animals ---
-    async function loadAnimals() {
-        animalTableContainer.innerHTML = '<p>Loading animals...</p>';
-        
+    // API ek baar mein ek page (default 100 rows) deta hai; agle page ka cursor 'X-Next-Cursor' header mein
+    let nextCursor = null;
+
+    function animalRow(animal) {
+        // Check ki status adopted ya available hai
+        const statusClass = animal.status.toLowerCase().includes('adopted') ? 'status-adopted' : 'status-available';
+
+        return `
+            <tr data-id="${animal.animal_id}">
+                <td>${animal.animal_id}</td>
+                <td>${animal.name}</td>
+                <td>${animal.species} / ${animal.breed}</td>
+                <td>${animal.age} yrs / ${animal.gender}</td>
+                <td>
+                    <span class="${statusClass}">${animal.status}</span>
+                </td>
+                <td>${animal.shelter_id}</td>
+                <td class="actions">
+                    <!-- Buttons ke 'class' attributes theek kiye gaye hain -->
+                    <button class="btn-update" data-id="${animal.animal_id}" data-name="${animal.name}">Update</button>
+                    <button class="btn-delete" data-id="${animal.animal_id}">Delete</button>
+                </td>
+            </tr>
+        `;
+    }
+
+    // append = true: 'Load more' button, agla page table ke neeche jodo
+    async function loadAnimals(append = false) {
+        if (!append) {
+            animalTableContainer.innerHTML = '<p>Loading animals...</p>';
+        }
+        const url = append ? `${API_BASE_URL}/animals?after=${nextCursor}` : `${API_BASE_URL}/animals`;
+
         try {
-            const response = await fetch(`${API_BASE_URL}/animals`);
+            const response = await fetch(url);
             const data = await response.json();
             
             if (!response.ok) {
-                const errorData = await response.json();
-                throw new Error(errorData.error || `HTTP error! Status: ${response.status}`);
+                throw new Error(data.error || `HTTP error! Status: ${response.status}`);
             }
+            nextCursor = response.headers.get('X-Next-Cursor');
 
-            if (data && data.length > 0) {
-                // Table create karo
-                let tableHtml = `
+            if (append) {
+                animalTableContainer.querySelector('tbody').insertAdjacentHTML('beforeend', data.map(animalRow).join(''));
+            } else if (data && data.length > 0) {
+                // Table create karo, har animal ke liye ek row
+                animalTableContainer.innerHTML = `
                     <table class="data-table">
                         <thead>
                             <tr>
@@ -49,39 +81,18 @@ document.addEventListener('DOMContentLoaded', () => {
                                 <th>Actions</th>
                             </tr>
                         </thead>
-                        <tbody>
+                        <tbody>${data.map(animalRow).join('')}</tbody>
+                    </table>
+                    <button class="btn-load-more">Load more</button>
                 `;
-                
-                // Har animal ke liye ek row
-                data.forEach(animal => {
-                    // Check ki status adopted ya available hai
-                    const statusClass = animal.status.toLowerCase().includes('adopted') ? 'status-adopted' : 'status-available';
-                    
-                    tableHtml += `
-                        <tr data-id="${animal.animal_id}">
-                            <td>${animal.animal_id}</td>
-                            <td>${animal.name}</td>
-                            <td>${animal.species} / ${animal.breed}</td>
-                            <td>${animal.age} yrs / ${animal.gender}</td>
-                            <td>
-                                <span class="${statusClass}">${animal.status}</span>
-                            </td>
-                            <td>${animal.shelter_id}</td>
-                            <td class="actions">
-                                <!-- Buttons ke 'class' attributes theek kiye gaye hain -->
-                                <button class="btn-update" data-id="${animal.animal_id}" data-name="${animal.name}">Update</button>
-                                <button class="btn-delete" data-id="${animal.animal_id}">Delete</button>
-                            </td>
-                        </tr>
-                    `;
-                });
-
-                tableHtml += '</tbody></table>';
-                animalTableContainer.innerHTML = tableHtml;
-
             } else {
                 animalTableContainer.innerHTML = '<p>No animals found in the database.</p>';
             }
+
+            const loadMoreBtn = animalTableContainer.querySelector('.btn-load-more');
+            if (loadMoreBtn) {
+                loadMoreBtn.hidden = !nextCursor;
+            }
         } catch (error) {
             console.error('Error fetching animals:', error);
             animalTableContainer.innerHTML = `<div class="error-message">Error: ${error.message}</div>`;
@@ -89,7 +100,7 @@ document.addEventListener('DOMContentLoaded', () => {
     }
     
     // Button par click karke function call karo
-    loadAllAnimalsBtn.addEventListener('click', loadAnimals);
+    loadAllAnimalsBtn.addEventListener('click', () => loadAnimals());
 
 
     // --- 2. Add New Animal (Form Submit) ---
@@ -140,6 +151,14 @@ document.addEventListener('DOMContentLoaded', () => {
         const animalId = target.dataset.id;
         const animalName = target.dataset.name;
 
+        // --- 'Load more' (agla page) ---
+        if (target.classList.contains('btn-load-more')) {
+            target.disabled = true;
+            await loadAnimals(true);
+            target.disabled = false;
+            return;
+        }
+
         // --- Agar DELETE button click hua (FIXED) ---
         if (target.classList.contains('btn-delete')) {
             if (!confirm(`Are you sure you want to delete ${animalName} (ID ${animalId})?`)) {
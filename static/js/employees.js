@@ -16,19 +16,45 @@ document.addEventListener('DOMContentLoaded', () => {
     }
 
     // --- 1. Load All Employees ---
-    async function loadEmployees() {
-        employeeTableContainer.innerHTML = '<p>Loading employees...</p>';
-        
+    // API ek baar mein ek page (default 100 rows) deta hai; agle page ka cursor 'X-Next-Cursor' header mein
+    let nextCursor = null;
+
+    function employeeRow(employee) {
+        const salary = parseFloat(employee.salary).toFixed(2);
+        return `
+            <tr data-id="${employee.employee_id}">
+                <td>${employee.employee_id}</td>
+                <td>${employee.name}</td>
+                <td>${employee.role}</td>
+                <td>$${salary}</td>
+                <td>${employee.shelter_id}</td>
+                <td class="actions">
+                    <button class="btn-update-salary" data-id="${employee.employee_id}" data-name="${employee.name}" data-current-salary="${salary}">Update Salary</button>
+                </td>
+            </tr>
+        `;
+    }
+
+    // append = true: 'Load more' button, agla page table ke neeche jodo
+    async function loadEmployees(append = false) {
+        if (!append) {
+            employeeTableContainer.innerHTML = '<p>Loading employees...</p>';
+        }
+        const url = append ? `${API_BASE_URL}/employees?after=${nextCursor}` : `${API_BASE_URL}/employees`;
+
         try {
-            const response = await fetch(`${API_BASE_URL}/employees`);
+            const response = await fetch(url);
             const data = await response.json();
             
             if (!response.ok) {
                 throw new Error(data.error || `HTTP error! Status: ${response.status}`);
             }
+            nextCursor = response.headers.get('X-Next-Cursor');
 
-            if (data && data.length > 0) {
-                let tableHtml = `
+            if (append) {
+                employeeTableContainer.querySelector('tbody').insertAdjacentHTML('beforeend', data.map(employeeRow).join(''));
+            } else if (data && data.length > 0) {
+                employeeTableContainer.innerHTML = `
                     <table class="data-table">
                         <thead>
                             <tr>
@@ -40,31 +66,18 @@ document.addEventListener('DOMContentLoaded', () => {
                                 <th>Action</th>
                             </tr>
                         </thead>
-                        <tbody>
+                        <tbody>${data.map(employeeRow).join('')}</tbody>
+                    </table>
+                    <button class="btn-load-more">Load more</button>
                 `;
-                
-                data.forEach(employee => {
-                    const salary = parseFloat(employee.salary).toFixed(2);
-                    tableHtml += `
-                        <tr data-id="${employee.employee_id}">
-                            <td>${employee.employee_id}</td>
-                            <td>${employee.name}</td>
-                            <td>${employee.role}</td>
-                            <td>$${salary}</td>
-                            <td>${employee.shelter_id}</td>
-                            <td class="actions">
-                                <button class="btn-update-salary" data-id="${employee.employee_id}" data-name="${employee.name}" data-current-salary="${salary}">Update Salary</button>
-                            </td>
-                        </tr>
-                    `;
-                });
-
-                tableHtml += '</tbody></table>';
-                employeeTableContainer.innerHTML = tableHtml;
-
             } else {
                 employeeTableContainer.innerHTML = '<p>No employees found. Add one above!</p>';
             }
+
+            const loadMoreBtn = employeeTableContainer.querySelector('.btn-load-more');
+            if (loadMoreBtn) {
+                loadMoreBtn.hidden = !nextCursor;
+            }
         } catch (error) {
             console.error('Error fetching employees:', error);
             employeeTableContainer.innerHTML = `<div class="error-message">Error: ${error.message}</div>`;
@@ -113,6 +126,14 @@ document.addEventListener('DOMContentLoaded', () => {
         const employeeName = target.dataset.name;
         const currentSalary = target.dataset.currentSalary;
 
+        // --- 'Load more' (agla page) ---
+        if (target.classList.contains('btn-load-more')) {
+            target.disabled = true;
+            await loadEmployees(true);
+            target.disabled = false;
+            return;
+        }
+
         if (target.classList.contains('btn-update-salary')) {
             
             const newSalaryInput = prompt(`Enter new salary for ${employeeName} (Current: $${currentSalary}):`);
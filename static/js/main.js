@@ -11,6 +11,9 @@ document.addEventListener('DOMContentLoaded', () => {
     const adoptBtn = document.getElementById('adoptBtn');
     const adoptResult = document.getElementById('adopt-result');
 
+    // Animal card sirf yeh columns dikhata hai (server baaki columns nahi bhejega)
+    const CARD_FIELDS = 'name,species,breed,age,gender,status,shelter_id';
+
     // Helper function (Error message dikhane ke liye)
     function showError(element, message) {
         element.innerHTML = `<div class="error-message">${message}</div>`;
@@ -23,12 +26,35 @@ document.addEventListener('DOMContentLoaded', () => {
 
 
     // --- 1. Load Animals Button ---
+    // Dashboard sirf pehla page deta hai; baaki 'Load more' se /api/animals (X-Next-Cursor) se aate hain
+    let nextCursor = null;
+    const loadMoreBtn = document.createElement('button');
+    loadMoreBtn.className = 'btn-load-more';
+    loadMoreBtn.textContent = 'Load more';
+
+    // Har animal ke liye ek card banao (button se pehle)
+    function appendAnimalCards(data) {
+        data.forEach(animal => {
+            const animalCard = document.createElement('div');
+            animalCard.className = 'animal-card';
+            animalCard.innerHTML = `
+                <h3>${animal.name} (ID: ${animal.animal_id})</h3>
+                <p>Species: ${animal.species} (${animal.breed})</p>
+                <p>Age: ${animal.age} | Gender: ${animal.gender}</p>
+                <p>Status: <span class="status-available">${animal.status}</span></p>
+                <p>Shelter ID: ${animal.shelter_id}</p>
+            `;
+            dataContainer.insertBefore(animalCard, loadMoreBtn.parentNode === dataContainer ? loadMoreBtn : null);
+        });
+        loadMoreBtn.hidden = !nextCursor;
+    }
+
     loadAnimalsBtn.addEventListener('click', () => {
         // Data container ko clear karo aur 'Loading...' dikhao
         dataContainer.innerHTML = '<p>Loading animals...</p>';
 
-        // API ko call karo: GET /api/animals?status=Available
-        fetch(`${API_BASE_URL}/animals?status=Available`)
+        // API ko call karo: GET /api/dashboard (available animals + counts, ek hi request mein)
+        fetch(`${API_BASE_URL}/dashboard?fields=${CARD_FIELDS}`)
             .then(response => {
                 // Agar response OK nahi hai, toh error throw karo
                 if (!response.ok) {
@@ -36,24 +62,18 @@ document.addEventListener('DOMContentLoaded', () => {
                 }
                 return response.json(); // JSON data ko parse karo
             })
-            .then(data => {
-                // Data container ko clear karo
-                dataContainer.innerHTML = ''; 
+            .then(dashboard => {
+                const data = dashboard.available_animals;
+                const counts = dashboard.counts;
+
+                // Data container ko clear karo, upar headline counts dikhao
+                dataContainer.innerHTML = `<p>Available: ${counts.available_animals} / ${counts.total_animals} animals
+                    | Shelters: ${counts.shelters} | Adopters: ${counts.adopters}</p>`;
 
                 if (data && data.length > 0) {
-                    // Har animal ke liye ek card banao
-                    data.forEach(animal => {
-                        const animalCard = document.createElement('div');
-                        animalCard.className = 'animal-card';
-                        animalCard.innerHTML = `
-                            <h3>${animal.name} (ID: ${animal.animal_id})</h3>
-                            <p>Species: ${animal.species} (${animal.breed})</p>
-                            <p>Age: ${animal.age} | Gender: ${animal.gender}</p>
-                            <p>Status: <span class="status-available">${animal.status}</span></p>
-                            <p>Shelter ID: ${animal.shelter_id}</p>
-                        `;
-                        dataContainer.appendChild(animalCard);
-                    });
+                    nextCursor = dashboard.next_cursor;
+                    dataContainer.appendChild(loadMoreBtn);
+                    appendAnimalCards(data);
                 } else {
                     // Agar koi 'Available' animal nahi mila
                     dataContainer.innerHTML = '<p>No available animals found.</p>';
@@ -66,6 +86,27 @@ document.addEventListener('DOMContentLoaded', () => {
             });
     });
 
+    // 'Load more': agla page GET /api/animals?status=Available&after=<cursor>
+    loadMoreBtn.addEventListener('click', () => {
+        loadMoreBtn.disabled = true;
+        fetch(`${API_BASE_URL}/animals?status=Available&fields=${CARD_FIELDS}&after=${nextCursor}`)
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`HTTP error! Status: ${response.status}`);
+                }
+                nextCursor = response.headers.get('X-Next-Cursor');
+                return response.json();
+            })
+            .then(appendAnimalCards)
+            .catch(error => {
+                console.error('Error fetching animals:', error);
+                showError(dataContainer, `Error fetching animals: ${error.message}`);
+            })
+            .finally(() => {
+                loadMoreBtn.disabled = false;
+            });
+    });
+
 
     // --- 2. Test Adopt Button ---
     adoptBtn.addEventListener('click', () => {
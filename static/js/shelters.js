@@ -18,19 +18,46 @@ document.addEventListener('DOMContentLoaded', () => {
     }
 
     // --- 1. Load All Shelters ---
-    async function loadShelters() {
-        shelterTableContainer.innerHTML = '<p>Loading shelters...</p>';
-        
+    // API ek baar mein ek page (default 100 rows) deta hai; agle page ka cursor 'X-Next-Cursor' header mein
+    let nextCursor = null;
+
+    function shelterRow(shelter) {
+        const occupancyClass = (shelter.current_occupancy / shelter.capacity) > 0.8 ? 'text-warning' : '';
+
+        return `
+            <tr data-id="${shelter.shelter_id}">
+                <td>${shelter.shelter_id}</td>
+                <td>${shelter.name}</td>
+                <td>${shelter.location}</td> <!-- Schema mein 'location' hai -->
+                <td>${shelter.capacity}</td>
+                <td><span class="${occupancyClass}">${shelter.current_occupancy}</span></td>
+                <td class="actions">
+                    <button class="btn-delete" data-id="${shelter.shelter_id}">Delete</button>
+                </td>
+            </tr>
+        `;
+    }
+
+    // append = true: 'Load more' button, agla page table ke neeche jodo
+    async function loadShelters(append = false) {
+        if (!append) {
+            shelterTableContainer.innerHTML = '<p>Loading shelters...</p>';
+        }
+        const url = append ? `${API_BASE_URL}/shelters?after=${nextCursor}` : `${API_BASE_URL}/shelters`;
+
         try {
-            const response = await fetch(`${API_BASE_URL}/shelters`);
+            const response = await fetch(url);
             const data = await response.json();
             
             if (!response.ok) {
                 throw new Error(data.error || `HTTP error! Status: ${response.status}`);
             }
+            nextCursor = response.headers.get('X-Next-Cursor');
 
-            if (data && data.length > 0) {
-                let tableHtml = `
+            if (append) {
+                shelterTableContainer.querySelector('tbody').insertAdjacentHTML('beforeend', data.map(shelterRow).join(''));
+            } else if (data && data.length > 0) {
+                shelterTableContainer.innerHTML = `
                     <table class="data-table">
                         <thead>
                             <tr>
@@ -42,32 +69,18 @@ document.addEventListener('DOMContentLoaded', () => {
                                 <th>Action</th>
                             </tr>
                         </thead>
-                        <tbody>
+                        <tbody>${data.map(shelterRow).join('')}</tbody>
+                    </table>
+                    <button class="btn-load-more">Load more</button>
                 `;
-                
-                data.forEach(shelter => {
-                    const occupancyClass = (shelter.current_occupancy / shelter.capacity) > 0.8 ? 'text-warning' : '';
-
-                    tableHtml += `
-                        <tr data-id="${shelter.shelter_id}">
-                            <td>${shelter.shelter_id}</td>
-                            <td>${shelter.name}</td>
-                            <td>${shelter.location}</td> <!-- Schema mein 'location' hai -->
-                            <td>${shelter.capacity}</td>
-                            <td><span class="${occupancyClass}">${shelter.current_occupancy}</span></td>
-                            <td class="actions">
-                                <button class="btn-delete" data-id="${shelter.shelter_id}">Delete</button>
-                            </td>
-                        </tr>
-                    `;
-                });
-
-                tableHtml += '</tbody></table>';
-                shelterTableContainer.innerHTML = tableHtml;
-
             } else {
                 shelterTableContainer.innerHTML = '<p>No shelters found. Add one above!</p>';
             }
+
+            const loadMoreBtn = shelterTableContainer.querySelector('.btn-load-more');
+            if (loadMoreBtn) {
+                loadMoreBtn.hidden = !nextCursor;
+            }
         } catch (error) {
             console.error('Error fetching shelters:', error);
             shelterTableContainer.innerHTML = `<div class="error-message">Error: ${error.message}</div>`;
@@ -114,6 +127,14 @@ document.addEventListener('DOMContentLoaded', () => {
         const target = event.target;
         const shelterId = target.dataset.id;
 
+        // --- 'Load more' (agla page) ---
+        if (target.classList.contains('btn-load-more')) {
+            target.disabled = true;
+            await loadShelters(true);
+            target.disabled = false;
+            return;
+        }
+
         if (target.classList.contains('btn-delete')) { // Class name check
             
             if (!confirm(`Are you sure you want to delete Shelter ID ${shelterId}? \n\n(Note: Database will block deletion if employees/animals are still assigned - this tests the trigger.)`)) {
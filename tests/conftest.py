@@ -0,0 +1,8 @@
+# tests/conftest.py
+# DB-free unit tests. Run from the repo root: python -m pytest -q
+# backend/ ko path par daalo, jaise benchmarks/ karte hain (from db.x import ...).
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
@@ -0,0 +1,43 @@
+# tests/test_logs.py
+# NonBlockingQueueHandler: queue bhari ho toh INFO drop hota hai, ERROR kabhi nahi.
+
+import logging
+import queue
+
+from db.logs import NonBlockingQueueHandler, RequestIdFilter
+
+
+def make_logger(handler):
+    handler.addFilter(RequestIdFilter())
+    logger = logging.getLogger("tests.logs.full_queue")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def test_full_queue_drops_info_but_writes_errors_to_stderr(capsys):
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    logger = make_logger(handler)
+
+    logger.info("fills the queue")
+    logger.info("sampled line, dropped")
+    logger.error("database down: %s", "2003")
+    logger.critical("still written")
+
+    assert handler.queue.get_nowait().getMessage() == "fills the queue"
+    assert handler.dropped == 1
+    err = capsys.readouterr().err
+    assert "ERROR tests.logs.full_queue [-] database down: 2003" in err
+    assert "CRITICAL" in err and "still written" in err
+    assert "sampled line" not in err
+
+
+def test_error_with_room_in_queue_goes_through_the_queue(capsys):
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    logger = make_logger(handler)
+
+    logger.error("queued")
+
+    assert handler.queue.get_nowait().getMessage() == "queued"
+    assert capsys.readouterr().err == ""
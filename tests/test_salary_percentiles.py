@@ -0,0 +1,60 @@
+# tests/test_salary_percentiles.py
+# Histogram se percentiles: bucket ke andar linear interpolation.
+
+from decimal import Decimal
+
+import pytest
+
+from db.queries import SALARY_BUCKET_WIDTH, approximate_percentiles, build_percentile_report
+
+
+def bucket(start, count):
+    return {"bucket_start": Decimal(start), "employee_count": count}
+
+
+def test_interpolates_inside_a_single_bucket():
+    histogram = [bucket(50000, 4)]
+    assert approximate_percentiles(histogram, (0, 25, 50, 100)) == {
+        0: Decimal('50000.00'),
+        25: Decimal('51250.00'),
+        50: Decimal('52500.00'),
+        100: Decimal('50000') + SALARY_BUCKET_WIDTH,
+    }
+
+
+def test_walks_buckets_and_skips_gaps():
+    # 40000-45000 mein 2, 60000-65000 mein 2 (beech ke buckets khaali)
+    histogram = [bucket(40000, 2), bucket(60000, 2)]
+    values = approximate_percentiles(histogram, (50, 75, 90))
+    assert values[50] == Decimal('45000.00')   # pehle bucket ka end
+    assert values[75] == Decimal('62500.00')
+    assert values[90] == Decimal('64000.00')
+
+
+def test_uneven_counts():
+    histogram = [bucket(30000, 1), bucket(35000, 9)]
+    values = approximate_percentiles(histogram, (10, 55))
+    assert values[10] == Decimal('35000.00')
+    assert values[55] == Decimal('37500.00')
+
+
+def test_results_are_monotonic():
+    histogram = [bucket(20000 + 5000 * i, count) for i, count in enumerate((3, 1, 7, 2, 5))]
+    percentiles = [p / 2 for p in range(201)]
+    values = approximate_percentiles(histogram, percentiles)
+    ordered = [values[p] for p in percentiles]
+    assert ordered == sorted(ordered)
+    assert ordered[0] == Decimal('20000.00') and ordered[-1] == Decimal('45000.00')
+
+
+def test_empty_histogram_gives_none():
+    assert approximate_percentiles([], (50, 90)) == {50: None, 90: None}
+
+
+@pytest.mark.parametrize("percentiles, keys", [((50.0, 99.9), ["p50", "p99.9"]), ((25, 75), ["p25", "p75"])])
+def test_report_shape(percentiles, keys):
+    report = build_percentile_report([bucket(50000, 4)], percentiles)
+    assert report["employee_count"] == 4
+    assert report["bucket_width"] == SALARY_BUCKET_WIDTH
+    assert report["approximate"] is True
+    assert list(report["percentiles"]) == keys
@@ -0,0 +1,64 @@
+# tests/test_search_cursor.py
+# /api/animals/search ke opaque cursors: encode / decode round trip aur galat cursors.
+
+import base64
+import json
+from datetime import date
+
+import pytest
+
+from db.queries import encode_search_cursor, decode_search_cursor, _keyset_condition
+
+ROW = {"animal_id": 42, "name": "Luna", "age": 3, "dob": date(2021, 5, 17)}
+
+
+@pytest.mark.parametrize("sort, value", [
+    (("animal_id", False), 42),
+    (("name", False), "Luna"),
+    (("age", True), 3),
+    (("dob", True), "2021-05-17"),   # dates cursor mein ISO string bante hain
+])
+def test_round_trip(sort, value):
+    token = encode_search_cursor(sort, ROW)
+    assert decode_search_cursor(token, sort) == ((value, 42), None)
+
+
+def test_token_is_url_safe_without_padding():
+    token = encode_search_cursor(("name", True), {"animal_id": 7, "name": "??>>~~"})
+    assert '=' not in token and '+' not in token and '/' not in token
+
+
+def test_null_sort_value_round_trips():
+    token = encode_search_cursor(("age", False), {"animal_id": 9, "age": None})
+    assert decode_search_cursor(token, ("age", False)) == ((None, 9), None)
+
+
+@pytest.mark.parametrize("other_sort", [("name", True), ("age", False), ("animal_id", False)])
+def test_cursor_only_works_with_its_sort(other_sort):
+    token = encode_search_cursor(("name", False), ROW)
+    assert decode_search_cursor(token, other_sort) == (None, "Search cursor does not match the sort order")
+
+
+def _token(state):
+    return base64.urlsafe_b64encode(json.dumps(state).encode('utf-8')).decode('ascii')
+
+
+@pytest.mark.parametrize("token", ["not base64!", _token(["name", "Luna"]), _token({"a": 1}), "x"])
+def test_garbage_is_rejected(token):
+    assert decode_search_cursor(token, ("name", False)) == (None, "Invalid search cursor")
+
+
+def test_non_integer_animal_id_is_rejected():
+    token = _token(["name", "Luna", "42; DROP TABLE Animal"])
+    assert decode_search_cursor(token, ("name", False)) == (None, "Search cursor does not match the sort order")
+
+
+def test_keyset_condition_follows_sort_direction():
+    assert _keyset_condition("animal_id", True, (None, 42)) == ("`animal_id` < %s", [42])
+    assert _keyset_condition("name", False, ("Luna", 42)) == (
+        "(`name` > %s OR (`name` = %s AND `animal_id` > %s))", ["Luna", "Luna", 42])
+    # NULLs ascending mein pehle, descending mein aakhir mein aate hain
+    assert _keyset_condition("age", False, (None, 9)) == (
+        "((`age` IS NULL AND `animal_id` > %s) OR `age` IS NOT NULL)", [9])
+    assert _keyset_condition("age", True, (3, 9)) == (
+        "(`age` < %s OR (`age` = %s AND `animal_id` < %s) OR `age` IS NULL)", [3, 3, 9])
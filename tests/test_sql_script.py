@@ -0,0 +1,72 @@
+# tests/test_sql_script.py
+# iter_sql_statements(): quotes, comments, DELIMITER blocks aur chunk boundaries.
+
+import io
+
+import pytest
+
+from db.sql_script import iter_sql_statements, split_sql_commands
+
+SCRIPT = """-- header comment; not a statement
+CREATE TABLE t (a VARCHAR(10) DEFAULT 'x;y');  # trailing ; comment
+INSERT INTO t VALUES ('it''s; fine'), ("say \\"hi;\\""), (`a;b`);
+/* block ; comment */ SELECT 1;
+/*!40101 SET NAMES utf8 */;
+DELIMITER $$
+CREATE TRIGGER trg BEFORE INSERT ON t FOR EACH ROW
+BEGIN
+  SET NEW.a = 'q;'; -- inner ; comment
+END$$
+DELIMITER ;
+SELECT 2
+"""
+
+EXPECTED = [
+    ("CREATE TABLE t (a VARCHAR(10) DEFAULT 'x;y')", False),
+    ("INSERT INTO t VALUES ('it''s; fine'), (\"say \\\"hi;\\\"\"), (`a;b`)", False),
+    ("SELECT 1", False),
+    ("/*!40101 SET NAMES utf8 */", False),
+    ("CREATE TRIGGER trg BEFORE INSERT ON t FOR EACH ROW\nBEGIN\n  SET NEW.a = 'q;'; \nEND", True),
+    ("SELECT 2", False),
+]
+
+
+def statements(script, chunk_size=1 << 16):
+    return list(iter_sql_statements(io.StringIO(script), chunk_size=chunk_size))
+
+
+def test_splits_quotes_comments_and_delimiter_blocks():
+    assert statements(SCRIPT) == EXPECTED
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 16, 64])
+def test_chunk_boundaries_do_not_change_statements(chunk_size):
+    # Har token (quote, '', --, /*, $$, DELIMITER) kabhi na kabhi chunk ke beech mein katega
+    assert statements(SCRIPT, chunk_size=chunk_size) == EXPECTED
+
+
+def test_delimiter_inside_statement_is_not_a_command():
+    script = "SELECT 'DELIMITER $$';\nSELECT 1,\nDELIMITER;\nSELECT 2;"
+    assert statements(script) == [("SELECT 'DELIMITER $$'", False), ("SELECT 1,\nDELIMITER", False),
+                                  ("SELECT 2", False)]
+
+
+def test_delimiter_inside_comment_is_ignored():
+    script = "/*\nDELIMITER $$\n*/\nSELECT 1;\n-- DELIMITER //\nSELECT 2;"
+    assert statements(script) == [("SELECT 1", False), ("SELECT 2", False)]
+
+
+def test_multi_character_delimiter_split_across_chunks():
+    script = "DELIMITER //\nCREATE PROCEDURE p() BEGIN SELECT 1; END//\nDELIMITER ;\n"
+    for chunk_size in (1, 2, 3, 4):
+        assert statements(script, chunk_size) == [("CREATE PROCEDURE p() BEGIN SELECT 1; END", True)]
+
+
+def test_unterminated_tail_and_empty_statements():
+    assert statements(";;\n  ;SELECT 1") == [("SELECT 1", False)]
+    assert statements("SELECT 'open") == [("SELECT 'open", False)]
+    assert statements("") == []
+
+
+def test_split_sql_commands_drops_compound_flag():
+    assert list(split_sql_commands("SELECT 1; SELECT 2;")) == ["SELECT 1", "SELECT 2"]
@@ -0,0 +1,41 @@
+# tests/test_statements.py
+# Compiled CRUD statement cache: nested-dict hit path, validation aur compile-order eviction (DB ke bina).
+
+from db.statements import StatementCache, statement_key
+
+ANIMAL_COLUMNS = ("animal_id", "shelter_id", "name", "species", "status")
+
+
+def test_compile_then_hit_returns_the_same_object():
+    cache = StatementCache()
+    key = statement_key("delete", "Animal", key_column="animal_id")
+    sql, error = cache.compile(key, ANIMAL_COLUMNS)
+    assert error is None
+    assert sql == "DELETE FROM `Animal` WHERE `animal_id` = %s"
+    # CRUD functions yahi lookup inline karte hain
+    assert cache.entries["delete"]["Animal"]["animal_id"][()] is sql
+    assert cache.get(key) is sql
+    assert cache.compile(key, ANIMAL_COLUMNS)[0] is sql
+    assert cache.stats()["compiles"] == 1
+
+
+def test_unknown_column_is_not_cached():
+    cache = StatementCache()
+    key = statement_key("insert", "Animal", ("name", "colour"))
+    assert cache.compile(key, ANIMAL_COLUMNS) == (None, "Unknown field(s) for Animal: colour")
+    assert cache.get(key) is None
+    assert cache.entries == {}
+
+
+def test_eviction_drops_oldest_compiled_and_empty_levels():
+    cache = StatementCache(max_entries=2)
+    first = statement_key("select_by_id", "Animal", ("name",), "animal_id")
+    second = statement_key("select_by_criteria", "Animal", ("species",))
+    third = statement_key("select_by_criteria", "Animal", ("species", "status"))
+    for key in (first, second, third):
+        cache.compile(key, ANIMAL_COLUMNS)
+
+    assert cache.get(first) is None
+    assert "select_by_id" not in cache.entries
+    assert cache.get(second) and cache.get(third)
+    assert cache.stats() == {"compiles": 3, "evictions": 1, "size": 2, "max_entries": 2}
@@ -0,0 +1,105 @@
+# tests/test_suggest_index.py
+# /api/suggest ka in-process prefix index: lookups, writes aur rebuild (DB ke bina, rows yahin se).
+
+import pytest
+
+from db.suggest_index import PrefixIndex, record_keys
+
+ROWS = {
+    "animal": [
+        {"animal_id": 1, "name": "Charlie", "species": "Dog", "breed": "Beagle", "status": "Available", "shelter_id": 1},
+        {"animal_id": 2, "name": "Chai Latte", "species": "Cat", "breed": None, "status": "Adopted", "shelter_id": 1},
+        {"animal_id": 3, "name": "Luna", "species": "Cat", "breed": "Siamese", "status": "Available", "shelter_id": 2},
+    ],
+    "customer": [
+        {"customer_id": 10, "first_name": "Amit", "last_name": "Sharma", "phone": "98-765-43210", "adopter_id": 4},
+        {"customer_id": 11, "first_name": "Priya", "last_name": "Singh", "phone": "91234 56789", "adopter_id": None},
+    ],
+    "employee": [
+        {"employee_id": 20, "name": "Rahul Verma", "role": "Vet", "shelter_id": 1},
+    ],
+}
+
+
+@pytest.fixture
+def index():
+    index = PrefixIndex()
+    counts, error = index.rebuild(lambda kind: ([dict(row) for row in ROWS[kind]], None))
+    assert error is None and counts == {"animal": 3, "customer": 2, "employee": 1}
+    return index
+
+
+def ids(results, kind, id_column):
+    return [record[id_column] for record in results[kind]]
+
+
+def test_record_keys_index_every_word_suffix_and_phone_digits():
+    assert record_keys("employee", {"name": "  Rahul   Kumar VERMA "}) == {"rahul kumar verma", "kumar verma", "verma"}
+    assert record_keys("customer", {"first_name": "Amit", "last_name": "", "phone": "+91 98-765"}) == {"amit", "9198765"}
+
+
+def test_prefix_search_is_case_insensitive(index):
+    results = index.search("CHA", ("animal",), 10)
+    assert ids(results, "animal", "animal_id") == [2, 1]     # key order: 'chai latte' < 'charlie'
+    assert results["animal"][1]["label"] == "Charlie (Dog, Beagle)"
+
+
+def test_any_word_can_be_typed_first(index):
+    assert ids(index.search("latte", ("animal",), 10), "animal", "animal_id") == [2]
+    assert ids(index.search("sharma", ("customer",), 10), "customer", "customer_id") == [10]
+    assert ids(index.search("verm", ("employee",), 10), "employee", "employee_id") == [20]
+
+
+def test_phone_prefix_ignores_punctuation(index):
+    assert ids(index.search("98 765", ("customer",), 10), "customer", "customer_id") == [10]
+    assert ids(index.search("9123", ("customer",), 10), "customer", "customer_id") == [11]
+
+
+def test_status_filter_and_limit(index):
+    assert ids(index.search("c", ("animal",), 10, status="Available"), "animal", "animal_id") == [1]
+    assert len(index.search("", ("animal",), 2)["animal"]) == 2
+
+
+def test_a_record_is_returned_once_even_if_several_keys_match(index):
+    index.upsert("animal", {"animal_id": 4, "name": "Max Max", "status": "Available"})
+    assert ids(index.search("max", ("animal",), 10), "animal", "animal_id") == [4]
+
+
+def test_writes_update_the_index(index):
+    index.upsert("animal", {"animal_id": 5, "name": "Chanda", "status": "Available"})
+    index.update("animal", 1, {"name": "Buddy"})
+    index.remove("animal", 2)
+    assert ids(index.search("cha", ("animal",), 10), "animal", "animal_id") == [5]
+    assert ids(index.search("bud", ("animal",), 10), "animal", "animal_id") == [1]
+
+
+def test_update_where_mirrors_fk_cascades(index):
+    index.update_where("animal", "shelter_id", 1, None)                     # ON DELETE CASCADE
+    index.update_where("employee", "shelter_id", 1, {"shelter_id": None})   # ON DELETE SET NULL
+    assert ids(index.search("", ("animal",), 10), "animal", "animal_id") == [3]
+    assert index.search("rahul", ("employee",), 10)["employee"][0]["shelter_id"] is None
+
+
+def test_max_records_truncates_per_kind():
+    index = PrefixIndex(max_records=2)
+    index.rebuild(lambda kind: ([dict(row) for row in ROWS[kind]], None))
+    assert index.stats()["truncated"] == ["animal"]
+    index.upsert("customer", {"customer_id": 12, "first_name": "Neha"})
+    assert index.search("neha", ("customer",), 10)["customer"] == []
+    assert index.stats()["truncated"] == ["animal", "customer"]
+
+
+def test_writes_during_rebuild_are_replayed(index):
+    def load(kind):
+        if kind == "animal":
+            # Rebuild ke beech commit hua write naye data par bhi lagna chahiye
+            index.upsert("animal", {"animal_id": 6, "name": "Chiku", "status": "Available"})
+        return ([dict(row) for row in ROWS[kind]], None)
+
+    index.rebuild(load)
+    assert ids(index.search("chi", ("animal",), 10), "animal", "animal_id") == [6]
+
+
+def test_failed_rebuild_keeps_old_data(index):
+    assert index.rebuild(lambda kind: (None, "Failed to connect to database.")) == (None, "Failed to connect to database.")
+    assert ids(index.search("luna", ("animal",), 10), "animal", "animal_id") == [3]